@@ -1,4 +1,28 @@
-import olgaming.games as games
-from .game import Game
-from .gameobj import GameObject
-from .player import Player
+"""Shell gaming library.
+
+Attributes are imported on first access to keep import time low.
+"""
+import importlib
+
+
+_LAZY_ATTRIBUTES = {
+    'games': ("olgaming.games", None),
+    'Game': ("olgaming.game", "Game"),
+    'GameObject': ("olgaming.gameobj", "GameObject"),
+    'Player': ("olgaming.player", "Player"),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            "module %s has no attribute %s" % (__name__, name)
+        )
+    module = importlib.import_module(module_name)
+    return module if attribute is None else getattr(module, attribute)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
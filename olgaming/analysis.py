@@ -0,0 +1,122 @@
+"""Exact outcome of games between players with known action probabilities.
+
+Instead of simulating games, the game tree is explored from the current
+position, each branch being weighted by the probability that the player to
+move picks its action (see Player.action_probs). Outcome distributions are
+memoized on positions (state and player to move), so that each position is
+evaluated once whatever the number of paths leading to it.
+
+Players must be stateless: their probabilities only depend on the state and
+the available actions. Games must be finite and deterministic, small enough
+for their positions to fit in memory (e.g. TicTacToe: 5478 positions).
+
+    >> game = TicTacToe(players=[Bot(0), Candid(1)])
+    >> evaluate(game)['win']
+    [0.52..., 0.44...]
+"""
+from fractions import Fraction
+
+
+def outcome_distribution(game, exact=False):
+    """Return distribution of final winners from current position.
+
+    Game is left in its current position.
+
+    Args:
+        game    (game.Game):    game to evaluate
+        exact   (bool):         compute with fractions (given by players)
+            instead of floats
+
+    Returns:
+        (tuple) (distribution, rewards, positions)
+            distribution    (dict): (sorted winners tuple, probability) dict
+            rewards         (dict): (sorted winners tuple, final consequences)
+            positions       (int):  number of positions evaluated
+    """
+    from .solver import game_position, restore
+
+    memo = {}
+    rewards = {}
+    convert = Fraction if exact else float
+
+    def terminal():
+        winners = tuple(sorted(game.status()['winners']))
+        if winners not in rewards:
+            rewards[winners] = game.dft_consequences()
+        return {winners: convert(1)}
+
+    def explore(position):
+        if position in memo:
+            return memo[position]
+        restore(game, position)
+        player = game.player
+        actions = list(game.av_actions())
+        probs = player.action_probs(game.state_view(), actions)
+
+        distribution = {}
+        for action, prob in zip(actions, probs):
+            if not prob:
+                continue
+            restore(game, position)
+            game.act(action)
+            if game.is_over():
+                children = terminal()
+            else:
+                game.next()
+                children = explore(game_position(game))
+            for winners, child_prob in children.items():
+                distribution[winners] = (
+                    distribution.get(winners, 0)
+                    + convert(prob) * child_prob
+                )
+        memo[position] = distribution
+        return distribution
+
+    start = game_position(game)
+    status = game.status()
+    if game.is_over():
+        distribution = terminal()
+    else:
+        distribution = explore(start)
+        restore(game, start)
+        game.load_status(status)
+    return distribution, rewards, len(memo)
+
+
+def evaluate(game, exact=False):
+    """Return exact outcome probabilities and expected rewards of game.
+
+    Args:
+        @see outcome_distribution
+
+    Returns:
+        (dict) with keys
+            win         (list):     probability that each player wins
+            tie         (float):    probability of a tie (no winner)
+            lose        (list):     probability that each player loses
+            rewards     (list):     expected final reward of each player
+            positions   (int):      number of positions evaluated
+    """
+    distribution, rewards, positions = outcome_distribution(game, exact)
+    players_n = game.players_n
+    zero = Fraction(0) if exact else 0.
+    win = [zero] * players_n
+    lose = [zero] * players_n
+    expected = [zero] * players_n
+    tie = zero
+    for winners, prob in distribution.items():
+        if not winners:
+            tie += prob
+        for index in range(players_n):
+            if index in winners:
+                win[index] += prob
+            elif winners:
+                lose[index] += prob
+            expected[index] += prob * rewards[winners][index]
+    return {
+        'win': win,
+        'tie': tie,
+        'lose': lose,
+        'rewards': expected,
+        'positions': positions,
+    }
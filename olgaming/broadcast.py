@@ -0,0 +1,188 @@
+"""Broadcast of live games to spectators.
+
+A Broadcaster observes a game (see Game.add_observer) and, after each turn,
+encodes a single message shared by all its subscribers:
+    - delta:    changed cells of state, current player, end flag, winners and
+                clocks (of timed games) when they changed
+    - snapshot: full state and status, every snapshot_every turns
+
+Messages are json bytes with a sequence number. A subscriber joining late
+receives the last snapshot and the deltas played since, then follows the
+broadcast. Cost of a turn is one encoding plus one call per subscriber.
+
+    >> broadcaster = Broadcaster(game)
+    >> spectator = Spectator()
+    >> broadcaster.subscribe(spectator.receive)
+    >> game.play()
+    >> spectator.state == game.state()
+    True
+
+Subscribers are callables taking message bytes (e.g. the send method of a
+socket), those raising an exception are unsubscribed.
+"""
+import json
+
+from .transitions import state_delta
+
+
+SNAPSHOT_EVERY = 20     # Number of turns between snapshots
+
+# Keys of status sent in deltas when they changed
+DELTA_KEYS = ["over", "winners", "clocks"]
+
+
+def encode(message):
+    """Return message as compact json bytes."""
+    return json.dumps(message, separators=(",", ":")).encode()
+
+
+def decode(payload):
+    """Return message of json bytes."""
+    return json.loads(payload)
+
+
+class Broadcaster(object):
+    """Observer of a game, broadcasting its turns to subscribers."""
+
+    def __init__(self, game, snapshot_every=SNAPSHOT_EVERY):
+        """Init broadcaster and start observing game.
+
+        Args:
+            game            (game.Game):    game to broadcast (state must be
+                json serializable)
+            snapshot_every  (int):          number of turns between snapshots
+        """
+        self.game = game
+        self.snapshot_every = snapshot_every
+        self.subscribers = []
+        self.seq = 0
+        self.dropped = 0            # Number of subscribers dropped on error
+        self._state = None          # State at last message
+        self._status = None         # Status at last message
+        self._snapshot = None       # Last snapshot message
+        self._since = []            # Delta messages since last snapshot
+        self.snapshot()
+        game.add_observer(self)
+
+    # ----------------------------------------------------------------------- #
+    # Subscribers
+
+    def subscribe(self, send):
+        """Add subscriber, send it last snapshot and deltas played since."""
+        send(self._snapshot)
+        for message in self._since:
+            send(message)
+        self.subscribers.append(send)
+
+    def unsubscribe(self, send):
+        """Remove subscriber."""
+        self.subscribers.remove(send)
+
+    def close(self):
+        """Stop observing game."""
+        self.game.remove_observer(self)
+
+    def publish(self, message):
+        """Send message to all subscribers."""
+        failed = []
+        for send in self.subscribers:
+            try:
+                send(message)
+            except Exception:   # pylint: disable=W0703
+                failed.append(send)
+        for send in failed:
+            self.subscribers.remove(send)
+            self.dropped += 1
+
+    # ----------------------------------------------------------------------- #
+    # Messages
+
+    def snapshot(self):
+        """Encode full state and status, return message."""
+        self._state = self.game.state()
+        self._status = self.game.status()
+        self._snapshot = encode({
+            'type': "snapshot",
+            'seq': self.seq,
+            'state': self._state,
+            'status': self._status,
+        })
+        self._since = []
+        return self._snapshot
+
+    def delta(self, action):
+        """Encode changes since last message, return message."""
+        state = self.game.state()
+        status = self.game.status()
+        message = {
+            'type': "delta",
+            'seq': self.seq,
+            'action': action,
+            'player': status['player'],
+        }
+        kind, changes = state_delta(self._state, state)
+        if kind == "full":
+            message['state'] = changes
+        else:
+            message['cells'] = changes
+        for key in DELTA_KEYS:
+            if key in status and status[key] != self._status.get(key):
+                message[key] = status[key]
+        self._state, self._status = state, status
+        return encode(message)
+
+    def on_turn(self, game, action):
+        """Broadcast turn played (called by game).
+
+        Game observed is the one calling, e.g. the live game built when a
+        parked game is unparked.
+        """
+        self.game = game
+        self.seq += 1
+        if self.seq % self.snapshot_every == 0:
+            message = self.snapshot()
+        else:
+            message = self.delta(action)
+            self._since.append(message)
+        self.publish(message)
+
+
+class Spectator(object):
+    """Rebuild state and status of a game from broadcast messages."""
+
+    def __init__(self):
+        self.state = None
+        self.status = None
+        self.seq = None     # Sequence number of last message applied
+        self.last_action = None
+
+    @property
+    def synced(self):
+        """Return whether spectator follows game."""
+        return self.seq is not None
+
+    def receive(self, payload):
+        """Apply message.
+
+        When a delta is missed, deltas are ignored until next snapshot.
+        """
+        message = decode(payload)
+        if message['type'] == "snapshot":
+            self.state = message['state']
+            self.status = message['status']
+            self.seq = message['seq']
+            return
+        if self.seq is None or message['seq'] != self.seq + 1:
+            self.seq = None
+            return
+        if 'state' in message:
+            self.state = message['state']
+        else:
+            for index, value in message['cells']:
+                self.state[index] = value
+        self.status['player'] = message['player']
+        for key in DELTA_KEYS:
+            if key in message:
+                self.status[key] = message[key]
+        self.last_action = message['action']
+        self.seq = message['seq']
@@ -0,0 +1,154 @@
+"""Time controls of games.
+
+A time control bounds the time each player can take to pick an action:
+    - per move:     max number of seconds for each action
+    - per game:     number of seconds for all actions of a player in a game,
+                    plus an increment after each action
+
+When a player runs out of time, the game either makes the player forfeit or
+plays a random available action instead.
+
+Actions of a player are computed in a thread of its own (see CallWorker),
+reused from one move to the next: an action that ran out of time keeps the
+thread busy until it returns, its result being dropped, and the next action
+waits for it. Human players (reading standard input) cannot be timed.
+"""
+import itertools
+import queue
+import threading
+import time
+
+
+TIMEOUT_POLICIES = ["forfeit", "random"]
+IDLE_TIMEOUT = 5.   # Seconds before an idle worker thread stops
+
+
+class TimeControl(object):
+    """Description of time control."""
+
+    def __init__(self, per_move=None, per_game=None, increment=0,
+                 on_timeout="forfeit"):
+        """Init time control.
+
+        Args:
+            per_move    (float, opt):   seconds per action, dft is no limit
+            per_game    (float, opt):   seconds per game, dft is no limit
+            increment   (float):        seconds added after each action
+            on_timeout  (str):          forfeit or random
+        """
+        if on_timeout not in TIMEOUT_POLICIES:
+            raise ValueError(
+                "Timeout policy must be one of %s, got %s"
+                % (", ".join(TIMEOUT_POLICIES), on_timeout)
+            )
+        self.per_move = per_move
+        self.per_game = per_game
+        self.increment = increment
+        self.on_timeout = on_timeout
+
+    def start_clocks(self, players_n):
+        """Return remaining time of each player before game starts."""
+        return [self.per_game] * players_n
+
+    def budget(self, clock):
+        """Return seconds allowed for next action, None if no limit.
+
+        Args:
+            clock (float or NoneType): remaining time of player
+        """
+        limits = [
+            limit for limit in [self.per_move, clock] if limit is not None
+        ]
+        return max(min(limits), 0) if limits else None
+
+    def charge(self, clock, elapsed):
+        """Return remaining time of player after an action."""
+        if clock is None:
+            return None
+        return clock - elapsed + self.increment
+
+
+def call_with_timeout(timeout, func, *args, **kwargs):
+    """Call function in a thread and wait for its result at most timeout.
+
+    The function keeps running in background if it does not return in time
+    (see CallWorker to reuse thread between calls).
+
+    Args:
+        timeout (float or NoneType): max seconds to wait, None to wait for ever
+
+    Returns:
+        (tuple) (finished, result), result being None if not finished
+    """
+    if timeout is None:
+        return True, func(*args, **kwargs)
+    return CallWorker().call(timeout, func, *args, **kwargs)
+
+
+class CallWorker(object):
+    """Thread running calls one after the other, waited at most a timeout.
+
+    The thread stops after IDLE_TIMEOUT seconds without calls and is started
+    again by next call.
+    """
+
+    def __init__(self):
+        self._calls = queue.Queue()
+        self._results = queue.Queue()
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _run(self):
+        """Run calls until idle."""
+        while True:
+            try:
+                call_id, func, args, kwargs = self._calls.get(
+                    timeout=IDLE_TIMEOUT
+                )
+            except queue.Empty:
+                with self._lock:
+                    if self._calls.empty():
+                        self._thread = None
+                        return
+                continue
+            try:
+                outcome = (True, func(*args, **kwargs))
+            except BaseException as error:  # pylint: disable=W0703
+                outcome = (False, error)
+            self._results.put((call_id, outcome))
+
+    def call(self, timeout, func, *args, **kwargs):
+        """Call function in worker thread and wait its result at most timeout.
+
+        Args:
+            timeout (float or NoneType): max seconds to wait (including time
+                spent finishing previous calls), None to wait for ever
+
+        Returns:
+            (tuple) (finished, result), result being None if not finished
+        """
+        call_id = next(self._ids)
+        with self._lock:
+            self._calls.put((call_id, func, args, kwargs))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = (
+                None if deadline is None
+                else max(deadline - time.monotonic(), 0)
+            )
+            try:
+                result_id, (success, result) = self._results.get(
+                    timeout=remaining
+                )
+            except queue.Empty:
+                return False, None
+            if result_id == call_id:   # Results of calls timed out dropped
+                break
+        if not success:
+            raise result
+        return True, result
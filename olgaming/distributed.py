@@ -0,0 +1,390 @@
+"""Coordinator / worker mode to play many games over several hosts.
+
+The coordinator holds a list of work units, a unit being the key arguments of
+runner.play_match (game, players, rewards, g_params, p_params, seed). Workers
+connect to coordinator, pull units one at a time when they are free, play them
+and send back outcomes. Units of workers that disconnect, or that keep a unit
+longer than the lease, are given to other workers. A unit raising an error is
+not given to other workers: its error is sent back and reported (see
+Coordinator.errors).
+
+Protocol: every message is a json object preceded by its length (4 bytes, big
+endian). Worker sends {"type": "pull"}, {"type": "result", ...} or
+{"type": "failure", ...}, coordinator answers to pulls with
+{"type": "unit", ...}, {"type": "wait", ...} or {"type": "done"}, and to
+malformed messages with {"type": "error", ...}.
+
+The protocol is not authenticated: the coordinator listens on localhost
+unless told otherwise (--host).
+
+Usage:
+    python -m olgaming.distributed coordinator TicTacToe -p Bot,Candid -n 100
+    python -m olgaming.distributed worker --host 10.0.0.1
+"""
+import collections
+import itertools
+import json
+import socket
+import struct
+import threading
+import time
+
+from .runner import play_match
+
+
+HEADER = struct.Struct(">I")
+PORT = 5555
+WAIT_DELAY = 0.1    # Delay given to workers when no unit is available
+
+
+# --------------------------------------------------------------------------- #
+# Protocol
+
+def send_msg(sock, msg):
+    """Send json message through socket."""
+    content = json.dumps(msg, separators=(",", ":")).encode()
+    sock.sendall(HEADER.pack(len(content)) + content)
+
+
+def recv_exactly(sock, size):
+    """Return size bytes read from socket, None if connection is closed."""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_msg(sock):
+    """Return next json message of socket, None if connection is closed."""
+    header = recv_exactly(sock, HEADER.size)
+    if header is None:
+        return None
+    content = recv_exactly(sock, HEADER.unpack(header)[0])
+    if content is None:
+        return None
+    return json.loads(content.decode())
+
+
+# --------------------------------------------------------------------------- #
+# Work units
+
+def make_units(game, lineups, games=1, seed=0, **kwargs):
+    """Return work units for every lineup.
+
+    Args:
+        game    (str):  name of game
+        lineups (list): list of players lists (names of players per seat)
+        games   (int):  number of games per lineup
+        seed    (int):  seed of first game
+        kwargs  (dict): other arguments of runner.play_match
+
+    Returns:
+        (list) of dict
+    """
+    units = []
+    for lineup, index in itertools.product(lineups, range(games)):
+        unit = dict(kwargs)
+        unit.update({
+            'game': game,
+            'players': list(lineup),
+            'seed': seed + index,
+        })
+        units.append(unit)
+    return units
+
+
+class Coordinator(object):
+    """Serve work units to workers and gather their results."""
+
+    def __init__(self, units, host="127.0.0.1", port=PORT, lease=None):
+        """Init coordinator and bind its socket.
+
+        Args:
+            units   (list):         work units (see make_units)
+            host    (str):          address to bind
+            port    (int):          port to bind, 0 for any free port
+            lease   (float, opt):   max number of seconds a worker can keep a
+                unit before it is given to another worker, dft is no limit
+        """
+        self.units = list(units)
+        self.lease = lease
+        self.results = {}                       # (unit id, result) dict
+        self.errors = {}                        # (unit id, error) dict
+        self.pending = collections.deque(range(len(self.units)))
+        self.assigned = {}                      # (unit id, time) dict
+        self.requeued = 0                       # Number of units requeued
+
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        if not self.units:
+            self._done.set()
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((host, port))
+        self.server.listen()
+
+    @property
+    def address(self):
+        """Return (host, port) where coordinator listens."""
+        return self.server.getsockname()
+
+    # ----------------------------------------------------------------------- #
+    # Scheduling
+
+    def _requeue(self, unit_ids):
+        """Put back units not done at the head of pending units."""
+        for unit_id in unit_ids:
+            if unit_id in self.results or unit_id not in self.assigned:
+                continue
+            del self.assigned[unit_id]
+            self.pending.appendleft(unit_id)
+            self.requeued += 1
+
+    def _next_unit(self):
+        """Return id of next unit to play, None if there is none."""
+        if self.lease is not None:
+            now = time.time()
+            self._requeue([
+                unit_id for unit_id, start in self.assigned.items()
+                if now - start > self.lease
+            ])
+        if not self.pending:
+            return None
+        unit_id = self.pending.popleft()
+        self.assigned[unit_id] = time.time()
+        return unit_id
+
+    def _store(self, unit_id, result, error=None):
+        """Store result of unit, or its error (first outcome is kept)."""
+        if unit_id in self.results:
+            return
+        self.results[unit_id] = result
+        if error is not None:
+            self.errors[unit_id] = error
+        self.assigned.pop(unit_id, None)
+        if len(self.results) == len(self.units):
+            self._done.set()
+
+    # ----------------------------------------------------------------------- #
+    # Serving
+
+    def answer(self, msg, owned):
+        """Return answer to message of worker (None if there is none).
+
+        Args:
+            msg     (dict): message of worker
+            owned   (set):  ids of units given to worker and not done yet
+
+        Raises:
+            KeyError, TypeError: malformed message
+        """
+        if msg['type'] in ["result", "failure"]:
+            unit_id = msg['id']
+            if type(unit_id) is not int:
+                raise TypeError("Unit id must be an int, got %r" % unit_id)
+            if not 0 <= unit_id < len(self.units):
+                raise KeyError(unit_id)
+            if msg['type'] == "result":
+                result, error = msg['result'], None
+            else:
+                result, error = None, str(msg['error'])
+            with self._lock:
+                self._store(unit_id, result, error)
+            owned.discard(unit_id)
+            return None
+        if msg['type'] != "pull":
+            raise KeyError(msg['type'])
+
+        with self._lock:
+            unit_id = self._next_unit()
+        if unit_id is not None:
+            owned.add(unit_id)
+            return {
+                'type': "unit",
+                'id': unit_id,
+                'unit': self.units[unit_id],
+            }
+        if self._done.is_set():
+            return {'type': "done"}
+        return {'type': "wait", 'delay': WAIT_DELAY}
+
+    def handle(self, conn):
+        """Answer worker until it disconnects."""
+        owned = set()
+        try:
+            while True:
+                msg = recv_msg(conn)
+                if msg is None:
+                    break
+                try:
+                    answer = self.answer(msg, owned)
+                except (KeyError, TypeError) as error:
+                    answer = {
+                        'type': "error",
+                        'error': "Malformed message (%s: %s)"
+                        % (type(error).__name__, error),
+                    }
+                if answer is not None:
+                    send_msg(conn, answer)
+        except (OSError, ValueError):
+            pass
+        finally:
+            conn.close()
+            with self._lock:
+                self._requeue(owned)
+
+    def accept(self):
+        """Accept workers until server is closed."""
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            thread = threading.Thread(target=self.handle, args=(conn,))
+            thread.daemon = True
+            thread.start()
+
+    def run(self, timeout=None):
+        """Serve units until all results are gathered.
+
+        Args:
+            timeout (float, opt): max number of seconds to wait
+
+        Returns:
+            (list) result of each unit, None for units not done or failed
+                (see errors)
+        """
+        thread = threading.Thread(target=self.accept)
+        thread.daemon = True
+        thread.start()
+        self._done.wait(timeout)
+
+        # Let connected workers know work is over before closing
+        time.sleep(2 * WAIT_DELAY)
+        self.server.close()
+        return [
+            self.results.get(unit_id) for unit_id in range(len(self.units))
+        ]
+
+
+# --------------------------------------------------------------------------- #
+# Workers
+
+def work(host="127.0.0.1", port=PORT, connect_timeout=10):
+    """Play units of coordinator until it has no more.
+
+    Args:
+        host            (str):      address of coordinator
+        port            (int):      port of coordinator
+        connect_timeout (float):    seconds to retry connecting to coordinator
+
+    Returns:
+        (int) number of units played
+    """
+    deadline = time.time() + connect_timeout
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(WAIT_DELAY)
+
+    played = 0
+    with sock:
+        while True:
+            send_msg(sock, {'type': "pull"})
+            msg = recv_msg(sock)
+            if msg is None or msg['type'] == "done":
+                return played
+            if msg['type'] == "error":
+                raise ValueError(msg['error'])
+            if msg['type'] == "wait":
+                time.sleep(msg['delay'])
+                continue
+            try:
+                result = play_match(**msg['unit'])
+                answer = {'type': "result", 'result': result}
+            except Exception as error:  # pylint: disable=W0703
+                answer = {
+                    'type': "failure",
+                    'error': "%s: %s" % (type(error).__name__, error),
+                }
+            answer['id'] = msg['id']
+            send_msg(sock, answer)
+            played += 1
+
+
+# --------------------------------------------------------------------------- #
+# Command line
+
+def main(args=None):
+    """Run coordinator or worker from command line."""
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser("olgaming.distributed")
+    subparsers = parser.add_subparsers(dest="mode")
+
+    coord_parser = subparsers.add_parser("coordinator")
+    coord_parser.add_argument('game', type=str, help="game to play")
+    coord_parser.add_argument(
+        '-p', '--players', type=str, action='append', required=True,
+        help="comma separated players of a lineup (can be repeated)",
+    )
+    coord_parser.add_argument(
+        '-n', '--games', type=int, default=1, help="games per lineup",
+    )
+    coord_parser.add_argument('--seed', type=int, default=0)
+    coord_parser.add_argument('--host', type=str, default="127.0.0.1")
+    coord_parser.add_argument('--port', type=int, default=PORT)
+    coord_parser.add_argument(
+        '--lease', type=float, default=None,
+        help="seconds before a unit is given to another worker",
+    )
+    coord_parser.add_argument(
+        '-o', '--output', type=str, default=None,
+        help="path of json lines file where to write results",
+    )
+
+    worker_parser = subparsers.add_parser("worker")
+    worker_parser.add_argument('--host', type=str, default="127.0.0.1")
+    worker_parser.add_argument('--port', type=int, default=PORT)
+
+    args = parser.parse_args(args)
+    if args.mode == "worker":
+        work(host=args.host, port=args.port)
+        return
+    if args.mode != "coordinator":
+        parser.error("mode must be coordinator or worker")
+
+    units = make_units(
+        args.game,
+        lineups=[lineup.split(",") for lineup in args.players],
+        games=args.games,
+        seed=args.seed,
+    )
+    coordinator = Coordinator(
+        units, host=args.host, port=args.port, lease=args.lease
+    )
+    results = coordinator.run()
+    lines = []
+    for unit_id, (unit, result) in enumerate(zip(units, results)):
+        line = {'unit': unit, 'result': result}
+        if unit_id in coordinator.errors:
+            line['error'] = coordinator.errors[unit_id]
+        lines.append(json.dumps(line))
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write("\n".join(lines) + "\n")
+    else:
+        print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,25 +13,153 @@ Vocabulary:
     - status:   where the game is at
                 e.g. who is playing, is it over
 """
+import copy
+import functools
 import os
+import pickle
+import random
+import time
+from array import array
+from types import MappingProxyType
 
 from olutils.params import read_params
 from olutils.tools import load, save
 
 from .gameobj import GameObject
 from .player import Player
-from .players import Bot, Human
+from .players.bot import Bot
+from .players.human import Human
 
 
+RECORD_FILE = "record.pickle"
 STATE_FILE = "state.pickle"
 STATUS_FILE = "status.json"
 
+DELIVERY_MODES = ["turn", "episode"]    # See Player.delivery
+
 
 class InvalidAction(Exception):
     """Exception raised when an invalid action is tried."""
     pass
 
 
+def freeze(state):
+    """Return read-only version of state.
+
+    Lists become tuples, dicts read-only mappings, sets frozensets, buffers
+    (bytearray, array.array, numpy arrays) read-only views without copy.
+    """
+    if isinstance(state, (list, tuple)):
+        return tuple(freeze(value) for value in state)
+    if isinstance(state, dict):
+        return MappingProxyType({
+            key: freeze(value) for key, value in state.items()
+        })
+    if isinstance(state, set):
+        return frozenset(state)
+    if hasattr(state, '__array_interface__'):
+        view = state.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(state, (bytearray, memoryview, array)):
+        return memoryview(state).toreadonly()
+    return state
+
+
+def thaw(view):
+    """Return mutable copy of state view (see freeze)."""
+    if isinstance(view, (list, tuple)):
+        return [thaw(value) for value in view]
+    if isinstance(view, (dict, MappingProxyType)):
+        return {key: thaw(value) for key, value in view.items()}
+    if isinstance(view, frozenset):
+        return set(view)
+    if hasattr(view, '__array_interface__'):
+        return view.copy()
+    if isinstance(view, memoryview):
+        return bytearray(view)
+    return view
+
+
+def encode_batch(games, out=None, dtype="float32"):
+    """Write observations of games in rows of a batch array (see Game.encode).
+
+    Args:
+        games   (list):             games of same class
+        out     (numpy.ndarray):    (len(games), *obs_shape) array to fill,
+            dft is a new array
+        dtype   (str):              dtype of new array
+
+    Returns:
+        (numpy.ndarray) out
+    """
+    if out is None:
+        import numpy
+        out = numpy.empty(
+            (len(games),) + tuple(type(games[0]).obs_shape), dtype=dtype
+        )
+    for row, game in zip(out, games):
+        game.encode(out=row)
+    return out
+
+
+def invalidating_state(method):
+    """Decorate method changing state so that state view is rebuilt."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._state_view = None
+    return wrapper
+
+
+def caching_transitions(method):
+    """Decorate act so that it uses transition cache of game (if any).
+
+    On a hit, the cached state delta, end flag and winners are applied instead
+    of calling act. On a miss, act is called and its transition stored.
+    Consequences depending on rewards, these are part of the key.
+    """
+    @functools.wraps(method)
+    def wrapper(self, action):
+        cache = self.transition_cache
+        if cache is None:
+            return method(self, action)
+
+        key = (
+            self.state_key(), self._player, action,
+            tuple(sorted(self.rewards.items())),
+        )
+        transition = cache.get(key)
+        if transition is not None:
+            delta, over, winners, consequences = transition
+            self.apply_state_delta(delta)
+            self._over = over
+            self._winners = set(winners)
+            self._winners_list = None
+            return (
+                dict(consequences) if isinstance(consequences, dict)
+                else list(consequences)
+            )
+
+        from .transitions import state_delta
+
+        before = self.state()
+        consequences = method(self, action)
+        cache.put(key, (
+            state_delta(before, self.state()),
+            self._over,
+            tuple(self._winners),
+            (
+                dict(consequences) if isinstance(consequences, dict)
+                else tuple(consequences)
+            ),
+        ))
+        return consequences
+    return wrapper
+
+
 class Game(GameObject):
     """Game Skeleton
 
@@ -41,6 +169,7 @@ class Game(GameObject):
     bot = Bot       # Class used to build bots
     human = Human   # Class used to build humans
     players_n = 2   # Number of players in game
+    obs_shape = None    # Shape of observations (see encode)
 
     dft_rewards = {
         "win": 5,
@@ -49,6 +178,18 @@ class Game(GameObject):
         "neutral": 0,
     }
 
+    def __init_subclass__(cls, **kwargs):
+        """Make act and load_state of subclasses invalidate state view.
+
+        Act of subclasses also uses transition cache (see transition_cache).
+        """
+        super().__init_subclass__(**kwargs)
+        for name in ["act", "load_state"]:
+            if name in cls.__dict__:
+                setattr(cls, name, invalidating_state(cls.__dict__[name]))
+        if "act" in cls.__dict__:
+            cls.act = caching_transitions(cls.__dict__["act"])
+
     @classmethod
     def set(cls, param, value):
         """Set class attribute to value."""
@@ -68,6 +209,7 @@ class Game(GameObject):
     # Initialisation and properties
 
     def __init__(self, rewards=None, bots=None, p_params=None, players=None,
+                 sink=None, time_control=None, transition_cache=None,
                  **params):
         """Init a game.
 
@@ -77,6 +219,13 @@ class Game(GameObject):
             p_params    (dict): key arguments for players
             players     (list): list of players
                 if given, will prevail on both bots and p_params
+            sink        (sinks.Sink): where game and players write,
+                dft is standard output
+            time_control (clock.TimeControl): time allowed to players
+                (human players are not timed), dft is no limit
+            transition_cache (transitions.TransitionCache): cache of act,
+                to share between games, only for deterministic games whose
+                act has no side effect (dft is no cache)
             params      (dict): key arguments for game object
 
             @see .gameobj.GameObject.params
@@ -98,10 +247,40 @@ class Game(GameObject):
             p_params = {} if p_params is None else p_params
             self.init_players(bots, p_params)
 
+        # Output
+        if sink is None:
+            from .sinks import STDOUT
+            sink = STDOUT
+        self.sink = sink
+        for player in self._players:
+            if isinstance(player, Player):
+                player.sink = self.sink
+
         # Status
         self._player = 0        # Current player
         self._over = False
         self._winners = set()   # Index of winner (can be a list of indexes)
+        self._winners_list = None   # Cache of winners property
+        self._started = False   # Whether a turn was played (see metrics)
+
+        # Cache of state view (see state_view)
+        self._state_view = None
+
+        # Record of actions (see start_record)
+        self.record = None
+
+        # Observers of turns (see add_observer)
+        self.observers = []
+
+        # Time control
+        self.time_control = time_control
+        self._clocks = None     # Remaining time of each player
+        self._call_workers = {}     # Thread computing actions of each player
+        if time_control is not None:
+            self._clocks = time_control.start_clocks(self.players_n)
+
+        # Cache of transitions (see caching_transitions)
+        self.transition_cache = transition_cache
 
         self.check_attributes()
 
@@ -126,6 +305,27 @@ class Game(GameObject):
                     % (player.index, index)
                 )
 
+            if player.delivery not in DELIVERY_MODES:
+                raise ValueError(
+                    "Delivery of %s must be one of %s, got %s"
+                    % (player, ", ".join(DELIVERY_MODES), player.delivery)
+                )
+
+        # Players actually using consequences, turn by turn
+        self._takers = {
+            player.index: player
+            for player in self.players
+            if player.delivery == "turn"
+            and type(player).take is not Player.take
+        }
+
+        # Players receiving consequences at end of game (see deliver)
+        self._episode_takers = [
+            player for player in self.players
+            if player.delivery == "episode"
+        ]
+        self._episode = []  # Consequences of each turn
+
     def init_players(self, bots, p_params):
         """Initialize list of players.
 
@@ -168,20 +368,23 @@ class Game(GameObject):
 
     @property
     def winners(self):
-        """Return list of winners."""
-        return [
-            player
-            for player in self.players
-            if player.index in self._winners
-        ]
+        """Return list of winners (do not modify it, it is cached)."""
+        if self._winners_list is None:
+            self._winners_list = [
+                self.players[index] for index in sorted(self._winners)
+            ]
+        return self._winners_list
 
     def status(self):
         """Return status of game."""
-        return {
+        status = {
             'player': self._player,
             'over': self._over,
             'winners': list(self._winners),
         }
+        if self._clocks is not None:
+            status['clocks'] = list(self._clocks)
+        return status
 
     # ----------------------------------------------------------------------- #
     # Utils
@@ -190,10 +393,61 @@ class Game(GameObject):
         """Return available actions."""
         return self.actions
 
+    @classmethod
+    def action_list(cls):
+        """Return list of actions, position of action being its code."""
+        if '_action_list' not in cls.__dict__:
+            if cls.actions is None:
+                raise NotImplementedError(
+                    "%s has no list of actions to encode" % cls.__name__
+                )
+            cls._action_list = list(cls.actions)
+            cls._action_codes = {
+                action: code for code, action in enumerate(cls._action_list)
+            }
+        return cls._action_list
+
+    def canonical_action(self, action):
+        """Return action as listed in actions (action itself by default).
+
+        Override in games whose act accepts several spellings of an action,
+        so that turns record and notify the one of actions.
+        """
+        return action
+
+    def encode_action(self, action):
+        """Return small integer code of action."""
+        self.action_list()
+        try:
+            return self._action_codes[action]
+        except KeyError:
+            raise InvalidAction(action)
+
+    def decode_action(self, code):
+        """Return action given its code.
+
+        Raises:
+            InvalidAction: code is not the code of an action
+        """
+        action_list = self.action_list()
+        if not 0 <= code < len(action_list):
+            raise InvalidAction(code)
+        return action_list[code]
+
     def is_over(self):
         """Return whether game is over."""
         return self._over
 
+    def is_winner(self, player):
+        """Return whether player is a winner.
+
+        Args:
+            player (int or player.Player)
+        """
+        if isinstance(player, int):
+            return player in self._winners
+        return player.index in self._winners
+
     def new_winner(self, player):
         """Add player to list of winners.
 
@@ -204,6 +458,7 @@ class Game(GameObject):
             self._winners.add(player)
         else:
             self._winners.add(player.index)
+        self._winners_list = None
 
     def raise_endflag(self):
         """Raise end flag."""
@@ -215,9 +470,91 @@ class Game(GameObject):
 
     def state(self):
         """Return current game state."""
-        self.log.warning("Game has no state")
         return []
 
+    def state_view(self):
+        """Return read-only view of current state.
+
+        View is cached until act or load_state is called, use invalidate_state
+        when state is modified otherwise.
+        """
+        if self._state_view is None:
+            self._state_view = self.make_state_view()
+        return self._state_view
+
+    def make_state_view(self):
+        """Return read-only view of current state (see freeze).
+
+        Games storing their state in a buffer can return a read-only view of
+        it, which stays up to date without copy.
+        """
+        return freeze(self.state())
+
+    def invalidate_state(self):
+        """Invalidate cache of state view."""
+        self._state_view = None
+
+    def encode(self, out=None, dtype="float32"):
+        """Write observation of current state in a numpy array.
+
+        Observation is made of one-hot planes (one per player) and a plane of
+        the side to move, its shape is the class attribute obs_shape.
+
+        Args:
+            out     (numpy.ndarray):    obs_shape array to fill (e.g. a row of
+                a batch array, see encode_batch), dft is a new array
+            dtype   (str):              dtype of new array
+
+        Returns:
+            (numpy.ndarray) out
+        """
+        if self.obs_shape is None:
+            raise NotImplementedError(
+                "%s has no observation encoding" % self.__class__.__name__
+            )
+        if out is None:
+            import numpy
+            out = numpy.empty(self.obs_shape, dtype=dtype)
+        elif out.shape != tuple(self.obs_shape):
+            raise ValueError(
+                "Observation buffer must have shape %s, got %s"
+                % (tuple(self.obs_shape), out.shape)
+            )
+        out.fill(0)
+        self.write_observation(out)
+        return out
+
+    def write_observation(self, out):
+        """Write observation in zeroed array of shape obs_shape."""
+        raise NotImplementedError
+
+    def state_key(self):
+        """Return hashable key of current state (for transition cache).
+
+        Dft is the state view when hashable, the pickled state otherwise.
+        """
+        view = self.state_view()
+        try:
+            hash(view)
+        except TypeError:
+            return pickle.dumps(self.state(), protocol=4)
+        return view
+
+    def apply_state_delta(self, delta):
+        """Apply state delta (see transitions.state_delta).
+
+        Dft rebuilds the state and loads it, games can override it to update
+        their state in place.
+        """
+        kind, changes = delta
+        if kind == "full":
+            self.load_state(copy.deepcopy(changes))
+            return
+        state = self.state()
+        for index, value in changes:
+            state[index] = value
+        self.load_state(state)
+
     # ----------------------------------------------------------------------- #
     # Gameplay
 
@@ -225,26 +562,69 @@ class Game(GameObject):
         """Operate action (as current player).
 
         Returns:
-            (list): consequences for each player
+            (list or dict): consequences for each player,
+                or (index, consequence) dict for players concerned only
         """
         raise NotImplementedError
 
     def dft_consequences(self):
         """Return default consequences given the Game rewards."""
+        players_n = len(self.players)
         if not self.is_over():
-            return [
-                self.rewards['neutral'] for _ in self.players
-            ]
-        elif not self.winners:
-            return [
-                self.rewards['tie'] for _ in self.players
-            ]
-        return [
-            self.rewards['win']
-            if player in self.winners
-            else self.rewards['lose']
-            for player in self.players
-        ]
+            return [self.rewards['neutral']] * players_n
+        elif not self._winners:
+            return [self.rewards['tie']] * players_n
+        consequences = [self.rewards['lose']] * players_n
+        for index in self._winners:
+            consequences[index] = self.rewards['win']
+        return consequences
+
+    def deliver(self, consequences):
+        """Deliver consequences to players using them.
+
+        Players delivered turn by turn and not overriding Player.take are
+        skipped. For players delivered by episode, consequences are gathered
+        and given at once when game is over (see deliver_episode).
+
+        Args:
+            consequences (list or dict): consequence for each player, or
+                (index, consequence) dict for players concerned only
+        """
+        if self._episode_takers:
+            self._episode.append(consequences)
+            if self._over:
+                self.deliver_episode()
+
+        if isinstance(consequences, dict):
+            for index, consequence in consequences.items():
+                player = self._takers.get(index)
+                if player is not None:
+                    player.sink = self.sink
+                    player.take(consequence)
+            return
+        for index, player in self._takers.items():
+            player.sink = self.sink
+            player.take(consequences[index])
+
+    def deliver_episode(self):
+        """Give gathered consequences to players delivered by episode.
+
+        Each player receives the list of its consequences, one per turn (None
+        for turns with a consequences dict not concerning it).
+        """
+        episode, self._episode = self._episode, []
+        for player in self._episode_takers:
+            index = player.index
+            player.sink = self.sink
+            player.take_episode([
+                consequences.get(index) if isinstance(consequences, dict)
+                else consequences[index]
+                for consequences in episode
+            ])
+
+    def load_episode(self, episode):
+        """Load consequences gathered for players delivered by episode."""
+        self._episode = list(episode)
 
     def next(self):
         """Go to next player."""
@@ -256,38 +636,7 @@ class Game(GameObject):
         """Play game until game is over."""
         self.log.debug("Game started")
         while not self.is_over():
-
-            # Current Player
-            cplayer = self.player
-            self.log.debug("%s turn", cplayer)
-
-            # Display game if player requires it
-            if cplayer.requires_visual:
-                self.display()
-
-            # Catch and apply player action
-            action = self.player.action(
-                gstate=self.state(),
-                actions=self.av_actions(),
-            )
-            try:
-                consequences = self.act(action)
-            except InvalidAction:
-                self.log.warning(
-                    "%s performed invalid action: %s",
-                    cplayer, action
-                )
-                continue
-
-            # Reverberate consequences on players
-            self.log.debug("Apply consequences to players")
-            assert len(consequences) == self.__class__.players_n
-            for player, consequence in zip(self.players, consequences):
-                player.take(consequence)
-
-            # Refresh game and move on
-            self.refresh()
-            self.next()
+            self.turn()
 
         if not self.winners:
             self.log.info("Tie Game")
@@ -296,6 +645,126 @@ class Game(GameObject):
         else:
             self.log.info("Winners are %s" % ", ".join(map(str, self.winners)))
 
+    def turn(self):
+        """Play turn of current player.
+
+        Returns:
+            (bool): whether action of player was valid
+        """
+        from . import metrics
+
+        start = time.perf_counter()
+        labels = (self.__class__.__name__,)
+        if not self._started:
+            self._started = True
+            metrics.GAMES_STARTED.inc(labels=labels)
+
+        # Current Player (bound to sink of game, players may be shared by
+        # games, see parking.PlayerPool)
+        cplayer = self.player
+        cplayer.sink = self.sink
+        self.log.debug("%s turn", cplayer)
+
+        # Display game if player requires it
+        if cplayer.requires_visual:
+            self.display()
+
+        # Catch and apply player action (humans are not timed, their input
+        # can not be interrupted)
+        if self.time_control is None or isinstance(cplayer, Human):
+            action = cplayer.action(
+                gstate=self.state_view(),
+                actions=self.av_actions(),
+            )
+        else:
+            action = self.timed_action(cplayer)
+            if self.is_over():
+                return False
+        try:
+            action = self.canonical_action(action)
+            if self.record is not None:
+                code = self.encode_action(action)
+            consequences = self.act(action)
+        except InvalidAction:
+            self.log.warning(
+                "%s performed invalid action: %s",
+                cplayer, action
+            )
+            metrics.INVALID_ACTIONS.inc(labels=labels)
+            return False
+
+        # Reverberate consequences on players
+        self.log.debug("Apply consequences to players")
+        self.deliver(consequences)
+
+        # Refresh game and move on
+        self.refresh()
+        self.next()
+        if self.record is not None:
+            self.record.add(self, code)
+        self.notify(action)
+        metrics.TURNS.inc(labels=labels)
+        metrics.TURN_SECONDS.observe(time.perf_counter() - start, labels)
+        if self._over:
+            metrics.GAMES_FINISHED.inc(labels=labels)
+        return True
+
+    def add_observer(self, observer):
+        """Add observer, its on_turn(game, action) is called after turns."""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Remove observer."""
+        self.observers.remove(observer)
+
+    def notify(self, action):
+        """Call observers after action (None when game ends otherwise)."""
+        for observer in self.observers:
+            observer.on_turn(self, action)
+
+    def timed_action(self, player):
+        """Return action of player within time control.
+
+        When player runs out of time, either the player forfeits (game is over
+        and others win) or a random action is returned, given time control.
+        """
+        gstate, actions = self.state_view(), self.av_actions()
+        clock = self._clocks[self._player]
+        budget = self.time_control.budget(clock)
+        start = time.monotonic()
+        deadline = None if budget is None else start + budget
+        worker = self._call_workers.get(self._player)
+        if worker is None:
+            from .clock import CallWorker
+            worker = self._call_workers[self._player] = CallWorker()
+        in_time, action = worker.call(
+            budget, player.timed_action,
+            gstate=gstate, actions=actions, deadline=deadline,
+        )
+        self._clocks[self._player] = self.time_control.charge(
+            clock, time.monotonic() - start
+        )
+        if in_time:
+            return action
+
+        self.log.warning("%s ran out of time", player)
+        if self.time_control.on_timeout == "random":
+            return random.choice(list(actions))
+        self.forfeit(player)
+        return None
+
+    def forfeit(self, player):
+        """End game, all players but given one winning."""
+        from . import metrics
+
+        self.raise_endflag()
+        for other in self.players:
+            if other is not player:
+                self.new_winner(other)
+        self.deliver(self.dft_consequences())
+        self.notify(None)
+        metrics.GAMES_FINISHED.inc(labels=(self.__class__.__name__,))
+
     # ----------------------------------------------------------------------- #
     # Display
 
@@ -311,10 +780,14 @@ class Game(GameObject):
         self.log.warning("Ignoring state %s", state)
 
     def load_status(self, status):
-        """Load status dictionary."""
+        """Load status dictionary (of a game already started)."""
+        self._started = True
         self._over = status['over']
         self._player = status['player']
         self._winners = set(status['winners'])
+        self._winners_list = None
+        if 'clocks' in status:
+            self._clocks = list(status['clocks'])
 
     def load(self, load_path):
         """Load game environement from file."""
@@ -326,6 +799,11 @@ class Game(GameObject):
         status = load(file_path)
         self.load_status(status)
 
+        file_path = os.path.join(load_path, RECORD_FILE)
+        if os.path.exists(file_path):
+            from .record import GameRecord
+            self.record = GameRecord.load(file_path)
+
     def save(self, save_path):
         """Save game environement."""
         state = self.state()
@@ -335,3 +813,76 @@ class Game(GameObject):
         status = self.status()
         file_path = os.path.join(save_path, STATUS_FILE)
         save(status, file_path)
+
+        if self.record is not None:
+            file_path = os.path.join(save_path, RECORD_FILE)
+            self.record.save(file_path)
+
+    # ----------------------------------------------------------------------- #
+    # Parking
+
+    def pack_state(self):
+        """Return compact immutable version of state (dft is pickled state).
+
+        Games override it (and unpack_state) with smaller representations,
+        e.g. bytes of small int cells.
+        """
+        return pickle.dumps(self.state(), protocol=4)
+
+    def unpack_state(self, packed):
+        """Load state packed with pack_state."""
+        self.load_state(pickle.loads(packed))
+
+    def park(self):
+        """Return compact version of game and release logger of game.
+
+        Game must not be used after being parked, use parking.Parked.unpark
+        to get a live game back.
+
+        Returns:
+            (parking.Parked)
+        """
+        from .parking import Parked, pack_status, release_logger
+
+        extra = {}
+        if self.rewards != self.dft_rewards:
+            extra['rewards'] = self.rewards
+        for name in ["time_control", "transition_cache", "record"]:
+            if getattr(self, name) is not None:
+                extra[name] = getattr(self, name)
+        if self._clocks is not None:
+            extra['clocks'] = list(self._clocks)
+        if self.observers:
+            extra['observers'] = list(self.observers)
+        if self._episode:
+            extra['episode'] = list(self._episode)
+        parked = Parked(
+            self.__class__,
+            self._id,
+            tuple(self.players),
+            self.pack_state(),
+            pack_status(self.status(), self.players_n),
+            extra or None,
+        )
+        release_logger(self)
+        return parked
+
+    # ----------------------------------------------------------------------- #
+    # Records
+
+    def start_record(self, keyframe=None):
+        """Start recording actions played from current position.
+
+        Args:
+            keyframe (int): number of moves between 2 full state keyframes,
+                dft is record.KEYFRAME
+
+        Returns:
+            (record.GameRecord)
+        """
+        from .record import GameRecord, KEYFRAME
+
+        if keyframe is None:
+            keyframe = KEYFRAME
+        self.record = GameRecord.start(self, keyframe=keyframe)
+        return self.record
@@ -28,6 +28,7 @@ class GameObjMeta(type):
         cls._logname = None
         cls._loglvl = LOGLVL
         cls._logpath = None
+        cls._logbackend = None
 
 
 class GameObject(LogClass, metaclass=GameObjMeta):
@@ -69,6 +70,20 @@ class GameObject(LogClass, metaclass=GameObjMeta):
             for subclass in GameObjMeta.__inheritors__[cls]:
                 subclass.set_dft_loglvl(level=level, propag=True)
 
+    @classmethod
+    def set_dft_logbackend(cls, backend, propag=False):
+        """Set default log backend (use to create instances).
+
+        Args:
+            backend (logbackend.QueueBackend or NoneType):
+                backend receiving records of instances, None to disable
+            propag (bool, optional):    propagate to subclasses
+        """
+        cls._logbackend = backend
+        if propag:
+            for subclass in GameObjMeta.__inheritors__[cls]:
+                subclass.set_dft_logbackend(backend=backend, propag=True)
+
     # ---- Object counter
 
     counter = defaultdict(int)  # (class, number of instances) dict
@@ -111,7 +126,15 @@ class GameObject(LogClass, metaclass=GameObjMeta):
         log_kwargs = read_params(log_kwargs, self.__class__.dft_logparams())
         if log_kwargs['name'] is None:
             log_kwargs['name'] = self.name
+
+        # Avoid opening a file handler per instance when using a backend
+        backend = self.__class__._logbackend
+        logpath = log_kwargs['logpath']
+        if backend is not None:
+            log_kwargs['logpath'] = None
         super().__init__(**log_kwargs)
+        if backend is not None:
+            backend.attach(self.log, logpath)
 
         self.log.debug("Created")
 
@@ -0,0 +1 @@
+from .connectfour import ConnectFour
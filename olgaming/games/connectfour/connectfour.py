@@ -0,0 +1,220 @@
+"""Connect Four game.
+
+Board is stored with 2 bitboards (one per player) of 7 columns x 7 bits:
+    - bit (column * 7 + row) is the cell of given column and row (0 is bottom)
+    - the 7th bit of each column is a sentinel, always empty, so that shifts
+        do not wrap a column into the next one
+
+    .  .  .  .  .  .  .     <- sentinels
+    5 12 19 26 33 40 47
+    4 11 18 25 32 39 46
+    3 10 17 24 31 38 45
+    2  9 16 23 30 37 44
+    1  8 15 22 29 36 43
+    0  7 14 21 28 35 42
+
+Heights store the next free bit of each column: a move is a single bit set,
+available actions are the columns whose height did not reach the sentinel,
+and a player wins when 4 bits are aligned in one of the 4 directions
+(shift by 1: vertical, 7: horizontal, 6 and 8: diagonals).
+"""
+from olgaming.game import Game, InvalidAction
+
+
+COLUMNS = 7
+ROWS = 6
+HEIGHT = ROWS + 1   # Bits per column, including sentinel
+
+BOTTOM = [column * HEIGHT for column in range(COLUMNS)]
+TOP = [column * HEIGHT + ROWS for column in range(COLUMNS)]
+DIRECTIONS = [1, HEIGHT, HEIGHT - 1, HEIGHT + 1]
+COLUMN_MASK = (1 << ROWS) - 1
+PACKED_SIZE = (COLUMNS * HEIGHT + 7) // 8     # Bytes per packed bitboard
+
+SYMBOLS = {
+    None: ".",
+    0: "O",
+    1: "X",
+}
+
+
+def connected_four(bitboard):
+    """Return whether bitboard has 4 aligned bits."""
+    for shift in DIRECTIONS:
+        pairs = bitboard & (bitboard >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+
+class ConnectFour(Game):
+    """Connect Four board game.
+
+    2 players, 7 columns of 6 rows. Players drop their symbol in a column, it
+    falls on the lowest free row. First player with 4 aligned symbols (line,
+    column or diag) wins.
+    """
+    actions = [str(column) for column in range(COLUMNS)]
+    obs_shape = (3, ROWS, COLUMNS)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bitboards = [0, 0]
+        self.heights = list(BOTTOM)
+        self.moves = 0
+
+    # ----------------------------------------------------------------------- #
+    # Utils
+
+    def canonical_action(self, action):
+        """Return action as listed in actions (e.g. "3" for "03" or 3)."""
+        try:
+            return str(int(action))
+        except (TypeError, ValueError):
+            return action
+
+    def av_actions(self):
+        """Return available actions."""
+        return [
+            action
+            for action, height, top in zip(self.actions, self.heights, TOP)
+            if height < top
+        ]
+
+    def cell(self, column, row):
+        """Return index of player owning cell, None if empty."""
+        bit = 1 << (column * HEIGHT + row)
+        for index, bitboard in enumerate(self.bitboards):
+            if bitboard & bit:
+                return index
+        return None
+
+    def state(self):
+        """Return current game state.
+
+        List of cells, row by row from the top one, each cell being the index
+        of player owning it (None when empty).
+        """
+        return [
+            self.cell(column, row)
+            for row in reversed(range(ROWS))
+            for column in range(COLUMNS)
+        ]
+
+    def write_observation(self, out):
+        """Write observation: cells of each player, then side to move.
+
+        Rows of planes are ordered as in state, top row first.
+        """
+        for index, bitboard in enumerate(self.bitboards):
+            while bitboard:
+                bit = (bitboard & -bitboard).bit_length() - 1
+                column, row = divmod(bit, HEIGHT)
+                out[index, ROWS - 1 - row, column] = 1
+                bitboard &= bitboard - 1
+        out[2] = self._player
+
+    # ----------------------------------------------------------------------- #
+    # Gameplay
+
+    def act(self, action):
+        """Operate action (as current player).
+
+        Returns:
+            (list): consequences for each player
+        """
+        # Check action
+        try:
+            column = int(action)
+            assert 0 <= column < COLUMNS
+        except (AssertionError, ValueError):
+            raise InvalidAction(action)
+
+        height = self.heights[column]
+        if height == TOP[column]:
+            raise InvalidAction(action)
+
+        # Update board
+        self.log.debug(
+            "Player %s has played on column %s", self.player, column
+        )
+        self.bitboards[self._player] |= 1 << height
+        self.heights[column] = height + 1
+        self.moves += 1
+
+        # Check if player has won
+        if connected_four(self.bitboards[self._player]):
+            self.raise_endflag()
+            self.new_winner(self._player)
+        elif self.moves == ROWS * COLUMNS:
+            self.raise_endflag()
+
+        return self.dft_consequences()
+
+    # ----------------------------------------------------------------------- #
+    # Display
+
+    def board_str(self):
+        """Return board string."""
+        state = self.state()
+        lines = [
+            " ".join(
+                SYMBOLS[cell]
+                for cell in state[row * COLUMNS:(row + 1) * COLUMNS]
+            )
+            for row in range(ROWS)
+        ]
+        lines.append(" ".join(self.actions))
+        return "\n".join(lines)
+
+    def display(self):
+        """Display game."""
+        self.sink.write(self.board_str())
+        self.sink.write(
+            "Symbols: %s" % " | ".join(
+                "%s=%s" % (player, SYMBOLS[player.index])
+                for player in self.players
+            )
+        )
+        self.sink.write(
+            "# Available option are: %s" % ", ".join(self.av_actions())
+        )
+
+    # ----------------------------------------------------------------------- #
+    # Save / Load
+
+    def load_state(self, state):
+        """Load state."""
+        self.bitboards = [0, 0]
+        self.heights = list(BOTTOM)
+        self.moves = 0
+        for position, index in enumerate(state):
+            if index is None:
+                continue
+            row = ROWS - 1 - position // COLUMNS
+            column = position % COLUMNS
+            bit = column * HEIGHT + row
+            self.bitboards[index] |= 1 << bit
+            self.heights[column] = max(self.heights[column], bit + 1)
+            self.moves += 1
+
+    def pack_state(self):
+        """Return bitboards as bytes (7 bytes per player)."""
+        return b"".join(
+            bitboard.to_bytes(PACKED_SIZE, "little")
+            for bitboard in self.bitboards
+        )
+
+    def unpack_state(self, packed):
+        """Load bitboards packed with pack_state."""
+        self.bitboards = [
+            int.from_bytes(packed[start:start + PACKED_SIZE], "little")
+            for start in range(0, len(packed), PACKED_SIZE)
+        ]
+        occupied = self.bitboards[0] | self.bitboards[1]
+        self.heights = [
+            bottom + bin(occupied >> bottom & COLUMN_MASK).count("1")
+            for bottom in BOTTOM
+        ]
+        self.moves = bin(occupied).count("1")
+        self.invalidate_state()
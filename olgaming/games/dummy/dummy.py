@@ -16,6 +16,7 @@ class Dummy(Game):
         "3": "i am a cow",
         "4": "i am a monkey",
     }
+    obs_shape = (2,)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -32,6 +33,11 @@ class Dummy(Game):
         """Return current game state."""
         return {"msg_sent": self.msg_n}
 
+    def write_observation(self, out):
+        """Write observation: number of messages sent and side to move."""
+        out[0] = self.msg_n
+        out[1] = self._player
+
     # ----------------------------------------------------------------------- #
     # Gameplay
 
@@ -48,7 +54,7 @@ class Dummy(Game):
             raise InvalidAction(action)
 
         # Display Message
-        print("%s : %s" % (self.player, msg))
+        self.sink.write("%s : %s" % (self.player, msg))
 
         # Update environment
         self.msg_n += 1
@@ -70,5 +76,22 @@ class Dummy(Game):
 
     def display(self):
         """Display game."""
-        print("# This is a dummy game.")
-        print("# Available option are: %s" % ", ".join(Dummy.actions.keys()))
+        self.sink.write("# This is a dummy game.")
+        self.sink.write(
+            "# Available option are: %s" % ", ".join(Dummy.actions.keys())
+        )
+
+    # ----------------------------------------------------------------------- #
+    # Save / Load
+
+    def load_state(self, state):
+        """Load state."""
+        self.msg_n = state['msg_sent']
+
+    def pack_state(self):
+        """Return number of messages sent."""
+        return self.msg_n
+
+    def unpack_state(self, packed):
+        """Load number of messages sent."""
+        self.load_state({'msg_sent': packed})
@@ -27,11 +27,17 @@ class TicTacToe(Game):
     2 players, 3x3 board. Player 1 draws O, player 2 draws X, first player with
     3 successive symbols (line, column or diag) wins.
     """
+    actions = [str(position) for position in range(3*3)]
+    obs_shape = (3, 3, 3)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.board = [None for _ in range(3*3)]
-        self.player_symbols = {
+
+    @property
+    def player_symbols(self):
+        """Return (player name, symbol) dict."""
+        return {
             str(self.players[index]): value
             for index, value in SYMBOLS.items()
         }
@@ -39,6 +45,13 @@ class TicTacToe(Game):
     # ----------------------------------------------------------------------- #
     # Utils
 
+    def canonical_action(self, action):
+        """Return action as listed in actions (e.g. "3" for "03" or 3)."""
+        try:
+            return str(int(action))
+        except (TypeError, ValueError):
+            return action
+
     def av_actions(self):
         """Return available actions."""
         return [
@@ -56,6 +69,13 @@ class TicTacToe(Game):
             for player in self.board
         ]
 
+    def write_observation(self, out):
+        """Write observation: cells of each player, then side to move."""
+        for position, player in enumerate(self.board):
+            if player is not None:
+                out[player.index, position // 3, position % 3] = 1
+        out[2] = self._player
+
     # ----------------------------------------------------------------------- #
     # Gameplay
 
@@ -116,8 +136,8 @@ class TicTacToe(Game):
 
     def display(self):
         """Display game."""
-        print(self.board_str())
-        print(
+        self.sink.write(self.board_str())
+        self.sink.write(
             "Symbols: %s" % " | ".join(
                 map(
                     lambda item: "%s=%s" % item,
@@ -125,4 +145,39 @@ class TicTacToe(Game):
                 )
             )
         )
-        print("# Available option are: %s" % ", ".join(self.av_actions()))
+        self.sink.write(
+            "# Available option are: %s" % ", ".join(self.av_actions())
+        )
+
+    # ----------------------------------------------------------------------- #
+    # Save / Load
+
+    def load_state(self, state):
+        """Load state."""
+        self.board = [
+            None if index is None else self.players[index]
+            for index in state
+        ]
+
+    def apply_state_delta(self, delta):
+        """Apply state delta (update changed cells only)."""
+        kind, changes = delta
+        if kind == "full":
+            self.load_state(changes)
+            return
+        for position, index in changes:
+            self.board[position] = (
+                None if index is None else self.players[index]
+            )
+        self.invalidate_state()
+
+    def pack_state(self):
+        """Return board as bytes: 0 for empty cells, index + 1 otherwise."""
+        return bytes(
+            0 if player is None else player.index + 1
+            for player in self.board
+        )
+
+    def unpack_state(self, packed):
+        """Load board packed with pack_state."""
+        self.load_state([None if cell == 0 else cell - 1 for cell in packed])
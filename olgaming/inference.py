@@ -0,0 +1,268 @@
+"""Batched policy evaluation shared by players of several processes.
+
+An InferenceBroker owns two shared memory arrays with one slot per client:
+observations written by clients and outputs written by the evaluator. A
+single evaluator process gathers the slots requested within max_wait seconds
+(up to max_batch of them), evaluates the policy once on the whole batch and
+signals every client of the batch.
+
+    >> broker = InferenceBroker(policy, obs_shape=(9,), n_outputs=9)
+    >> broker.start()
+    >> client = broker.client()     # One per player, before forking
+    >> client.evaluate(observation)
+    >> broker.stop()
+
+The policy must take a (batch, *obs_shape) array and return a
+(batch, n_outputs) array. Clients must be created in the process owning the
+broker and given to other processes when they are started.
+
+When the policy raises an exception, clients of the batch raise an
+EvaluationError. When the evaluator stops, clients waiting for it (or asking
+for an evaluation afterwards) raise an EvaluationError too.
+"""
+import multiprocessing
+import queue
+import sys
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import numpy
+
+
+MAX_BATCH = 32
+MAX_WAIT = 0.002    # Seconds evaluator waits for more requests
+POLL_INTERVAL = 0.1     # Seconds between checks of evaluator by clients
+
+# Errors of slots
+FAILED = 1      # Policy raised an exception
+STOPPED = 2     # Evaluator stopped before evaluating slot
+
+
+class EvaluationError(Exception):
+    """Exception raised when an observation could not be evaluated."""
+    pass
+
+
+def _array(shm, shape, dtype):
+    """Return numpy array using buffer of shared memory."""
+    return numpy.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def evaluate_loop(policy, obs_name, out_name, obs_shape, out_shape, dtype,
+                  requests, ready, max_batch, max_wait, counts, errors, alive):
+    """Evaluate batches of requested slots until None is requested."""
+    try:
+        _evaluate_batches(
+            policy, obs_name, out_name, obs_shape, out_shape, dtype,
+            requests, ready, max_batch, max_wait, counts, errors,
+        )
+    finally:
+        alive.value = 0
+        for slot, event in enumerate(ready):
+            if not event.is_set():  # Client waiting for evaluation
+                errors[slot] = STOPPED
+                event.set()
+
+
+def _evaluate_batches(policy, obs_name, out_name, obs_shape, out_shape, dtype,
+                      requests, ready, max_batch, max_wait, counts, errors):
+    """Evaluate batches (see evaluate_loop)."""
+    obs_shm = shared_memory.SharedMemory(name=obs_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    observations = _array(obs_shm, obs_shape, dtype)
+    outputs = _array(out_shm, out_shape, dtype)
+
+    stop = False
+    while not stop:
+        slot = requests.get()
+        if slot is None:
+            break
+        batch = [slot]
+        deadline = time.monotonic() + max_wait
+        while len(batch) < max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                slot = requests.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if slot is None:
+                stop = True
+                break
+            batch.append(slot)
+
+        error = 0
+        try:
+            outputs[batch] = policy(observations[batch])
+        except Exception:  # pylint: disable=W0703
+            traceback.print_exc(file=sys.stderr)
+            error = FAILED
+        with counts.get_lock():    # Counted before clients are signaled
+            counts[0] += 1
+            counts[1] += len(batch)
+        for slot in batch:
+            errors[slot] = error
+            ready[slot].set()
+
+    del observations, outputs
+    obs_shm.close()
+    out_shm.close()
+
+
+class BrokerClient(object):
+    """Access of one process to its slot of the broker."""
+
+    def __init__(self, broker, slot):
+        self.slot = slot
+        self.obs_name = broker.obs_shm.name
+        self.out_name = broker.out_shm.name
+        self.obs_shape = broker.obs_shape
+        self.out_shape = broker.out_shape
+        self.dtype = broker.dtype
+        self.requests = broker.requests
+        self.ready = broker.ready[slot]
+        self.errors = broker.errors
+        self.alive = broker.alive
+        self._shms = None
+        self._observations = None
+        self._outputs = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update({'_shms': None, '_observations': None, '_outputs': None})
+        return state
+
+    def _attach(self):
+        """Attach shared memory in current process."""
+        self._shms = (
+            shared_memory.SharedMemory(name=self.obs_name),
+            shared_memory.SharedMemory(name=self.out_name),
+        )
+        self._observations = _array(self._shms[0], self.obs_shape, self.dtype)
+        self._outputs = _array(self._shms[1], self.out_shape, self.dtype)
+
+    def evaluate(self, observation, timeout=None):
+        """Return output of policy for observation.
+
+        Args:
+            observation (array-like):   observation to evaluate
+            timeout     (float):        max seconds to wait, dft is no limit
+
+        Raises:
+            EvaluationError: policy failed, evaluator is not running or did
+                not answer in time
+        """
+        if self._shms is None:
+            self._attach()
+        if not self.alive.value:
+            raise EvaluationError("Evaluator is not running")
+        self._observations[self.slot] = observation
+        self.ready.clear()
+        self.requests.put(self.slot)
+        start = time.monotonic()
+        while not self.ready.wait(POLL_INTERVAL):
+            if not self.alive.value:
+                raise EvaluationError("Evaluator stopped")
+            if timeout is not None and time.monotonic() - start > timeout:
+                raise EvaluationError(
+                    "Evaluator did not answer in %ss" % timeout
+                )
+        if self.errors[self.slot] == FAILED:
+            raise EvaluationError("Policy failed on slot %s" % self.slot)
+        if self.errors[self.slot] == STOPPED:
+            raise EvaluationError("Evaluator stopped")
+        return self._outputs[self.slot].copy()
+
+
+class InferenceBroker(object):
+    """Shared memory slots and evaluator process."""
+
+    def __init__(self, policy, obs_shape, n_outputs, slots=64,
+                 max_batch=MAX_BATCH, max_wait=MAX_WAIT, dtype="float32"):
+        """Init broker and allocate its shared memory.
+
+        Args:
+            policy      (callable): vectorized policy (see module doc)
+            obs_shape   (tuple):    shape of one observation
+            n_outputs   (int):      number of outputs for one observation
+            slots       (int):      max number of clients
+            max_batch   (int):      max number of observations per batch
+            max_wait    (float):    seconds to wait for a batch to fill up
+            dtype       (str):      type of observations and outputs
+        """
+        self.policy = policy
+        self.obs_shape = (slots,) + tuple(obs_shape)
+        self.out_shape = (slots, n_outputs)
+        self.dtype = numpy.dtype(dtype)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+
+        self.obs_shm = shared_memory.SharedMemory(
+            create=True,
+            size=int(numpy.prod(self.obs_shape)) * self.dtype.itemsize,
+        )
+        self.out_shm = shared_memory.SharedMemory(
+            create=True,
+            size=int(numpy.prod(self.out_shape)) * self.dtype.itemsize,
+        )
+        self.requests = multiprocessing.Queue()
+        self.ready = [multiprocessing.Event() for _ in range(slots)]
+        self.counts = multiprocessing.Array('L', 2)  # batches, observations
+        self.errors = multiprocessing.Array('b', slots, lock=False)
+        self.alive = multiprocessing.Value('b', 0, lock=False)
+        self._clients = 0
+        self._process = None
+
+    @property
+    def batches(self):
+        """Return number of batches evaluated."""
+        return self.counts[0]
+
+    @property
+    def evaluated(self):
+        """Return number of observations evaluated."""
+        return self.counts[1]
+
+    def client(self):
+        """Return client using next free slot."""
+        if self._clients >= self.out_shape[0]:
+            raise ValueError(
+                "All %s slots of broker are used" % self.out_shape[0]
+            )
+        self._clients += 1
+        return BrokerClient(self, self._clients - 1)
+
+    def start(self):
+        """Start evaluator process."""
+        self._process = multiprocessing.Process(
+            target=evaluate_loop,
+            args=(
+                self.policy, self.obs_shm.name, self.out_shm.name,
+                self.obs_shape, self.out_shape, self.dtype,
+                self.requests, self.ready, self.max_batch, self.max_wait,
+                self.counts, self.errors, self.alive,
+            ),
+        )
+        self.alive.value = 1
+        self._process.daemon = True
+        self._process.start()
+
+    def stop(self):
+        """Stop evaluator and release shared memory."""
+        if self._process is not None:
+            self.requests.put(None)
+            self._process.join()
+            self._process = None
+        self.obs_shm.close()
+        self.obs_shm.unlink()
+        self.out_shm.close()
+        self.out_shm.unlink()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,187 @@
+"""Append-only journal of tournaments, to resume them after a crash.
+
+The journal is a json lines file with two kinds of entries:
+    - result:       outcome of a finished game (see runner.outcome)
+    - checkpoint:   state and status of a game being played
+
+Entries are buffered and written with an fsync by batch (every batch_size
+entries or interval seconds). After a crash, the last entries written after
+the last fsync may be lost (and a last line truncated): the games concerned
+are simply resumed from an older checkpoint or played again.
+
+States must be json serializable to be checkpointed.
+"""
+import json
+import os
+import time
+
+from .runner import build_game, outcome
+
+
+BATCH_SIZE = 100    # Max number of entries before sync
+INTERVAL = 1.       # Max number of seconds before sync
+BLOCK_SIZE = 4096   # Bytes read at once when looking for last line
+
+
+def drop_partial_line(path):
+    """Truncate file after its last complete line (e.g. cut by a crash)."""
+    with open(path, "rb+") as file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        size = 0
+        while position > 0:
+            start = max(0, position - BLOCK_SIZE)
+            file.seek(start)
+            index = file.read(position - start).rfind(b"\n")
+            if index >= 0:
+                size = start + index + 1
+                break
+            position = start
+        if size != end:
+            file.truncate(size)
+
+
+class Journal(object):
+    """Append-only json lines file, synced by batch."""
+
+    def __init__(self, path, batch_size=BATCH_SIZE, interval=INTERVAL):
+        """Open journal (in append mode).
+
+        A last line truncated by a crash is removed, so that entries appended
+        are not glued to it.
+
+        Args:
+            path        (str):      path of journal
+            batch_size  (int):      max number of entries before sync
+            interval    (float):    max number of seconds before sync
+        """
+        journal_dir = os.path.dirname(path)
+        if journal_dir and not os.path.exists(journal_dir):
+            os.makedirs(journal_dir)
+        self.path = path
+        self.batch_size = batch_size
+        self.interval = interval
+        if os.path.exists(path):
+            drop_partial_line(path)
+        self._file = open(path, "a")
+        self._buffer = []
+        self._last_sync = time.monotonic()
+
+    # ----------------------------------------------------------------------- #
+    # Writing
+
+    def append(self, entry):
+        """Add entry to journal, sync journal if necessary."""
+        self._buffer.append(json.dumps(entry, separators=(",", ":")))
+        if (
+            len(self._buffer) >= self.batch_size
+            or time.monotonic() - self._last_sync >= self.interval
+        ):
+            self.sync()
+
+    def result(self, key, result):
+        """Add result of finished game."""
+        self.append({'type': "result", 'key': key, 'result': result})
+
+    def checkpoint(self, key, game, turns):
+        """Add checkpoint of game being played."""
+        self.append({
+            'type': "checkpoint",
+            'key': key,
+            'state': game.state(),
+            'status': game.status(),
+            'turns': turns,
+        })
+
+    def sync(self):
+        """Write buffered entries and sync file on disk."""
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer = []
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close journal."""
+        self.sync()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # ----------------------------------------------------------------------- #
+    # Reading
+
+    @staticmethod
+    def read(path):
+        """Return results and last checkpoints of unfinished games in journal.
+
+        Returns:
+            (tuple) (results, checkpoints) dicts, both indexed by key
+        """
+        results, checkpoints = {}, {}
+        if not os.path.exists(path):
+            return results, checkpoints
+        with open(path) as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue    # Truncated by a crash
+                if entry['type'] == "result":
+                    results[entry['key']] = entry['result']
+                else:
+                    checkpoints[entry['key']] = entry
+        for key in results:
+            checkpoints.pop(key, None)
+        return results, checkpoints
+
+
+def run_tournament(matchups, path, checkpoint_every=10, resume=True,
+                   **journal_kwargs):
+    """Play matchups, journaling results and checkpoints.
+
+    Args:
+        matchups            (list): (key, unit) list, key being a string and
+            unit the key arguments of runner.build_game
+        path                (str):  path of journal
+        checkpoint_every    (int):  number of turns between checkpoints
+        resume              (bool): skip matchups with a result in journal and
+            restore games from their last checkpoint
+        journal_kwargs      (dict): other arguments of Journal
+
+    Returns:
+        (dict) (key, result) dict
+    """
+    results, checkpoints = {}, {}
+    if resume:
+        results, checkpoints = Journal.read(path)
+    elif os.path.exists(path):
+        os.remove(path)
+
+    with Journal(path, **journal_kwargs) as journal:
+        for key, unit in matchups:
+            if key in results:
+                continue
+            game = build_game(**unit)
+            turns = 0
+            if key in checkpoints:
+                checkpoint = checkpoints[key]
+                game.load_state(checkpoint['state'])
+                game.load_status(checkpoint['status'])
+                turns = checkpoint['turns']
+                game.log.info("Resumed after %s turns", turns)
+
+            while not game.is_over():
+                game.turn()
+                turns += 1
+                if not game.is_over() and turns % checkpoint_every == 0:
+                    journal.checkpoint(key, game, turns)
+
+            results[key] = outcome(game, turns)
+            journal.result(key, results[key])
+    return results
@@ -0,0 +1,202 @@
+"""Load generator: many concurrent scripted games and turn latencies.
+
+Each worker process keeps a number of games alive at the same time, as a game
+server would, and plays one turn of each in turn. Players are scripted and, by
+default, require the game to be displayed (through a null sink) as humans do,
+so that the path exercised is the one of human players.
+
+Script of a game is either:
+    - a line of a script file: actions in play order, separated by spaces
+    - a random permutation of game actions, repeated
+
+Usage:
+    python -m olgaming.loadgen TicTacToe -n 10000 -c 1000 -p 4
+"""
+import itertools
+import multiprocessing
+import random
+import time
+from array import array
+
+from . import registry
+from .players.scripted import Scripted
+from .sinks import NullSink
+
+
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+def random_script(game_cls, rand):
+    """Return endless script: random permutations of game actions."""
+    actions = list(game_cls.actions)
+    return itertools.chain.from_iterable(
+        rand.sample(actions, len(actions)) for _ in itertools.count()
+    )
+
+
+def new_game(game_cls, script, visual=True):
+    """Return game with scripted players following script (in play order)."""
+    players_n = game_cls.players_n
+    seats = [
+        itertools.islice(copy, seat, None, players_n)
+        for seat, copy in enumerate(itertools.tee(script, players_n))
+    ]
+    players = [
+        Scripted(index, script=seats[index], requires_visual=visual,
+                 loglvl="ERROR")
+        for index in range(players_n)
+    ]
+    return game_cls(players=players, sink=NullSink(), loglvl="ERROR")
+
+
+def drive(task):
+    """Play games of a worker, return latency of every turn (seconds).
+
+    Args:
+        task (tuple): (game name, number of games, index of first game,
+            concurrency, scripts, visual, seed), scripts being a list of
+            action lists or None
+    """
+    game_name, games, first, concurrency, scripts, visual, seed = task
+    game_cls = registry.get_game(game_name)
+    rand = random.Random(seed)
+
+    def script(index):
+        """Return script of index-th game."""
+        if scripts:
+            return iter(scripts[(first + index) % len(scripts)])
+        return random_script(game_cls, rand)
+
+    latencies = array('d')
+    active = [
+        new_game(game_cls, script(index), visual)
+        for index in range(min(concurrency, games))
+    ]
+    started = len(active)
+    clock = time.perf_counter
+    while active:
+        running = []
+        for game in active:
+            start = clock()
+            try:
+                game.turn()
+            except EOFError:
+                game.raise_endflag()
+            latencies.append(clock() - start)
+            if not game.is_over():
+                running.append(game)
+            elif started < games:
+                running.append(new_game(game_cls, script(started), visual))
+                started += 1
+        active = running
+    return latencies
+
+
+def percentile(values, percent):
+    """Return percentile of sorted values (nearest rank)."""
+    if not values:
+        return None
+    rank = int(round(percent / 100 * (len(values) - 1)))
+    return values[rank]
+
+
+def run_load(game, games=1000, concurrency=100, processes=1,
+             script_path=None, visual=True, seed=0):
+    """Play games and return report on turn latencies.
+
+    Args:
+        game        (str):  name of game
+        games       (int):  total number of games
+        concurrency (int):  number of games alive at the same time per process
+        processes   (int):  number of worker processes
+        script_path (str):  path of script file (see module doc)
+        visual      (bool): whether players require display
+        seed        (int):  seed of random scripts
+
+    Returns:
+        (dict) report with number of games and turns, turns per second and
+            latency percentiles (in milliseconds)
+
+    Raises:
+        ValueError: less than one game or one process
+    """
+    if games < 1 or processes < 1:
+        raise ValueError(
+            "Load needs at least one game and one process, got %s and %s"
+            % (games, processes)
+        )
+    scripts = None
+    if script_path:
+        with open(script_path) as file:
+            scripts = [line.split() for line in file if line.strip()]
+
+    shares = [games // processes] * processes
+    for index in range(games % processes):
+        shares[index] += 1
+    tasks = [
+        (
+            game, share, sum(shares[:index]), concurrency, scripts, visual,
+            seed + index,
+        )
+        for index, share in enumerate(shares) if share
+    ]
+
+    start = time.perf_counter()
+    if processes == 1:
+        latencies = [drive(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            latencies = pool.map(drive, tasks)
+    seconds = time.perf_counter() - start
+
+    latencies = sorted(itertools.chain.from_iterable(latencies))
+    report = {
+        'games': games,
+        'turns': len(latencies),
+        'seconds': seconds,
+        'turns_per_second': len(latencies) / seconds if seconds else None,
+        'latency_ms': {
+            "p%s" % percent: 1000 * percentile(latencies, percent)
+            for percent in PERCENTILES
+        },
+    }
+    report['latency_ms']['max'] = 1000 * latencies[-1]
+    report['latency_ms']['mean'] = 1000 * sum(latencies) / len(latencies)
+    return report
+
+
+def main(args=None):
+    """Run load from command line and print report."""
+    from argparse import ArgumentParser
+
+    parser = ArgumentParser("olgaming.loadgen")
+    parser.add_argument('game', type=str, help="game to play")
+    parser.add_argument('-n', '--games', type=int, default=1000)
+    parser.add_argument('-c', '--concurrency', type=int, default=100)
+    parser.add_argument('-p', '--processes', type=int, default=1)
+    parser.add_argument('-s', '--script_path', type=str, default=None)
+    parser.add_argument(
+        '--no_visual', action='store_true', help="do not display games",
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(args)
+
+    report = run_load(
+        args.game,
+        games=args.games,
+        concurrency=args.concurrency,
+        processes=args.processes,
+        script_path=args.script_path,
+        visual=not args.no_visual,
+        seed=args.seed,
+    )
+    print(
+        "%(games)s games, %(turns)s turns in %(seconds).2fs"
+        " (%(turns_per_second).0f turns/s)" % report
+    )
+    for name, value in report['latency_ms'].items():
+        print("%5s: %.3f ms" % (name, value))
+
+
+if __name__ == "__main__":
+    main()
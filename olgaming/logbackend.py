@@ -0,0 +1,233 @@
+"""Queue-based logging backend for game objects.
+
+By default each game object owns a logger writing synchronously through its
+own handler (and its own file when logpath is given). Once a backend is set
+(see GameObject.set_dft_logbackend), records of all game objects are pushed
+into one in-memory queue and written by a single background thread, which
+groups records by destination and writes them by batch.
+
+Records are formatted by the writer thread: arguments given to log calls must
+not be mutated afterwards. Once the backend is stopped, loggers attached to it
+write synchronously again, through one direct handler per destination.
+"""
+import logging
+import os
+import queue
+import sys
+import threading
+
+
+LOG_FRMT = "%(asctime)s: [%(levelname)s] %(name)s - %(message)s"
+OVERFLOW_POLICIES = ["block", "drop", "drop_oldest"]
+
+_STOP = object()    # Sentinel telling writer to stop
+
+
+class QueueHandler(logging.Handler):
+    """Handler pushing records to a QueueBackend."""
+
+    def __init__(self, backend, logpath=None):
+        super().__init__()
+        self.backend = backend
+        self.logpath = logpath
+
+    def emit(self, record):
+        self.backend.put(self.logpath, record)
+
+
+class QueueBackend(object):
+    """Single writer shared by all loggers attached to it.
+
+    Overflow policies, applied when queue is full:
+        block:          wait for writer to make room
+        drop:           drop new record
+        drop_oldest:    drop oldest record in queue to make room
+    """
+
+    def __init__(self, maxsize=10000, batch_size=500, overflow="drop",
+                 frmt=LOG_FRMT):
+        """Init backend.
+
+        Args:
+            maxsize     (int): max number of records waiting in queue
+            batch_size  (int): max number of records written at once
+            overflow    (str): policy when queue is full
+                (see OVERFLOW_POLICIES)
+            frmt        (str): format of log lines
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "Overflow policy must be one of %s, got %s"
+                % (", ".join(OVERFLOW_POLICIES), overflow)
+            )
+        self.queue = queue.Queue(maxsize)
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.formatter = logging.Formatter(frmt)
+        self.dropped = 0    # Number of records dropped on overflow
+
+        self._files = {}    # (logpath, opened file) dict
+        self._attached = {}     # (logger name, (logger, handler)) dict
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # ----------------------------------------------------------------------- #
+    # Life cycle
+
+    @property
+    def running(self):
+        """Return whether writer is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start writer thread (if not running already)."""
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="olgaming-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def flush(self):
+        """Wait until all queued records are written."""
+        if self.running:
+            self.queue.join()
+
+    def stop(self):
+        """Write remaining records, stop writer and close files."""
+        with self._lock:
+            if self.running:
+                self.queue.put(_STOP)
+                self._thread.join()
+            self._thread = None
+            for file in self._files.values():
+                file.close()
+            self._files = {}
+            self.detach_all()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    # ----------------------------------------------------------------------- #
+    # Loggers
+
+    def attach(self, logger, logpath=None):
+        """Replace handlers of logger with a handler feeding this backend.
+
+        Args:
+            logger  (logging.Logger)
+            logpath (str, opt):     path to logs, dft is stderr
+        """
+        for handler in list(logger.handlers):
+            handler.close()
+            logger.removeHandler(handler)
+        handler = QueueHandler(self, logpath)
+        logger.addHandler(handler)
+        self._attached[logger.name] = (logger, handler)
+        self.start()
+
+    def detach_all(self):
+        """Replace handlers installed by attach with direct handlers.
+
+        Loggers writing to the same destination share one handler.
+        """
+        direct = {}     # (logpath, direct handler) dict
+        for logger, handler in self._attached.values():
+            if handler not in logger.handlers:
+                continue
+            logger.removeHandler(handler)
+            logpath = handler.logpath
+            if logpath not in direct:
+                if logpath is None:
+                    direct[logpath] = logging.StreamHandler(sys.stderr)
+                else:
+                    log_dir = os.path.dirname(logpath)
+                    if log_dir and not os.path.exists(log_dir):
+                        os.makedirs(log_dir)
+                    direct[logpath] = logging.FileHandler(
+                        logpath, encoding="utf-8"
+                    )
+                direct[logpath].setFormatter(self.formatter)
+            logger.addHandler(direct[logpath])
+        self._attached = {}
+
+    def put(self, logpath, record):
+        """Add record to queue, applying overflow policy if necessary."""
+        if self.overflow == "block":
+            self.queue.put((logpath, record))
+            return
+        try:
+            self.queue.put_nowait((logpath, record))
+            return
+        except queue.Full:
+            pass
+
+        if self.overflow == "drop_oldest":
+            try:
+                oldest = self.queue.get_nowait()
+                self.queue.task_done()
+            except queue.Empty:
+                oldest = None
+            if oldest is _STOP:
+                self.queue.put(_STOP)
+                self.dropped += 1
+                return
+            try:
+                self.queue.put_nowait((logpath, record))
+            except queue.Full:
+                pass
+        self.dropped += 1
+
+    # ----------------------------------------------------------------------- #
+    # Writer
+
+    def _run(self):
+        """Write records by batch until stop sentinel is received."""
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                stop = True
+                batch.remove(_STOP)
+            self.write(batch)
+            for _ in range(len(batch) + stop):
+                self.queue.task_done()
+
+    def stream(self, logpath):
+        """Return stream where to write records of logpath."""
+        if logpath is None:
+            return sys.stderr
+        try:
+            return self._files[logpath]
+        except KeyError:
+            log_dir = os.path.dirname(logpath)
+            if log_dir and not os.path.exists(log_dir):
+                os.makedirs(log_dir)
+            file = open(logpath, "a", encoding="utf-8")
+            self._files[logpath] = file
+            return file
+
+    def write(self, batch):
+        """Write batch of (logpath, record), one write per destination."""
+        lines = {}
+        for logpath, record in batch:
+            try:
+                line = self.formatter.format(record)
+            except Exception:  # pylint: disable=W0703
+                line = "Unable to format record %s" % record
+            lines.setdefault(logpath, []).append(line)
+
+        for logpath, dest_lines in lines.items():
+            stream = self.stream(logpath)
+            stream.write("\n".join(dest_lines) + "\n")
+            stream.flush()
@@ -0,0 +1,228 @@
+"""Adaptive matchmaking: rank players with as few games as possible.
+
+Instead of a round robin, games are scheduled where the ranking is the most
+uncertain. For each pair of entrants (a, b), the win rate of a against b (ties
+counting as half a win) has a Beta posterior, starting from Beta(1, 1).
+
+Entrants are ranked by their mean expected score against the others. The
+confidence of the ranking is the lowest probability, over pairs of adjacent
+entrants in the ranking, that the first one wins more than half of its games
+against the second one. Each round plays a batch of games (in parallel) for
+the adjacent pairs of lowest confidence, until the confidence target or the
+max number of games is reached.
+
+    >> matchmaker = Matchmaker("ConnectFour", ["Bot", "Candid"])
+    >> matchmaker.run()
+    ["Candid", "Bot"]
+
+Entrants of same strength never reach the target: max_games bounds the cost.
+"""
+import math
+import multiprocessing
+
+from .runner import play_match
+
+
+CONFIDENCE = 0.95
+MAX_GAMES = 10000
+
+
+def prob_above_half(alpha, beta):
+    """Return probability that a Beta(alpha, beta) variable exceeds 0.5.
+
+    Uses the normal approximation of the Beta distribution.
+    """
+    total = alpha + beta
+    mean = alpha / total
+    std = math.sqrt(alpha * beta / (total * total * (total + 1)))
+    return 0.5 * (1 + math.erf((mean - 0.5) / (std * math.sqrt(2))))
+
+
+def play_pair(task):
+    """Play a game between 2 entrants and return score of first one.
+
+    Args:
+        task (tuple): (a, b, a_first, seed, match), match being the other key
+            arguments of runner.play_match (game, rewards, ...)
+
+    Returns:
+        (tuple) (a, b, score of a: 1 win, 0.5 tie, 0 loss)
+    """
+    a, b, a_first, seed, match = task
+    players = [a, b] if a_first else [b, a]
+    result = play_match(players=players, seed=seed, **match)
+    a_seat = 0 if a_first else 1
+    winners = result['winners']
+    if not winners or len(winners) == 2:
+        score = 0.5
+    else:
+        score = 1. if a_seat in winners else 0.
+    return a, b, score
+
+
+class Matchmaker(object):
+    """Schedule games between entrants until their ranking is confident."""
+
+    def __init__(self, game, entrants, confidence=CONFIDENCE,
+                 max_games=MAX_GAMES, pairs_per_round=None, games_per_pair=8,
+                 seed=0, processes=None, rewards=None, g_params=None,
+                 p_params=None):
+        """Init matchmaker.
+
+        Args:
+            game            (str):      name of 2 players game (see registry)
+            entrants        (list):     names of players to rank
+            confidence      (float):    confidence target of ranking
+            max_games       (int):      max number of games played
+            pairs_per_round (int):      number of pairs played in each round,
+                dft is number of adjacent pairs
+            games_per_pair  (int):      games per pair and round (seats
+                alternate from one game to the next)
+            seed            (int):      seed of first game
+            processes       (int):      size of process pool, dft is number
+                of cpus, 0 to play in current process
+            rewards, g_params, p_params: @see runner.play_match
+        """
+        if len(set(entrants)) != len(entrants) or len(entrants) < 2:
+            raise ValueError(
+                "Entrants must be at least 2 distinct names, got %s"
+                % entrants
+            )
+        self.game = game
+        self.entrants = list(entrants)
+        self.confidence = confidence
+        self.max_games = max_games
+        self.pairs_per_round = (
+            len(entrants) - 1 if pairs_per_round is None else pairs_per_round
+        )
+        self.games_per_pair = games_per_pair
+        self.seed = seed
+        self.processes = processes
+        self.match = {
+            'game': game,
+            'rewards': rewards,
+            'g_params': g_params,
+            'p_params': p_params,
+        }
+        self.games = 0
+        # (a, b) -> score of a against b, for a before b in entrants
+        self._scores = {}
+        self._played = {}
+
+    # ----------------------------------------------------------------------- #
+    # Posteriors
+
+    def _pair(self, a, b):
+        """Return (ordered pair, whether a and b are swapped)."""
+        if self.entrants.index(a) < self.entrants.index(b):
+            return (a, b), False
+        return (b, a), True
+
+    def record(self, a, b, score):
+        """Record game result: score of a against b (1, 0.5 or 0)."""
+        pair, swapped = self._pair(a, b)
+        self._scores[pair] = self._scores.get(pair, 0) + (
+            1 - score if swapped else score
+        )
+        self._played[pair] = self._played.get(pair, 0) + 1
+        self.games += 1
+
+    def played(self, a, b):
+        """Return number of games played between a and b."""
+        return self._played.get(self._pair(a, b)[0], 0)
+
+    def posterior(self, a, b):
+        """Return (alpha, beta) of posterior of win rate of a against b."""
+        pair, swapped = self._pair(a, b)
+        score = self._scores.get(pair, 0)
+        lost = self._played.get(pair, 0) - score
+        if swapped:
+            score, lost = lost, score
+        return 1 + score, 1 + lost
+
+    def expected_score(self, a, b):
+        """Return posterior mean of win rate of a against b."""
+        alpha, beta = self.posterior(a, b)
+        return alpha / (alpha + beta)
+
+    def win_probability(self, a, b):
+        """Return probability that a wins more than half against b."""
+        return prob_above_half(*self.posterior(a, b))
+
+    # ----------------------------------------------------------------------- #
+    # Ranking
+
+    def ranking(self):
+        """Return entrants sorted from strongest to weakest."""
+        return sorted(
+            self.entrants,
+            key=lambda a: -sum(
+                self.expected_score(a, b) for b in self.entrants if b != a
+            ),
+        )
+
+    def confidences(self):
+        """Return (a, b, confidence) for adjacent entrants of ranking."""
+        ranking = self.ranking()
+        return [
+            (a, b, self.win_probability(a, b))
+            for a, b in zip(ranking, ranking[1:])
+        ]
+
+    def ranking_confidence(self):
+        """Return confidence of ranking (lowest confidence of adjacents)."""
+        return min(
+            confidence for _, _, confidence in self.confidences()
+        )
+
+    def is_done(self):
+        """Return whether confidence target or max games is reached."""
+        return (
+            self.games >= self.max_games
+            or self.ranking_confidence() >= self.confidence
+        )
+
+    # ----------------------------------------------------------------------- #
+    # Scheduling
+
+    def next_pairs(self):
+        """Return adjacent pairs of lowest confidence for next round."""
+        pairs = sorted(
+            self.confidences(), key=lambda pair: pair[2]
+        )[:self.pairs_per_round]
+        return [(a, b) for a, b, confidence in pairs
+                if confidence < self.confidence]
+
+    def next_tasks(self):
+        """Return tasks of next round (@see play_pair)."""
+        tasks = []
+        budget = self.max_games - self.games
+        for a, b in self.next_pairs():
+            played = self.played(a, b)
+            for index in range(self.games_per_pair):
+                if len(tasks) >= budget:
+                    return tasks
+                tasks.append((
+                    a, b, (played + index) % 2 == 0,
+                    self.seed + self.games + len(tasks),
+                    self.match,
+                ))
+        return tasks
+
+    def run(self):
+        """Play rounds until ranking is done, return ranking."""
+        if self.processes == 0:
+            self._run(map)
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                self._run(pool.imap_unordered)
+        return self.ranking()
+
+    def _run(self, map_func):
+        """Play rounds using map_func to play tasks of a round."""
+        while not self.is_done():
+            tasks = self.next_tasks()
+            if not tasks:
+                break
+            for a, b, score in map_func(play_pair, tasks):
+                self.record(a, b, score)
@@ -0,0 +1,364 @@
+"""Metrics of games: counters, gauges and histograms.
+
+Games update the metrics of the default registry (see Game.turn and
+Game.forfeit):
+    - olgaming_games_started_total      games started (first turn), by game
+    - olgaming_games_finished_total     games finished (by a turn or a
+                                        forfeit), by game
+    - olgaming_turns_total              valid turns played, by game
+    - olgaming_invalid_actions_total    invalid actions, by game
+    - olgaming_turn_seconds             latency of turns, by game
+    - olgaming_objects                  GameObject.counter, by class
+
+Recording takes no lock: each thread updates its own shard of a metric, shards
+being summed when metrics are collected. The lock of a metric is only taken to
+add a shard or a key to a shard, and to copy shards. Metrics are exported in
+Prometheus text format, through a local http server or a file dump.
+
+    >> server = REGISTRY.serve(port=9100)    # curl localhost:9100/metrics
+    >> REGISTRY.dump("metrics.prom")
+"""
+import bisect
+import os
+import threading
+from collections import defaultdict
+
+from .gameobj import GameObject
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PORT = 9100
+
+# Upper bounds of turn latency buckets (in seconds)
+TURN_BUCKETS = (
+    .00001, .00005, .0001, .0005, .001, .005, .01, .05, .1, .5, 1., 5.
+)
+
+
+def escape(value):
+    """Return label value escaped for exposition."""
+    return (
+        str(value)
+        .replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+    )
+
+
+def sample(name, labelnames, labels, value):
+    """Return sample line in Prometheus text format."""
+    if labelnames:
+        name = "%s{%s}" % (name, ",".join(
+            "%s=\"%s\"" % (labelname, escape(label))
+            for labelname, label in zip(labelnames, labels)
+        ))
+    return "%s %s" % (name, value)
+
+
+# --------------------------------------------------------------------------- #
+# Metrics
+
+class Metric(object):
+    """Metric recorded in per thread shards."""
+
+    kind = None
+
+    def __init__(self, name, doc, labelnames=(), registry=None):
+        """Init metric and register it.
+
+        Args:
+            name        (str):      name of metric
+            doc         (str):      description of metric
+            labelnames  (tuple):    names of labels, values of labels are
+                given as tuples when recording
+            registry    (Registry): registry of metric, default one if None
+        """
+        self.name = name
+        self.doc = doc
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()   # Taken to add shards or keys
+        (REGISTRY if registry is None else registry).register(self)
+
+    def new_shard(self):
+        """Return empty shard."""
+        raise NotImplementedError
+
+    def shard(self):
+        """Return shard of current thread."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self.new_shard()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def add_key(self, shard, key, value):
+        """Add key to shard of current thread (while shards are not copied)."""
+        with self._lock:
+            shard[key] = value
+
+    def shards(self):
+        """Return copy of shards."""
+        with self._lock:
+            return [dict(shard) for shard in self._shards]
+
+    def samples(self):
+        """Return sample lines."""
+        raise NotImplementedError
+
+    def exposition(self):
+        """Return metric in Prometheus text format."""
+        lines = [
+            "# HELP %s %s" % (self.name, self.doc),
+            "# TYPE %s %s" % (self.name, self.kind),
+        ]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def new_shard(self):
+        return {}
+
+    def inc(self, amount=1, labels=()):
+        """Increase counter of labels by amount."""
+        shard = self.shard()
+        if labels in shard:
+            shard[labels] += amount
+        else:
+            self.add_key(shard, labels, amount)
+
+    def values(self):
+        """Return (labels, value) dict."""
+        values = defaultdict(int)
+        for shard in self.shards():
+            for labels, value in shard.items():
+                values[labels] += value
+        return dict(values)
+
+    def value(self, labels=()):
+        """Return value of labels."""
+        return self.values().get(labels, 0)
+
+    def samples(self):
+        return [
+            sample(self.name, self.labelnames, labels, value)
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Gauge(Metric):
+    """Value that can go up and down, set or read from a function."""
+
+    kind = "gauge"
+
+    def __init__(self, name, doc, labelnames=(), registry=None,
+                 function=None):
+        """Init gauge.
+
+        Args:
+            @see Metric
+            function (callable): return (labels, value) dict when collected,
+                replacing values set
+        """
+        self.function = function
+        self._values = {}
+        super().__init__(name, doc, labelnames, registry)
+
+    def new_shard(self):
+        return {}
+
+    def set(self, value, labels=()):
+        """Set value of labels."""
+        self._values[labels] = value
+
+    def values(self):
+        """Return (labels, value) dict."""
+        if self.function is not None:
+            return dict(self.function())
+        return dict(self._values)
+
+    def value(self, labels=()):
+        """Return value of labels."""
+        return self.values().get(labels, 0)
+
+    def samples(self):
+        return [
+            sample(self.name, self.labelnames, labels, value)
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Histogram(Metric):
+    """Distribution of observations in buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name, doc, labelnames=(), registry=None,
+                 buckets=TURN_BUCKETS):
+        """Init histogram.
+
+        Args:
+            @see Metric
+            buckets (tuple): sorted upper bounds of buckets
+        """
+        self.buckets = tuple(buckets)
+        super().__init__(name, doc, labelnames, registry)
+
+    def new_shard(self):
+        return {}
+
+    def observe(self, value, labels=()):
+        """Add observation of labels."""
+        shard = self.shard()
+        try:
+            counts = shard[labels]
+        except KeyError:
+            counts = [0] * (len(self.buckets) + 1) + [0.]
+            self.add_key(shard, labels, counts)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def values(self):
+        """Return (labels, (counts per bucket, sum)) dict."""
+        values = {}
+        for shard in self.shards():
+            for labels, counts in shard.items():
+                counts = list(counts)
+                if labels in values:
+                    counts = [
+                        total + count
+                        for total, count in zip(values[labels], counts)
+                    ]
+                values[labels] = counts
+        return {
+            labels: (counts[:-1], counts[-1])
+            for labels, counts in values.items()
+        }
+
+    def count(self, labels=()):
+        """Return number of observations of labels."""
+        counts, _ = self.values().get(labels, ([], 0.))
+        return sum(counts)
+
+    def samples(self):
+        lines = []
+        labelnames = self.labelnames + ("le",)
+        bounds = ["%r" % bound for bound in self.buckets] + ["+Inf"]
+        for labels, (counts, total) in sorted(self.values().items()):
+            cumulated = 0
+            for bound, count in zip(bounds, counts):
+                cumulated += count
+                lines.append(sample(
+                    self.name + "_bucket", labelnames, labels + (bound,),
+                    cumulated
+                ))
+            lines.append(sample(
+                self.name + "_sum", self.labelnames, labels, repr(total)
+            ))
+            lines.append(sample(
+                self.name + "_count", self.labelnames, labels, cumulated
+            ))
+        return lines
+
+
+# --------------------------------------------------------------------------- #
+# Registry
+
+class Registry(object):
+    """Collection of metrics."""
+
+    def __init__(self):
+        self.metrics = {}
+
+    def register(self, metric):
+        """Add metric.
+
+        Raises:
+            ValueError: a metric with same name is already registered
+        """
+        if metric.name in self.metrics:
+            raise ValueError("Metric %s already registered" % metric.name)
+        self.metrics[metric.name] = metric
+
+    def exposition(self):
+        """Return all metrics in Prometheus text format."""
+        return "".join(
+            metric.exposition() + "\n" for metric in self.metrics.values()
+        )
+
+    def dump(self, path):
+        """Write metrics to file (replaced atomically)."""
+        tmp_path = "%s.tmp" % path
+        with open(tmp_path, "w") as file:
+            file.write(self.exposition())
+        os.replace(tmp_path, path)
+
+    def serve(self, port=PORT, address="127.0.0.1"):
+        """Serve metrics over http in a daemon thread, return server.
+
+        Stop serving with server.shutdown().
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Handler answering metrics to any GET request."""
+
+            def do_GET(self):  # pylint: disable=C0103
+                body = registry.exposition().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # pylint: disable=W0221
+                pass
+
+        server = ThreadingHTTPServer((address, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        return server
+
+
+REGISTRY = Registry()
+
+
+# --------------------------------------------------------------------------- #
+# Metrics of games
+
+def object_counts():
+    """Return (class name tuple, number of instances) dict."""
+    return {
+        (gameobj_cls.__name__,): count
+        for gameobj_cls, count in list(GameObject.counter.items())
+    }
+
+
+GAMES_STARTED = Counter(
+    "olgaming_games_started_total", "Games started.", ("game",)
+)
+GAMES_FINISHED = Counter(
+    "olgaming_games_finished_total", "Games finished.", ("game",)
+)
+TURNS = Counter(
+    "olgaming_turns_total", "Valid turns played.", ("game",)
+)
+INVALID_ACTIONS = Counter(
+    "olgaming_invalid_actions_total", "Invalid actions performed.", ("game",)
+)
+TURN_SECONDS = Histogram(
+    "olgaming_turn_seconds", "Latency of turns in seconds.", ("game",)
+)
+OBJECTS = Gauge(
+    "olgaming_objects", "Game objects created, by class.", ("cls",),
+    function=object_counts,
+)
@@ -0,0 +1,244 @@
+"""Compact representation of games waiting for a move (parked games).
+
+A live game carries its own logger, rewards dict, caches and players, each of
+them with its own logger. A parked game only keeps:
+    - its class and identity
+    - its players, shared between games (see PlayerPool)
+    - its state packed by the game (see Game.pack_state), e.g. bytes of cells
+    - its status packed in a small int (see pack_status)
+    - anything else that differs from defaults (rewards, clocks, ...)
+
+Parking a game releases its logger, unparking it rebuilds a game with same
+identity (hence same logger name).
+
+    >> pool = PlayerPool()
+    >> game = TicTacToe(players=pool.seats(TicTacToe, Human))
+    >> parked = game.park()
+    >> game = parked.unpark()
+
+Usage (memory benchmark):
+    python -m olgaming.parking TicTacToe -n 10000
+"""
+import gc
+import logging
+import random
+import tracemalloc
+
+
+def pack_status(status, players_n):
+    """Return status (without clocks) packed in a single int.
+
+    Small ints being shared objects, packed status of usual games takes no
+    memory of its own.
+    """
+    winners = 0
+    for index in status['winners']:
+        winners |= 1 << index
+    return status['player'] + players_n * (
+        int(status['over']) + 2 * winners
+    )
+
+
+def unpack_status(code, players_n):
+    """Return status dictionary packed in code (see pack_status)."""
+    code, player = divmod(code, players_n)
+    winners, over = divmod(code, 2)
+    return {
+        'player': player,
+        'over': bool(over),
+        'winners': [
+            index for index in range(players_n) if winners & (1 << index)
+        ],
+    }
+
+
+def release_logger(gameobj):
+    """Close handlers of game object logger and forget logger."""
+    log = gameobj.log
+    for handler in list(log.handlers):
+        handler.close()
+        log.removeHandler(handler)
+    manager = logging.Logger.manager
+    if manager.loggerDict.get(log.name) is log:
+        del manager.loggerDict[log.name]
+
+
+class Parked(object):
+    """Parked game."""
+
+    __slots__ = ("game_cls", "identity", "players", "state", "status",
+                 "extra")
+
+    def __init__(self, game_cls, identity, players, state, status,
+                 extra=None):
+        """Init parked game.
+
+        Args:
+            game_cls    (type):     class of game
+            identity    (object):   identity of game
+            players     (tuple):    players of game
+            state       (object):   packed state (see Game.pack_state)
+            status      (int):      packed status (see pack_status)
+            extra       (dict):     non default attributes of game (rewards,
+                time_control, clocks, record, observers, episode), None if
+                there is none
+        """
+        self.game_cls = game_cls
+        self.identity = identity
+        self.players = players
+        self.state = state
+        self.status = status
+        self.extra = extra
+
+    def unpark(self, **params):
+        """Return live game.
+
+        Args:
+            params (dict): key arguments of game (e.g. sink, loglvl)
+        """
+        extra = {} if self.extra is None else dict(self.extra)
+        clocks = extra.pop('clocks', None)
+        record = extra.pop('record', None)
+        observers = extra.pop('observers', [])
+        episode = extra.pop('episode', [])
+        params.update(extra)
+        game = self.game_cls(
+            players=list(self.players), identity=self.identity, **params
+        )
+        game.unpack_state(self.state)
+        status = unpack_status(self.status, self.game_cls.players_n)
+        if clocks is not None:
+            status['clocks'] = clocks
+        game.load_status(status)
+        game.record = record
+        game.observers = observers
+        game.load_episode(episode)
+        return game
+
+
+class PlayerPool(object):
+    """Players shared by games, one per (class, index, identity).
+
+    Games bind players to their sink when asking them to act or giving them
+    consequences, so that shared players write in the sink of the game they
+    are playing.
+    """
+
+    def __init__(self, **p_params):
+        """Init pool.
+
+        Args:
+            p_params (dict): key arguments of players created
+        """
+        self.p_params = p_params
+        self._players = {}
+
+    def __len__(self):
+        return len(self._players)
+
+    def get(self, player_cls, index, identity=None):
+        """Return shared player."""
+        key = (player_cls, index, identity)
+        player = self._players.get(key)
+        if player is None:
+            params = dict(self.p_params)
+            if identity is not None:
+                params['identity'] = identity
+            player = player_cls(index, **params)
+            self._players[key] = player
+        return player
+
+    def seats(self, game_cls, player_cls):
+        """Return shared players of class player_cls for each seat of game."""
+        return [
+            self.get(player_cls, index) for index in range(game_cls.players_n)
+        ]
+
+
+# --------------------------------------------------------------------------- #
+# Memory benchmark
+
+def _traced(build, n):
+    """Return (objects built, bytes allocated per object)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        objects = [build() for _ in range(n)]
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    return objects, size / n
+
+
+def benchmark(game_cls, n=10000, moves=2, seed=0):
+    """Return memory per game, live and parked.
+
+    Games are started with human players and played for a few random moves.
+    Live games each have their own players, parked ones share players.
+
+    Returns:
+        (dict) with bytes per live game, bytes per parked game and ratio
+    """
+    from .players.human import Human
+    from .sinks import NullSink
+
+    rand = random.Random(seed)
+
+    def start(players):
+        game = game_cls(players=players, sink=NullSink(), loglvl="ERROR")
+        for _ in range(moves):
+            if game.is_over():
+                break
+            game.act(rand.choice(game.av_actions()))
+            game.next()
+        return game
+
+    def live():
+        return start([
+            Human(index, loglvl="ERROR") for index in range(game_cls.players_n)
+        ])
+
+    pool = PlayerPool(loglvl="ERROR")
+    players = pool.seats(game_cls, Human)
+
+    def parked():
+        return start(players).park()
+
+    games, live_size = _traced(live, n)
+    for game in games:
+        for obj in [game] + game.players:
+            release_logger(obj)
+    del games
+    parked_games, parked_size = _traced(parked, n)
+    return {
+        'games': n,
+        'live_bytes': live_size,
+        'parked_bytes': parked_size,
+        'ratio': live_size / parked_size,
+    }
+
+
+def main(args=None):
+    """Run memory benchmark from command line and print report."""
+    from argparse import ArgumentParser
+    from . import registry
+
+    parser = ArgumentParser("olgaming.parking")
+    parser.add_argument('game', type=str, help="game to park")
+    parser.add_argument('-n', '--games', type=int, default=10000)
+    parser.add_argument('-m', '--moves', type=int, default=2)
+    args = parser.parse_args(args)
+
+    report = benchmark(
+        registry.get_game(args.game), n=args.games, moves=args.moves
+    )
+    print(
+        "%(games)s games: %(live_bytes).0f bytes per live game,"
+        " %(parked_bytes).0f bytes per parked game (%(ratio).1fx)" % report
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,18 @@
 """Skeleton for player object"""
 from olgaming.gameobj import GameObject
+from olgaming.sinks import STDOUT
 
 
 class Player(GameObject):
     """Player skeleton."""
 
+    delivery = "turn"   # Receive consequences each "turn" or by "episode"
+
     def __init__(self, index, **kwargs):
         super().__init__(**kwargs)
         self.index = index
         self.requires_visual = False
+        self.sink = STDOUT  # Where to write, set by game
 
     def action(self, gstate, actions=None):
         """Return action of players.
@@ -22,6 +26,44 @@ class Player(GameObject):
         """
         raise NotImplementedError
 
+    def action_probs(self, gstate, actions):
+        """Return probability of playing each action.
+
+        Only players whose choice depends on the state and actions alone can
+        expose it (see olgaming.analysis).
+
+        Args:
+            gstate  (object):   current game state
+            actions (list):     possible actions
+
+        Returns:
+            (list) probability of each action of actions
+        """
+        raise NotImplementedError
+
+    def timed_action(self, gstate, actions=None, deadline=None):
+        """Return action of player, before deadline if possible.
+
+        Args:
+            gstate      (object):       current game state
+            actions     (list, opt):    possible actions
+            deadline    (float, opt):   time.monotonic() value by which action
+                is expected, None if no limit
+
+        Returns:
+            (object) action
+        """
+        return self.action(gstate, actions)
+
     def take(self, consequence):
         """Nothing"""
         self.log.debug("Skip consequence %s", consequence)
+
+    def take_episode(self, consequences):
+        """Take consequences of a whole game (when delivery is "episode").
+
+        Args:
+            consequences (list): consequence of each turn
+        """
+        for consequence in consequences:
+            self.take(consequence)
@@ -1,4 +1,28 @@
-"""Collection of players."""
-from .bot import Bot
-from .candid import Candid
-from .human import Human
+"""Collection of players.
+
+Players are imported on first access, see olgaming.registry.
+"""
+import importlib
+
+from olgaming import registry
+
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(
+            "module %s has no attribute %s" % (__name__, name)
+        )
+    try:
+        return registry.get_player(name)
+    except KeyError:
+        pass
+    try:
+        return importlib.import_module("%s.%s" % (__name__, name))
+    except ImportError:
+        raise AttributeError(
+            "module %s has no attribute %s" % (__name__, name)
+        )
+
+
+def __dir__():
+    return sorted(set(globals()) | set(registry.player_names()))
@@ -0,0 +1,40 @@
+"""Anytime player: search actions and play best one found in time."""
+import time
+
+from olgaming.player import Player
+
+
+class Anytime(Player):
+    """Player improving its choice step by step.
+
+    Subclasses implement search, yielding better and better actions.
+    """
+
+    margin = 0.005  # Seconds kept before deadline to return action
+
+    def search(self, gstate, actions):
+        """Yield best action found so far, for ever or until search is over.
+
+        Args:
+            gstate  (object):       current game state
+            actions (list):         possible actions
+        """
+        raise NotImplementedError
+
+    def action(self, gstate, actions=None):
+        """Return action found by complete search."""
+        action = None
+        for action in self.search(gstate, actions):
+            pass
+        return action
+
+    def timed_action(self, gstate, actions=None, deadline=None):
+        """Return best action found before deadline."""
+        if deadline is None:
+            return self.action(gstate, actions)
+        action = None
+        for action in self.search(gstate, actions):
+            if time.monotonic() >= deadline - self.margin:
+                break
+        self.log.debug("Pick %s before deadline", action)
+        return action
@@ -1,5 +1,6 @@
 """Dummy bot player."""
 import random
+from fractions import Fraction
 
 from olgaming.player import Player
 
@@ -12,3 +13,7 @@ class Bot(Player):
         action = random.choice(actions)
         self.log.debug("Pick %s for state %s", action, gstate)
         return action
+
+    def action_probs(self, gstate, actions):
+        """Return uniform probabilities (exact fractions)."""
+        return [Fraction(1, len(actions))] * len(actions)
@@ -17,6 +17,10 @@ class Candid(Player):
         self.log.debug("Picking among actions %s" % actions)
         return actions[0]
 
+    def action_probs(self, gstate, actions):
+        """Return probability 1 for first action."""
+        return [1] + [0] * (len(actions) - 1)
+
     def take(self, consequence):
         """Memorize consequences."""
         self.consequences.append(consequence)
@@ -11,6 +11,8 @@ class Human(Player):
 
     def action(self, gstate, actions=None):
         """Ask action in inputs."""
-        action = input("> %s action ? " % self)
+        self.sink.write("> %s action ? " % self, end="")
+        self.sink.flush()
+        action = input("")
         self.log.debug("Pick %s for state %s", action, gstate)
         return action
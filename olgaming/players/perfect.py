@@ -0,0 +1,28 @@
+"""Perfect player: play best action of a solved game database."""
+from olgaming.player import Player
+from olgaming.solver import SolutionDB
+
+
+class PerfectPlayer(Player):
+    """Player following values of a solved game (see olgaming.solver).
+
+    Wins as fast as possible, loses as late as possible.
+    """
+
+    def __init__(self, index, database, **kwargs):
+        """Init player.
+
+        Args:
+            index       (int):                      index of player
+            database    (solver.SolutionDB or str): database or its path
+        """
+        super().__init__(index, **kwargs)
+        if isinstance(database, str):
+            database = SolutionDB(database)
+        self.database = database
+
+    def action(self, gstate, actions=None):
+        """Return best action."""
+        action = self.database.best_action(gstate, self.index, actions)
+        self.log.debug("Pick %s for state %s", action, gstate)
+        return action
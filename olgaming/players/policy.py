@@ -0,0 +1,41 @@
+"""Policy player: play actions scored by a shared policy."""
+import math
+import random
+
+from olgaming.player import Player
+
+
+class PolicyPlayer(Player):
+    """Player asking an inference broker to score actions.
+
+    Output i of the policy is the score of i-th action of all_actions.
+    """
+
+    def __init__(self, index, client, encode, all_actions, greedy=True,
+                 **kwargs):
+        """Init player.
+
+        Args:
+            index       (int):          index of player
+            client      (inference.BrokerClient): access to broker
+            encode      (callable):     return observation given game state
+                and index of player
+            all_actions (list):         all actions of game (e.g Game.actions)
+            greedy      (bool):         play best action instead of sampling
+                actions with softmax of scores
+        """
+        super().__init__(index, **kwargs)
+        self.client = client
+        self.encode = encode
+        self.greedy = greedy
+        self.codes = {action: code for code, action in enumerate(all_actions)}
+
+    def action(self, gstate, actions=None):
+        """Return action with best score, or sample it."""
+        scores = self.client.evaluate(self.encode(gstate, self.index))
+        scores = [float(scores[self.codes[action]]) for action in actions]
+        if self.greedy:
+            return actions[scores.index(max(scores))]
+        top = max(scores)
+        weights = [math.exp(score - top) for score in scores]
+        return random.choices(actions, weights=weights)[0]
@@ -0,0 +1,324 @@
+"""Remote players: players running in long-lived worker processes.
+
+A RemotePlayer is a proxy forwarding action / take calls to a player living in
+a worker process of a WorkerPool, so that a crash or a leak of a third party
+player does not take the game process down. Workers host many players (of
+many games), each player being a separate instance.
+
+Protocol: messages are sent through pipes, each of them being a header (op
+code, player id and sequence number, packed with struct) followed by pickled
+arguments. Calls to take are one-way, action calls wait for the answer of the
+worker (one round trip per move). Workers echo the sequence number of
+requests, so that late answers to requests that timed out are dropped.
+
+Workers are checked with pings (see WorkerPool.check). A worker that dies,
+hangs or does not answer in time is restarted and its players created again
+(losing their memory).
+
+    >> with WorkerPool(workers=2) as pool:
+    >>     players = [RemotePlayer(index, "Bot", pool) for index in range(2)]
+    >>     TicTacToe(players=players).play()
+"""
+import itertools
+import multiprocessing
+import pickle
+import struct
+import sys
+import time
+import traceback
+
+from olgaming import registry
+from olgaming.game import thaw
+from olgaming.player import Player
+
+
+HEADER = struct.Struct("<BII")  # Op code, id of player, sequence number
+
+# Op codes
+CREATE = 1
+DESTROY = 2
+ACTION = 3
+TAKE = 4
+TAKE_EPISODE = 5
+PING = 6
+RESULT = 7
+ERROR = 8
+
+ONE_WAY = (DESTROY, TAKE, TAKE_EPISODE)     # Ops without answer
+
+TIMEOUT = 10.       # Max seconds to wait for an answer of worker
+PING_TIMEOUT = 1.   # Max seconds to wait for an answer to a ping
+
+
+class RemoteError(Exception):
+    """Exception raised when a remote call fails."""
+    pass
+
+
+def pack(op, player_id, payload=None, seq=0):
+    """Return message bytes."""
+    return (
+        HEADER.pack(op, player_id, seq) + pickle.dumps(payload, protocol=4)
+    )
+
+
+def unpack(message):
+    """Return (op, player id, sequence number, payload) of message bytes."""
+    op, player_id, seq = HEADER.unpack_from(message)
+    return op, player_id, seq, pickle.loads(message[HEADER.size:])
+
+
+# --------------------------------------------------------------------------- #
+# Worker side
+
+def serve(conn):
+    """Serve requests of connection until it is closed."""
+    players = {}
+    while True:
+        try:
+            message = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+        op, player_id, seq, payload = unpack(message)
+        try:
+            if op == ACTION:
+                result = players[player_id].action(*payload)
+            elif op == TAKE:
+                players[player_id].take(payload)
+                continue
+            elif op == TAKE_EPISODE:
+                players[player_id].take_episode(payload)
+                continue
+            elif op == PING:
+                result = len(players)
+            elif op == CREATE:
+                player, index, p_params = payload
+                if isinstance(player, str):
+                    player = registry.get_player(player)
+                players[player_id] = player(index, **p_params)
+                result = None
+            elif op == DESTROY:
+                players.pop(player_id, None)
+                continue
+            else:
+                raise ValueError("Unknown op code %s" % op)
+        except Exception as error:  # pylint: disable=W0703
+            if op in ONE_WAY:
+                traceback.print_exc(file=sys.stderr)
+                continue
+            conn.send_bytes(pack(ERROR, player_id, "%s: %s" % (
+                type(error).__name__, error
+            ), seq))
+            continue
+        conn.send_bytes(pack(RESULT, player_id, result, seq))
+
+
+class Worker(object):
+    """Worker process and its end of pipe."""
+
+    def __init__(self):
+        self.process = None
+        self.conn = None
+        self.restarts = -1
+        self._seq = itertools.count(1)
+        self.start()
+
+    def start(self):
+        """Start worker process."""
+        self.conn, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=serve, args=(child,))
+        self.process.daemon = True
+        self.process.start()
+        child.close()
+        self.restarts += 1
+
+    def stop(self):
+        """Stop worker process."""
+        self.conn.close()
+        self.process.join(0.5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+    def is_alive(self):
+        """Return whether worker process is running."""
+        return self.process.is_alive()
+
+    def send(self, op, player_id, payload=None, seq=0):
+        """Send message without waiting for answer."""
+        try:
+            self.conn.send_bytes(pack(op, player_id, payload, seq))
+        except (OSError, ValueError) as error:
+            raise RemoteError("Worker unreachable: %s" % error)
+
+    def request(self, op, player_id, payload=None, timeout=TIMEOUT):
+        """Send message and return result of worker.
+
+        Answers of previous requests (that timed out) are dropped.
+
+        Raises:
+            RemoteError: worker failed to answer, or call raised an error
+        """
+        seq = next(self._seq) & 0xFFFFFFFF
+        self.send(op, player_id, payload, seq)
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.conn.poll(remaining):
+                    raise RemoteError(
+                        "Worker did not answer in %ss" % timeout
+                    )
+                answer, _, answer_seq, result = unpack(self.conn.recv_bytes())
+                if answer_seq == seq:
+                    break
+        except (EOFError, OSError) as error:
+            raise RemoteError("Worker unreachable: %s" % error)
+        if answer == ERROR:
+            raise RemoteError(result)
+        return result
+
+
+# --------------------------------------------------------------------------- #
+# Pool
+
+class WorkerPool(object):
+    """Worker processes hosting remote players."""
+
+    def __init__(self, workers=1, timeout=TIMEOUT):
+        """Start workers.
+
+        Args:
+            workers (int):      number of worker processes
+            timeout (float):    max seconds to wait for an action
+        """
+        self.timeout = timeout
+        self.workers = [Worker() for _ in range(workers)]
+        self._ids = itertools.count()
+        self._players = {}      # (player id, (worker, spec)) dict
+
+    def __len__(self):
+        return len(self._players)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Stop workers."""
+        for worker in self.workers:
+            worker.stop()
+
+    # ----------------------------------------------------------------------- #
+    # Players
+
+    def create(self, player, index, p_params=None):
+        """Create player in least loaded worker, return its id.
+
+        Args:
+            player      (str or type):  name (see registry) or class of player
+            index       (int):          index of player
+            p_params    (dict):         key arguments of player
+        """
+        spec = (player, index, {} if p_params is None else p_params)
+        loads = {id(worker): 0 for worker in self.workers}
+        for worker, _ in self._players.values():
+            loads[id(worker)] += 1
+        worker = min(self.workers, key=lambda worker: loads[id(worker)])
+        player_id = next(self._ids)
+        worker.request(CREATE, player_id, spec, self.timeout)
+        self._players[player_id] = (worker, spec)
+        return player_id
+
+    def destroy(self, player_id):
+        """Remove player from its worker."""
+        worker, _ = self._players.pop(player_id)
+        worker.send(DESTROY, player_id)
+
+    def call(self, player_id, op, payload=None):
+        """Return result of request, restarting worker once if it fails."""
+        worker, _ = self._players[player_id]
+        try:
+            return worker.request(op, player_id, payload, self.timeout)
+        except RemoteError:
+            if worker.is_alive() and self.ping(worker):
+                raise   # Error of player itself
+        self.restart(worker)
+        return worker.request(op, player_id, payload, self.timeout)
+
+    def cast(self, player_id, op, payload=None):
+        """Send one-way message, restarting worker if it is unreachable."""
+        worker, _ = self._players[player_id]
+        try:
+            worker.send(op, player_id, payload)
+        except RemoteError:
+            self.restart(worker)
+
+    # ----------------------------------------------------------------------- #
+    # Health
+
+    def ping(self, worker, timeout=PING_TIMEOUT):
+        """Return whether worker answers ping in time."""
+        try:
+            worker.request(PING, 0, timeout=timeout)
+        except RemoteError:
+            return False
+        return True
+
+    def restart(self, worker):
+        """Restart worker and create its players again."""
+        worker.stop()
+        worker.start()
+        for player_id, (owner, spec) in self._players.items():
+            if owner is worker:
+                worker.request(CREATE, player_id, spec, self.timeout)
+
+    def check(self):
+        """Restart workers dead or not answering, return their number."""
+        restarted = 0
+        for worker in self.workers:
+            if not (worker.is_alive() and self.ping(worker)):
+                self.restart(worker)
+                restarted += 1
+        return restarted
+
+
+# --------------------------------------------------------------------------- #
+# Proxy
+
+class RemotePlayer(Player):
+    """Proxy of a player running in a worker of a pool."""
+
+    def __init__(self, index, player, pool, p_params=None, **kwargs):
+        """Create player in pool.
+
+        Args:
+            index       (int):          index of player
+            player      (str or type):  name (see registry) or class of player
+            pool        (WorkerPool):   pool hosting player
+            p_params    (dict):         key arguments of remote player
+            kwargs      (dict):         key arguments of proxy
+        """
+        super().__init__(index, **kwargs)
+        self.pool = pool
+        self.player_id = pool.create(player, index, p_params)
+
+    def action(self, gstate, actions=None):
+        """Return action of remote player."""
+        return self.pool.call(
+            self.player_id, ACTION, (thaw(gstate), actions)
+        )
+
+    def take(self, consequence):
+        """Send consequence to remote player."""
+        self.pool.cast(self.player_id, TAKE, consequence)
+
+    def take_episode(self, consequences):
+        """Send consequences of game to remote player."""
+        self.pool.cast(self.player_id, TAKE_EPISODE, consequences)
+
+    def close(self):
+        """Remove remote player from pool."""
+        self.pool.destroy(self.player_id)
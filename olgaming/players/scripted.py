@@ -0,0 +1,49 @@
+"""Scripted player: replay actions from a script."""
+from olgaming.player import Player
+
+
+def read_actions(stream):
+    """Yield actions of stream, one per line."""
+    for line in stream:
+        yield line.rstrip("\r\n")
+
+
+def read_file(path):
+    """Yield actions of file, one per line."""
+    with open(path) as file:
+        yield from read_actions(file)
+
+
+class Scripted(Player):
+    """Player replaying a stream of actions.
+
+    As human players reading a closed input, raise EOFError when script is
+    exhausted.
+    """
+
+    def __init__(self, index, script=(), requires_visual=False, **kwargs):
+        """Init player.
+
+        Args:
+            index           (int):  index of player
+            script          (iterable, file-like or str): actions to play,
+                file-like objects (e.g pipes) and paths of files give one
+                action per line
+            requires_visual (bool): whether game is displayed before actions
+        """
+        super().__init__(index, **kwargs)
+        self.requires_visual = requires_visual
+        if isinstance(script, str):
+            script = read_file(script)
+        elif hasattr(script, 'readline'):
+            script = read_actions(script)
+        self.script = iter(script)
+
+    def action(self, gstate, actions=None):
+        """Return next action of script."""
+        try:
+            action = next(self.script)
+        except StopIteration:
+            raise EOFError("Script of %s is exhausted" % self)
+        self.log.debug("Pick %s for state %s", action, gstate)
+        return action
@@ -0,0 +1,164 @@
+"""Compact records of games.
+
+A record stores what is necessary to rebuild any position of a game:
+    - the initial parameters (game class name and rewards)
+    - the sequence of actions played, as small integer codes
+        (see Game.encode_action)
+    - a full keyframe (state and status) every K moves
+
+Any ply is reached by loading the closest keyframe before it and replaying
+the few actions after it.
+"""
+import copy
+from array import array
+
+from olutils.tools import load, save
+
+from . import registry
+from .gameobj import GameObject, GameObjMeta
+from .sinks import NullSink
+
+
+KEYFRAME = 32   # Default number of moves between 2 keyframes
+
+
+class GameRecord(object):
+    """Action log of a game with keyframes."""
+
+    def __init__(self, game_name, rewards, players_n, keyframe=KEYFRAME):
+        """Init an empty record.
+
+        Args:
+            game_name   (str):  name of game class
+            rewards     (dict): rewards of game
+            players_n   (int):  number of players in game
+            keyframe    (int):  number of moves between 2 keyframes
+        """
+        if keyframe < 1:
+            raise ValueError(
+                "Keyframe period must be greater than 0, got %s" % keyframe
+            )
+        self.game_name = game_name
+        self.rewards = rewards
+        self.players_n = players_n
+        self.keyframe = keyframe
+        self.codes = array('B')     # Upgraded to 'H' if codes exceed 255
+        self.keyframes = {}         # (ply, (state, status)) dict
+
+    @classmethod
+    def start(cls, game, keyframe=KEYFRAME):
+        """Return a new record starting from current position of game."""
+        record = cls(
+            game_name=game.__class__.__name__,
+            rewards=dict(game.rewards),
+            players_n=game.players_n,
+            keyframe=keyframe,
+        )
+        record.keyframes[0] = (game.state(), game.status())
+        return record
+
+    def __len__(self):
+        """Return number of moves recorded."""
+        return len(self.codes)
+
+    def add(self, game, code):
+        """Add code of action just played in game to record.
+
+        Args:
+            game    (game.Game):    game after action
+            code    (int):          code of action (see Game.encode_action)
+        """
+        if code > 255 and self.codes.typecode == 'B':
+            self.codes = array('H', self.codes)
+        self.codes.append(code)
+        if len(self.codes) % self.keyframe == 0:
+            self.keyframes[len(self.codes)] = (game.state(), game.status())
+
+    # ----------------------------------------------------------------------- #
+    # Replay
+
+    def game_cls(self):
+        """Return class of recorded game."""
+        try:
+            return registry.get_game(self.game_name)
+        except KeyError:
+            pass
+        from .game import Game
+        if self.game_name == Game.__name__:
+            return Game
+        for game_cls in reversed(GameObjMeta.__inheritors__[GameObject]):
+            if game_cls.__name__ == self.game_name:
+                return game_cls
+        raise ValueError("Unknown game %s" % self.game_name)
+
+    def seek(self, ply, game_cls=None, **params):
+        """Return game as it was after given number of moves.
+
+        Args:
+            ply         (int):  number of moves played
+            game_cls    (type): class of game, dft is found from its name
+            params      (dict): key arguments for game (dft is silent)
+
+        Returns:
+            (game.Game) new game instance with bot players
+        """
+        if not 0 <= ply <= len(self):
+            raise IndexError(
+                "Ply must be in [0, %s], got %s" % (len(self), ply)
+            )
+        game_cls = self.game_cls() if game_cls is None else game_cls
+        params.setdefault('loglvl', "ERROR")
+        params.setdefault('sink', NullSink())
+        game = game_cls(
+            rewards=self.rewards,
+            bots=list(range(self.players_n)),
+            **params
+        )
+
+        start = ply - ply % self.keyframe
+        state, status = copy.deepcopy(self.keyframes[start])
+        game.load_state(state)
+        game.load_status(status)
+        for code in self.codes[start:ply]:
+            game.act(game.decode_action(code))
+            game.refresh()
+            game.next()
+        return game
+
+    # ----------------------------------------------------------------------- #
+    # Save / Load
+
+    def to_dict(self):
+        """Return content of record as a dictionary."""
+        return {
+            'game': self.game_name,
+            'rewards': self.rewards,
+            'players_n': self.players_n,
+            'keyframe': self.keyframe,
+            'codes': self.codes.tobytes(),
+            'typecode': self.codes.typecode,
+            'keyframes': self.keyframes,
+        }
+
+    @classmethod
+    def from_dict(cls, content):
+        """Return record from its dictionary content."""
+        record = cls(
+            game_name=content['game'],
+            rewards=content['rewards'],
+            players_n=content['players_n'],
+            keyframe=content['keyframe'],
+        )
+        record.codes = array(content['typecode'])
+        record.codes.frombytes(content['codes'])
+        record.keyframes = content['keyframes']
+        return record
+
+    @classmethod
+    def load(cls, file_path):
+        """Load record from file."""
+        return cls.from_dict(load(file_path))
+
+    def save(self, file_path):
+        """Save record in file."""
+        save(self.to_dict(), file_path)
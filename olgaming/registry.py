@@ -0,0 +1,109 @@
+"""Registry of games and players, resolved lazily.
+
+Names are mapped to "module:attribute" paths, modules are only imported when
+a game or a player is requested. Other packages can declare their games and
+players with "olgaming.games" and "olgaming.players" entry points.
+"""
+import importlib
+
+
+GAMES = {
+    "ConnectFour": "olgaming.games.connectfour.connectfour:ConnectFour",
+    "Dummy": "olgaming.games.dummy.dummy:Dummy",
+    "TicTacToe": "olgaming.games.tictactoe.tictactoe:TicTacToe",
+}
+
+PLAYERS = {
+    "Bot": "olgaming.players.bot:Bot",
+    "Candid": "olgaming.players.candid:Candid",
+    "Human": "olgaming.players.human:Human",
+    "Scripted": "olgaming.players.scripted:Scripted",
+}
+
+TABLES = {
+    'games': GAMES,
+    'players': PLAYERS,
+}
+
+_entry_points = {}  # (group, (name, path) dict) dict, filled on first use
+
+
+# --------------------------------------------------------------------------- #
+# Resolution
+
+def entry_points(group):
+    """Return (name, path) dict of entry points declared for group."""
+    if group not in _entry_points:
+        try:
+            from importlib import metadata
+        except ImportError:
+            _entry_points[group] = {}
+            return _entry_points[group]
+        declared = metadata.entry_points()
+        if hasattr(declared, 'select'):
+            declared = declared.select(group=group)
+        else:
+            declared = declared.get(group, [])
+        _entry_points[group] = {
+            entry_point.name: entry_point.value for entry_point in declared
+        }
+    return _entry_points[group]
+
+
+def names(kind):
+    """Return sorted names available for kind ("games" or "players")."""
+    return sorted(set(TABLES[kind]) | set(entry_points("olgaming." + kind)))
+
+
+def path(kind, name):
+    """Return "module:attribute" path of name for kind."""
+    try:
+        return TABLES[kind][name]
+    except KeyError:
+        pass
+    try:
+        return entry_points("olgaming." + kind)[name]
+    except KeyError:
+        raise KeyError(
+            "Unknown %s %s, available are %s"
+            % (kind[:-1], name, ", ".join(names(kind)))
+        )
+
+
+def resolve(obj_path):
+    """Import and return object given its "module:attribute" path."""
+    module_name, attribute = obj_path.split(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+# --------------------------------------------------------------------------- #
+# Shortcuts
+
+def game_names():
+    """Return sorted names of available games."""
+    return names("games")
+
+
+def get_game(name):
+    """Return game class given its name."""
+    return resolve(path("games", name))
+
+
+def register_game(name, obj_path):
+    """Register game class given its "module:attribute" path."""
+    GAMES[name] = obj_path
+
+
+def player_names():
+    """Return sorted names of available players."""
+    return names("players")
+
+
+def get_player(name):
+    """Return player class given its name."""
+    return resolve(path("players", name))
+
+
+def register_player(name, obj_path):
+    """Register player class given its "module:attribute" path."""
+    PLAYERS[name] = obj_path
@@ -0,0 +1,87 @@
+"""Run games without human from plain descriptions.
+
+A match is described with names and dicts only (game and player names from
+the registry, rewards and parameters), so that it can be sent to other
+processes or hosts.
+"""
+import random
+
+from . import registry
+from .sinks import NullSink
+
+
+LOGLVL = "ERROR"    # Default log level of games and players built here
+
+
+def build_game(game, players=None, rewards=None, g_params=None,
+               p_params=None):
+    """Return game instance.
+
+    Args:
+        game        (str or type):  name of game or game class
+        players     (list):         name of player for each seat,
+            dft is bots on every seat
+        rewards     (dict):         rewards of game
+        g_params    (dict):         key arguments for game
+        p_params    (dict):         key arguments for players
+
+    Returns:
+        (game.Game)
+    """
+    game_cls = registry.get_game(game) if isinstance(game, str) else game
+    if players is None:
+        players = ["Bot"] * game_cls.players_n
+
+    p_params = {} if p_params is None else dict(p_params)
+    p_params.setdefault('loglvl', LOGLVL)
+    instances = [
+        registry.get_player(name)(index, **p_params)
+        for index, name in enumerate(players)
+    ]
+
+    g_params = {} if g_params is None else dict(g_params)
+    g_params.setdefault('loglvl', LOGLVL)
+    g_params.setdefault('sink', NullSink())
+    return game_cls(rewards=rewards, players=instances, **g_params)
+
+
+def outcome(game, turns=None):
+    """Return outcome of game.
+
+    Returns:
+        (dict) with keys
+            over    (bool):     whether game is over
+            winners (list):     sorted index of winners
+            rewards (list):     final reward of each player
+            turns   (int):      number of turns played
+    """
+    return {
+        'over': game.is_over(),
+        'winners': sorted(game.status()['winners']),
+        'rewards': game.dft_consequences(),
+        'turns': turns,
+    }
+
+
+def play_match(game, players=None, rewards=None, g_params=None,
+               p_params=None, seed=None):
+    """Play a game until it is over and return its outcome.
+
+    Args:
+        seed (int, opt): seed of random module before game starts
+        @see build_game for others
+
+    Returns:
+        (dict) @see outcome
+    """
+    if seed is not None:
+        random.seed(seed)
+    instance = build_game(
+        game, players=players, rewards=rewards,
+        g_params=g_params, p_params=p_params,
+    )
+    turns = 0
+    while not instance.is_over():
+        instance.turn()
+        turns += 1
+    return outcome(instance, turns)
@@ -0,0 +1,106 @@
+"""Output sinks: where games and players write what they display.
+
+    - NullSink:     discard everything (headless runs)
+    - StreamSink:   write to a stream or file, flushing by blocks
+    - MemorySink:   keep everything in memory (tests)
+"""
+import sys
+
+
+class Sink(object):
+    """Sink skeleton."""
+
+    def write(self, text, end="\n"):
+        """Write text followed by end."""
+        raise NotImplementedError
+
+    def flush(self):
+        """Flush buffered text."""
+        pass
+
+    def close(self):
+        """Flush and release resources."""
+        self.flush()
+
+
+class NullSink(Sink):
+    """Sink discarding everything."""
+
+    def write(self, text, end="\n"):
+        """Discard text."""
+        pass
+
+
+class StreamSink(Sink):
+    """Sink writing to a stream by blocks."""
+
+    def __init__(self, stream=None, buffer_size=0):
+        """Init sink.
+
+        Args:
+            stream      (file-like or str): stream or path of file to write to,
+                dft is standard output
+            buffer_size (int): number of characters to buffer before writing,
+                0 to write every text immediately
+        """
+        self._owned = isinstance(stream, str)
+        if self._owned:
+            stream = open(stream, "w", encoding="utf-8")
+        self._stream = stream
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._size = 0
+
+    @property
+    def stream(self):
+        """Return stream written to."""
+        return sys.stdout if self._stream is None else self._stream
+
+    def write(self, text, end="\n"):
+        """Buffer text and write buffer if it is full."""
+        text = text + end
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered text."""
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer = []
+            self._size = 0
+        self.stream.flush()
+
+    def close(self):
+        """Flush and close file if sink opened it."""
+        self.flush()
+        if self._owned:
+            self._stream.close()
+
+
+class MemorySink(Sink):
+    """Sink keeping everything written."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, text, end="\n"):
+        """Keep text."""
+        self._chunks.append(text + end)
+
+    def getvalue(self):
+        """Return everything written."""
+        return "".join(self._chunks)
+
+    @property
+    def lines(self):
+        """Return list of lines written."""
+        return self.getvalue().splitlines()
+
+    def clear(self):
+        """Forget everything written."""
+        self._chunks = []
+
+
+STDOUT = StreamSink()   # Default sink
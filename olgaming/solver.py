@@ -0,0 +1,441 @@
+"""Retrograde solver of finite deterministic 2 players games.
+
+Only the game contract is used: state / load_state, av_actions, act, next and
+the status. Positions (state and player to move) are solved in 2 passes:
+    - forward:  enumerate positions layer by layer, layer d+1 being the
+                distinct positions reached from layer d with one action
+    - backward: from the last layer to the first one, value each position
+                from the values of its children (backward induction)
+
+Layers are split in chunk files of positions, expanded and valued by a
+process pool. Values of a layer are stored in numpy files (memory-mapped when
+queried), sorted by key of position:
+    - keys:     64 bits hash of pickled (state, player)
+    - values:   1 win, 0 tie, -1 loss, for player to move under perfect play
+    - plies:    number of moves until end of game under perfect play (winner
+                plays fastest win, loser slowest loss)
+
+Game must be acyclic (a position can not be reached again) and its states
+picklable in a deterministic way. Keys being hashes, 2 positions could share
+a key: with 64 bits, it is unlikely for less than billions of positions.
+
+    >> database = Solver(TicTacToe, "solved/tictactoe").solve()
+    >> database.value(game.state(), game.status()['player'])
+    (0, 9)
+"""
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+
+import numpy
+
+from .game import thaw
+from .registry import get_game
+from .runner import build_game
+
+
+CHUNK_SIZE = 100000     # Max number of positions per chunk file
+MAX_DEPTH = 10000       # Max number of layers
+
+META_FILE = "meta.json"
+ACTIVE = {'over': False, 'winners': []}     # Status of unsolved positions
+
+
+def position_key(position):
+    """Return 64 bits key of pickled position."""
+    return int.from_bytes(
+        hashlib.blake2b(position, digest_size=8).digest(), "little"
+    )
+
+
+def game_position(game):
+    """Return pickled (state, player to move) of game."""
+    return pickle.dumps((game.state(), game.status()['player']), protocol=4)
+
+
+def restore(game, position):
+    """Set game to pickled position."""
+    state, player = pickle.loads(position)
+    game.load_state(state)
+    game.load_status(dict(ACTIVE, player=player))
+
+
+def write_positions(path, positions):
+    """Write pickled positions in file."""
+    with open(path, "wb") as file:
+        for position in positions:
+            pickle.dump(position, file, protocol=4)
+
+
+def read_positions(path):
+    """Yield positions of file."""
+    with open(path, "rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def outcome_value(game, player):
+    """Return value of finished game for player (1 win, 0 tie, -1 loss)."""
+    if game.is_winner(player):
+        return 1
+    return 0 if not game.status()['winners'] else -1
+
+
+def better(value, plies, best_value, best_plies):
+    """Return whether (value, plies) is better than best for player."""
+    if value != best_value:
+        return value > best_value
+    if value > 0:
+        return plies < best_plies
+    return plies > best_plies
+
+
+# --------------------------------------------------------------------------- #
+# Tasks of workers
+
+def expand_chunk(task):
+    """Write children of positions of chunk file, return their keys.
+
+    Args:
+        task (tuple): (game, g_params, chunk path, children path), game
+            being a name or a class (see runner.build_game)
+
+    Returns:
+        (tuple) (children path, numpy array of children keys)
+    """
+    game, g_params, chunk_path, children_path = task
+    game = build_game(game, g_params=g_params)
+    keys = []
+    with open(children_path, "wb") as file:
+        for position in read_positions(chunk_path):
+            restore(game, position)
+            for action in game.av_actions():
+                restore(game, position)
+                game.act(action)
+                if game.is_over():
+                    continue
+                game.next()
+                child = game_position(game)
+                keys.append(position_key(child))
+                pickle.dump(child, file, protocol=4)
+    return children_path, numpy.array(keys, dtype=numpy.uint64)
+
+
+def child_values(game, position, layer):
+    """Yield (action, value, plies) of children for player to move.
+
+    Args:
+        game        (game.Game):    scratch game
+        position    (bytes):        pickled position
+        layer       (Layer):        layer of children (or SolutionDB)
+    """
+    restore(game, position)
+    player = game.status()['player']
+    for action in game.av_actions():
+        restore(game, position)
+        game.act(action)
+        if game.is_over():
+            yield action, outcome_value(game, player), 1
+            continue
+        game.next()
+        value, plies = layer.get(position_key(game_position(game)))
+        if game.status()['player'] != player:
+            value = -value
+        yield action, value, plies + 1
+
+
+def solve_chunk(task):
+    """Return keys, values and plies of positions of chunk file.
+
+    Args:
+        task (tuple): (game, g_params, chunk path, path of database, index
+            of next layer), game being a name or a class
+    """
+    game, g_params, chunk_path, db_path, next_layer = task
+    game = build_game(game, g_params=g_params)
+    layer = Layer(db_path, next_layer)
+    keys, values, plies = [], [], []
+    for position in read_positions(chunk_path):
+        best_value, best_plies = None, None
+        for _, value, n_plies in child_values(game, position, layer):
+            if best_value is None or better(
+                value, n_plies, best_value, best_plies
+            ):
+                best_value, best_plies = value, n_plies
+        keys.append(position_key(position))
+        values.append(best_value)
+        plies.append(best_plies)
+    return (
+        numpy.array(keys, dtype=numpy.uint64),
+        numpy.array(values, dtype=numpy.int8),
+        numpy.array(plies, dtype=numpy.uint16),
+    )
+
+
+# --------------------------------------------------------------------------- #
+# Database
+
+class Layer(object):
+    """Solved positions of a layer, memory-mapped."""
+
+    def __init__(self, db_path, index):
+        self.path = os.path.join(db_path, "layer_%05d" % index)
+        self.keys = None
+        self.values = None
+        self.plies = None
+        if os.path.exists(self.path + ".keys.npy"):
+            self.keys = numpy.load(self.path + ".keys.npy", mmap_mode="r")
+            self.values = numpy.load(
+                self.path + ".values.npy", mmap_mode="r"
+            )
+            self.plies = numpy.load(self.path + ".plies.npy", mmap_mode="r")
+
+    def __len__(self):
+        return 0 if self.keys is None else len(self.keys)
+
+    def find(self, key):
+        """Return (value, plies) of key, None if not in layer."""
+        if not len(self):
+            return None
+        key = numpy.uint64(key)
+        index = int(numpy.searchsorted(self.keys, key))
+        if index < len(self.keys) and self.keys[index] == key:
+            return int(self.values[index]), int(self.plies[index])
+        return None
+
+    def get(self, key):
+        """Return (value, plies) of key, raise KeyError if not in layer."""
+        found = self.find(key)
+        if found is None:
+            raise KeyError(key)
+        return found
+
+    def save(self, keys, values, plies):
+        """Save layer (sorted by key)."""
+        order = numpy.argsort(keys, kind="stable")
+        numpy.save(self.path + ".keys.npy", keys[order])
+        numpy.save(self.path + ".values.npy", values[order])
+        numpy.save(self.path + ".plies.npy", plies[order])
+
+
+class SolutionDB(object):
+    """Values of all positions of a solved game."""
+
+    def __init__(self, path, game_cls=None):
+        """Open database.
+
+        Args:
+            path        (str):  directory of solver
+            game_cls    (type): class of game, dft is the one registered with
+                name of solved game
+        """
+        self.path = path
+        with open(os.path.join(path, META_FILE)) as file:
+            self.meta = json.load(file)
+        self.layers = [
+            Layer(path, index) for index in range(self.meta['layers'])
+        ]
+        if game_cls is None:
+            game_cls = get_game(self.meta['game'])
+        self.game_cls = game_cls
+        self._scratch = None
+
+    def __len__(self):
+        return sum(len(layer) for layer in self.layers)
+
+    @property
+    def scratch(self):
+        """Return game used to explore positions."""
+        if self._scratch is None:
+            self._scratch = build_game(
+                self.game_cls, g_params=self.meta['g_params']
+            )
+        return self._scratch
+
+    def get(self, key):
+        """Return (value, plies) of key, raise KeyError if unknown."""
+        for layer in self.layers:
+            found = layer.find(key)
+            if found is not None:
+                return found
+        raise KeyError(key)
+
+    def position(self, state, player):
+        """Return pickled position of state (or state view) and player."""
+        game = self.scratch
+        game.load_state(thaw(state))
+        game.load_status(dict(ACTIVE, player=player))
+        return game_position(game)
+
+    def value(self, state, player):
+        """Return (value, plies) of state for player to move."""
+        return self.get(position_key(self.position(state, player)))
+
+    def action_values(self, state, player, actions=None):
+        """Return (action, value, plies) list for player to move.
+
+        Args:
+            actions (list, opt): actions to value, dft is all available ones
+        """
+        position = self.position(state, player)
+        return [
+            item for item in child_values(self.scratch, position, self)
+            if actions is None or item[0] in actions
+        ]
+
+    def best_action(self, state, player, actions=None):
+        """Return best action for player to move (first one if equal)."""
+        best, best_value, best_plies = None, None, None
+        for action, value, plies in self.action_values(
+            state, player, actions
+        ):
+            if best is None or better(value, plies, best_value, best_plies):
+                best, best_value, best_plies = action, value, plies
+        return best
+
+
+# --------------------------------------------------------------------------- #
+# Solver
+
+class Solver(object):
+    """Solve game layer by layer on disk."""
+
+    def __init__(self, game, path, processes=None, chunk_size=CHUNK_SIZE,
+                 max_depth=MAX_DEPTH, keep_positions=False, g_params=None):
+        """Init solver.
+
+        Args:
+            game            (str or type):  name of 2 players game (see
+                registry) or its class (must be picklable)
+            path            (str):          directory of database
+            processes       (int):          size of process pool, dft is
+                number of cpus, 0 to work in current process
+            chunk_size      (int):          max number of positions per chunk
+            max_depth       (int):          max number of layers
+            keep_positions  (bool):         keep chunk files of positions
+            g_params        (dict):         key arguments of game
+        """
+        game_cls = get_game(game) if isinstance(game, str) else game
+        if game_cls.players_n != 2:
+            raise ValueError(
+                "Solver handles 2 players games, %s has %s players"
+                % (game_cls.__name__, game_cls.players_n)
+            )
+        self.game = game
+        self.game_cls = game_cls
+        self.path = path
+        self.processes = processes
+        self.chunk_size = chunk_size
+        self.max_depth = max_depth
+        self.keep_positions = keep_positions
+        self.g_params = g_params
+
+    def chunks(self, index):
+        """Return chunk files of layer."""
+        return sorted(glob.glob(
+            os.path.join(self.path, "layer_%05d_*.pos" % index)
+        ))
+
+    def write_layer(self, index, positions):
+        """Write positions of layer in chunk files, return their number."""
+        chunk, part, count = [], 0, 0
+        for position in positions:
+            chunk.append(position)
+            count += 1
+            if len(chunk) == self.chunk_size:
+                self._write_chunk(index, part, chunk)
+                chunk, part = [], part + 1
+        if chunk:
+            self._write_chunk(index, part, chunk)
+        return count
+
+    def _write_chunk(self, index, part, chunk):
+        write_positions(
+            os.path.join(self.path, "layer_%05d_%05d.pos" % (index, part)),
+            chunk,
+        )
+
+    def forward(self, map_func):
+        """Enumerate positions, return number of layers."""
+        game = build_game(self.game_cls, g_params=self.g_params)
+        self.write_layer(0, [game_position(game)])
+        index = 0
+        while True:
+            if index >= self.max_depth:
+                raise RuntimeError(
+                    "More than %s layers, is game acyclic ?" % self.max_depth
+                )
+            tasks = [
+                (
+                    self.game, self.g_params, chunk_path,
+                    "%s.children" % chunk_path,
+                )
+                for chunk_path in self.chunks(index)
+            ]
+            children = list(map_func(expand_chunk, tasks))
+            count = self.write_layer(index + 1, self._distinct(children))
+            for children_path, _ in children:
+                os.remove(children_path)
+            if not count:
+                return index + 1
+            index += 1
+
+    @staticmethod
+    def _distinct(children):
+        """Yield first occurrence of each child position."""
+        keys = [keys for _, keys in children]
+        all_keys = (
+            numpy.concatenate(keys) if keys
+            else numpy.array([], dtype=numpy.uint64)
+        )
+        _, first = numpy.unique(all_keys, return_index=True)
+        keep = numpy.zeros(len(all_keys), dtype=bool)
+        keep[first] = True
+        offset = 0
+        for children_path, _ in children:
+            for position in read_positions(children_path):
+                if keep[offset]:
+                    yield position
+                offset += 1
+
+    def backward(self, layers, map_func):
+        """Value positions from last layer to first one."""
+        for index in reversed(range(layers)):
+            tasks = [
+                (self.game, self.g_params, chunk_path, self.path,
+                 index + 1)
+                for chunk_path in self.chunks(index)
+            ]
+            results = list(map_func(solve_chunk, tasks))
+            Layer(self.path, index).save(*[
+                numpy.concatenate([result[column] for result in results])
+                for column in range(3)
+            ])
+            if not self.keep_positions:
+                for chunk_path in self.chunks(index):
+                    os.remove(chunk_path)
+
+    def solve(self):
+        """Solve game and return its database."""
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+        if self.processes == 0:
+            layers = self.forward(map)
+            self.backward(layers, map)
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                layers = self.forward(pool.imap)
+                self.backward(layers, pool.imap)
+        with open(os.path.join(self.path, META_FILE), "w") as file:
+            json.dump({
+                'game': self.game_cls.__name__,
+                'layers': layers,
+                'g_params': self.g_params,
+            }, file)
+        return SolutionDB(self.path, self.game_cls)
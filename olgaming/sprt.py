@@ -0,0 +1,207 @@
+"""Head-to-head evaluation with a sequential probability ratio test (SPRT).
+
+Games between a new and an old player are played (alternating seats, by
+parallel batches) until the SPRT accepts one of the hypotheses:
+    - H0: elo difference of new player over old one is elo0
+    - H1: elo difference of new player over old one is elo1
+with error rates alpha (accept H1 while H0 is true) and beta (accept H0 while
+H1 is true).
+
+The log likelihood ratio uses the normal approximation of the mean score
+(win 1, tie 0.5, loss 0), as chess engine testing frameworks do:
+
+    LLR = n * (s1 - s0) * (2 * s - s0 - s1) / (2 * var)
+
+s being the mean score, var its variance per game and s0, s1 the expected
+scores of elo0, elo1. Test stops when LLR leaves [log(beta / (1 - alpha)),
+log((1 - beta) / alpha)].
+
+    >> SPRT("ConnectFour", "Candid", "Bot", elo0=0, elo1=50).run()
+    {'result': "H1", 'confidence': 0.95, 'games': 7, ...}
+"""
+import math
+import multiprocessing
+
+from .matchmaking import play_pair
+
+
+def elo_score(elo):
+    """Return expected score of player with given elo difference."""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def score_elo(score):
+    """Return elo difference of player with given expected score."""
+    score = min(max(score, 1e-6), 1 - 1e-6)
+    return -400 * math.log10(1 / score - 1)
+
+
+def llr(wins, ties, losses, elo0, elo1):
+    """Return log likelihood ratio of H1 (elo1) over H0 (elo0).
+
+    Outcomes get a pseudo-count of 0.5 each in variance estimation, so that
+    a run of identical outcomes does not give a null variance.
+    """
+    games = wins + ties + losses
+    if not games:
+        return 0.
+    score = (wins + ties / 2) / games
+    counts = [(wins + 0.5, 1.), (ties + 0.5, 0.5), (losses + 0.5, 0.)]
+    total = games + 1.5
+    var = sum(count * (value - score) ** 2 for count, value in counts) / total
+    s0, s1 = elo_score(elo0), elo_score(elo1)
+    return games * (s1 - s0) * (2 * score - s0 - s1) / (2 * var)
+
+
+class SPRT(object):
+    """Head-to-head SPRT of a new player against an old one."""
+
+    def __init__(self, game, new, old, elo0=0, elo1=10, alpha=0.05,
+                 beta=0.05, max_games=20000, batch_size=64, seed=0,
+                 processes=None, rewards=None, g_params=None, p_params=None):
+        """Init test.
+
+        Args:
+            game        (str):      name of 2 players game (see registry)
+            new         (str):      name of new player
+            old         (str):      name of old player
+            elo0        (float):    elo difference of H0
+            elo1        (float):    elo difference of H1 (> elo0)
+            alpha       (float):    max probability to accept H1 wrongly
+            beta        (float):    max probability to accept H0 wrongly
+            max_games   (int):      max number of games played
+            batch_size  (int):      number of games dispatched at once
+            seed        (int):      seed of first game
+            processes   (int):      size of process pool, dft is number of
+                cpus, 0 to play in current process
+            rewards, g_params, p_params: @see runner.play_match
+        """
+        if elo1 <= elo0:
+            raise ValueError(
+                "elo1 (%s) must be greater than elo0 (%s)" % (elo1, elo0)
+            )
+        self.game = game
+        self.new = new
+        self.old = old
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.alpha = alpha
+        self.beta = beta
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+        self.max_games = max_games
+        self.batch_size = batch_size
+        self.seed = seed
+        self.processes = processes
+        self.match = {
+            'game': game,
+            'rewards': rewards,
+            'g_params': g_params,
+            'p_params': p_params,
+        }
+        self.wins = 0
+        self.ties = 0
+        self.losses = 0
+        self._dispatched = 0
+
+    @property
+    def games(self):
+        """Return number of games recorded."""
+        return self.wins + self.ties + self.losses
+
+    def record(self, score):
+        """Record game result: score of new player (1, 0.5 or 0)."""
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        else:
+            self.ties += 1
+
+    def llr(self):
+        """Return current log likelihood ratio."""
+        return llr(self.wins, self.ties, self.losses, self.elo0, self.elo1)
+
+    def result(self):
+        """Return accepted hypothesis ("H0" or "H1"), None if undecided."""
+        value = self.llr()
+        if value >= self.upper:
+            return "H1"
+        if value <= self.lower:
+            return "H0"
+        return None
+
+    def report(self):
+        """Return report of test.
+
+        Returns:
+            (dict) with keys
+                result      (str):      "H1", "H0" or None if max games were
+                    played without decision
+                confidence  (float):    1 - error rate of accepted hypothesis
+                games, wins, ties, losses (int): results of new player
+                llr         (float):    log likelihood ratio
+                bounds      (tuple):    bounds of llr
+                elo         (float):    elo difference estimated from score
+        """
+        result = self.result()
+        confidence = None
+        if result == "H1":
+            confidence = 1 - self.alpha
+        elif result == "H0":
+            confidence = 1 - self.beta
+        games = self.games
+        return {
+            'result': result,
+            'confidence': confidence,
+            'games': games,
+            'wins': self.wins,
+            'ties': self.ties,
+            'losses': self.losses,
+            'llr': self.llr(),
+            'bounds': (self.lower, self.upper),
+            'elo': (
+                score_elo((self.wins + self.ties / 2) / games)
+                if games else None
+            ),
+        }
+
+    # ----------------------------------------------------------------------- #
+    # Run
+
+    def is_done(self):
+        """Return whether test is decided or max games reached."""
+        return self.result() is not None or self.games >= self.max_games
+
+    def next_tasks(self):
+        """Return tasks of next batch (@see matchmaking.play_pair)."""
+        size = min(self.batch_size, self.max_games - self._dispatched)
+        tasks = [
+            (
+                self.new, self.old, (self._dispatched + index) % 2 == 0,
+                self.seed + self._dispatched + index, self.match,
+            )
+            for index in range(size)
+        ]
+        self._dispatched += size
+        return tasks
+
+    def run(self):
+        """Play batches until test is done, return report."""
+        if self.processes == 0:
+            self._run(map)
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                self._run(pool.imap_unordered)
+        return self.report()
+
+    def _run(self, map_func):
+        """Play batches using map_func, stop at first decisive result."""
+        while not self.is_done():
+            tasks = self.next_tasks()
+            if not tasks:
+                break
+            for _, _, score in map_func(play_pair, tasks):
+                self.record(score)
+                if self.is_done():
+                    return
@@ -0,0 +1,223 @@
+"""Sweep of rewards and parameters across a process pool.
+
+A configuration is a dict with any of the keys accepted by runner.play_match
+(players, rewards, g_params, p_params). Configurations are generated from
+dotted parameter names:
+
+    >> grid({'rewards.win': [5, 10], 'players': [["Bot", "Candid"]]})
+    [
+        {'rewards': {'win': 5}, 'players': ["Bot", "Candid"]},
+        {'rewards': {'win': 10}, 'players': ["Bot", "Candid"]},
+    ]
+
+Each configuration is played a fixed number of times, aggregated results are
+appended to a csv table as soon as they are available. Configurations already
+in the table are skipped, so that an interrupted sweep can be resumed.
+"""
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from .runner import play_match
+
+
+COLUMNS = [
+    "key", "game", "config", "games", "seed",
+    "ties", "wins", "mean_rewards", "seconds",
+]
+
+
+# --------------------------------------------------------------------------- #
+# Configurations
+
+def unflatten(params):
+    """Return nested dict from dict with dotted keys."""
+    config = {}
+    for name, value in params.items():
+        node = config
+        keys = name.split(".")
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+    return config
+
+
+def grid(space):
+    """Return all configurations of space.
+
+    Args:
+        space (dict): (dotted parameter name, list of values) dict
+    """
+    names = list(space)
+    return [
+        unflatten(dict(zip(names, values)))
+        for values in itertools.product(*[space[name] for name in names])
+    ]
+
+
+def sample(space, n, seed=None):
+    """Return n random configurations of space.
+
+    Args:
+        space (dict): (dotted parameter name, values) dict, where values is
+            either a list to pick from or a function taking a random.Random
+            instance and returning a value
+        n     (int):  number of configurations
+        seed  (int):  seed of sampling
+    """
+    rand = random.Random(seed)
+    return [
+        unflatten({
+            name: values(rand) if callable(values) else rand.choice(values)
+            for name, values in space.items()
+        })
+        for _ in range(n)
+    ]
+
+
+# --------------------------------------------------------------------------- #
+# Runs
+
+def config_key(game, config, games, seed):
+    """Return key identifying results of configuration."""
+    content = json.dumps([game, config, games, seed], sort_keys=True)
+    return hashlib.sha1(content.encode()).hexdigest()[:16]
+
+
+def check_games(games):
+    """Raise ValueError if number of games is not positive."""
+    if games < 1:
+        raise ValueError(
+            "Configurations need at least one game, got %s" % games
+        )
+
+
+def run_config(task):
+    """Play games of configuration and return row of results.
+
+    Args:
+        task (tuple): (key, game name, configuration, games, seed)
+    """
+    key, game, config, games, seed = task
+    check_games(games)
+    start = time.time()
+    ties, wins, total_rewards = 0, None, None
+    for index in range(games):
+        result = play_match(game, seed=seed + index, **config)
+        if wins is None:
+            wins = [0] * len(result['rewards'])
+            total_rewards = [0] * len(result['rewards'])
+        if not result['winners']:
+            ties += 1
+        for winner in result['winners']:
+            wins[winner] += 1
+        for player, reward in enumerate(result['rewards']):
+            total_rewards[player] += reward
+
+    return {
+        'key': key,
+        'game': game,
+        'config': json.dumps(config, sort_keys=True),
+        'games': games,
+        'seed': seed,
+        'ties': ties,
+        'wins': json.dumps(wins),
+        'mean_rewards': json.dumps([
+            total / games for total in total_rewards
+        ]),
+        'seconds': round(time.time() - start, 3),
+    }
+
+
+class Sweep(object):
+    """Play configurations of a game and store results in a csv table."""
+
+    def __init__(self, game, table_path, games=100, seed=0, processes=None):
+        """Init sweep.
+
+        Args:
+            game        (str):  name of game (see registry)
+            table_path  (str):  path of csv table where to store results
+            games       (int):  number of games per configuration
+            seed        (int):  seed of first game of each configuration
+            processes   (int):  size of process pool, dft is number of cpus,
+                0 to play in current process
+        """
+        check_games(games)
+        self.game = game
+        self.table_path = table_path
+        self.games = games
+        self.seed = seed
+        self.processes = processes
+
+    def done(self):
+        """Return keys of configurations already in table."""
+        if not os.path.exists(self.table_path):
+            return set()
+        with open(self.table_path, newline="") as file:
+            return {row['key'] for row in csv.DictReader(file)}
+
+    def results(self):
+        """Return rows of table, with decoded configurations and results."""
+        if not os.path.exists(self.table_path):
+            return []
+        rows = []
+        with open(self.table_path, newline="") as file:
+            for row in csv.DictReader(file):
+                for column in ["config", "wins", "mean_rewards"]:
+                    row[column] = json.loads(row[column])
+                for column in ["games", "seed", "ties"]:
+                    row[column] = int(row[column])
+                row['seconds'] = float(row['seconds'])
+                rows.append(row)
+        return rows
+
+    def run(self, configs):
+        """Play configurations not in table yet, append results to table.
+
+        Args:
+            configs (list): list of configurations (@see grid and sample)
+
+        Returns:
+            (int) number of configurations played
+        """
+        done = self.done()
+        tasks = []
+        for config in configs:
+            key = config_key(self.game, config, self.games, self.seed)
+            if key in done:
+                continue
+            done.add(key)
+            tasks.append((key, self.game, config, self.games, self.seed))
+        if not tasks:
+            return 0
+
+        table_dir = os.path.dirname(self.table_path)
+        if table_dir and not os.path.exists(table_dir):
+            os.makedirs(table_dir)
+        new_table = not os.path.exists(self.table_path)
+
+        with open(self.table_path, "a", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=COLUMNS)
+            if new_table:
+                writer.writeheader()
+            if self.processes == 0:
+                rows = map(run_config, tasks)
+                self._write(file, writer, rows)
+            else:
+                with multiprocessing.Pool(self.processes) as pool:
+                    rows = pool.imap_unordered(run_config, tasks)
+                    self._write(file, writer, rows)
+        return len(tasks)
+
+    @staticmethod
+    def _write(file, writer, rows):
+        """Write rows as they come."""
+        for row in rows:
+            writer.writerow(row)
+            file.flush()
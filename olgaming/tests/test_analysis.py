@@ -0,0 +1,80 @@
+import subprocess
+import sys
+from fractions import Fraction
+
+import pytest
+
+from olgaming import analysis
+from olgaming.gameobj import GameObject
+from olgaming.games import TicTacToe
+from olgaming.player import Player
+from olgaming.players import Bot, Candid
+from olgaming.sinks import NullSink
+
+
+def teardown_function(function):
+    GameObject.reset_counter()
+
+
+def new_game(*player_classes):
+    return TicTacToe(
+        players=[
+            player_cls(index, loglvl="ERROR")
+            for index, player_cls in enumerate(player_classes)
+        ],
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+
+
+def test_action_probs():
+    assert Bot(0, loglvl="ERROR").action_probs(None, ["a", "b"]) == [
+        Fraction(1, 2), Fraction(1, 2)
+    ]
+    assert Candid(0, loglvl="ERROR").action_probs(None, ["a", "b"]) == [1, 0]
+    with pytest.raises(NotImplementedError):
+        Player(0, loglvl="ERROR").action_probs(None, ["a"])
+
+
+def test_evaluate():
+    # Random players (known exact values of random tic tac toe)
+    game = new_game(Bot, Bot)
+    result = analysis.evaluate(game, exact=True)
+    assert result['win'] == [Fraction(737, 1260), Fraction(121, 420)]
+    assert result['tie'] == Fraction(8, 63)
+    assert result['lose'] == result['win'][::-1]
+    assert result['positions'] == 4520
+    assert game.state() == [None] * 9 and not game.is_over()
+
+    # Float results, expected rewards with dft rewards
+    game = new_game(Bot, Candid)
+    result = analysis.evaluate(game)
+    assert sum(result['win']) + result['tie'] == pytest.approx(1)
+    assert result['win'][0] == pytest.approx(493 / 945)
+    rewards = game.dft_rewards
+    assert result['rewards'][0] == pytest.approx(
+        result['win'][0] * rewards['win'] + result['tie'] * rewards['tie']
+        + result['lose'][0] * rewards['lose']
+    )
+
+    # Deterministic players, from a given position
+    game = new_game(Candid, Candid)
+    assert analysis.evaluate(game)['win'] == [1, 0]
+    game.act("8")
+    game.next()
+    game.act("0")
+    game.next()
+    result = analysis.evaluate(game)
+    assert result['win'] == [0, 1] and result['positions'] == 6
+    assert game.state()[0] == 1 and game.status()['player'] == 0
+
+
+def test_analysis_without_numpy():
+
+    # Importing analysis does not import solver (nor numpy)
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        "import sys, olgaming.analysis;"
+        "print('numpy' in sys.modules, 'olgaming.solver' in sys.modules)"
+    ])
+    assert output.decode().strip() == "False False"
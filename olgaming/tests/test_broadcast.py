@@ -0,0 +1,130 @@
+from olgaming import broadcast, clock
+from olgaming.games import Dummy, TicTacToe
+from olgaming.players import Candid
+from olgaming.sinks import NullSink
+
+
+def new_game(game_cls=TicTacToe, **params):
+    return game_cls(
+        players=[Candid(index, loglvl="ERROR") for index in range(2)],
+        sink=NullSink(),
+        loglvl="ERROR",
+        **params
+    )
+
+
+def test_broadcast():
+    game = new_game()
+    broadcaster = broadcast.Broadcaster(game, snapshot_every=3)
+    spectators = [broadcast.Spectator() for _ in range(3)]
+    messages = []
+    for spectator in spectators[:2]:
+        broadcaster.subscribe(spectator.receive)
+    broadcaster.subscribe(messages.append)
+    assert all(spectator.synced for spectator in spectators[:2])
+
+    game.turn()
+    game.turn()
+    assert broadcast.decode(messages[-1]) == {
+        'type': "delta", 'seq': 2, 'action': "1", 'player': 0,
+        'cells': [[1, 1]],
+    }
+
+    # Late joiner gets last snapshot and deltas since
+    broadcaster.subscribe(spectators[2].receive)
+    assert spectators[2].state == game.state()
+
+    # Failing subscriber is dropped
+    def failing(message):
+        raise ConnectionError
+
+    broadcaster.subscribe(lambda message: None)
+    broadcaster.subscribers[-1] = failing
+    game.play()
+    assert broadcaster.dropped == 1
+    assert len(broadcaster.subscribers) == 4
+
+    for spectator in spectators:
+        assert spectator.state == game.state()
+        assert spectator.status == game.status()
+    assert spectators[0].status['winners'] == [0]
+
+    kinds = [broadcast.decode(message)['type'] for message in messages]
+    assert kinds == ["snapshot", "delta", "delta", "snapshot", "delta",
+                     "delta", "snapshot", "delta"]
+    assert broadcast.decode(messages[-1]) == {
+        'type': "delta", 'seq': 7, 'action': "6", 'player': 1,
+        'cells': [[6, 0]], 'over': True, 'winners': [0],
+    }
+
+    broadcaster.close()
+    assert game.observers == []
+
+
+def test_spectator_resync():
+    game = new_game()
+    broadcaster = broadcast.Broadcaster(game, snapshot_every=4)
+    messages = []
+    broadcaster.subscribe(messages.append)
+    game.turn()
+    game.turn()
+    game.turn()
+    game.turn()
+
+    spectator = broadcast.Spectator()
+    spectator.receive(messages[0])
+    spectator.receive(messages[2])      # Missed delta
+    assert not spectator.synced
+    spectator.receive(messages[3])
+    assert not spectator.synced
+    spectator.receive(messages[4])      # Snapshot
+    assert spectator.synced and spectator.state == game.state()
+
+
+def test_broadcast_full_state():
+    game = new_game(Dummy)
+    broadcaster = broadcast.Broadcaster(game)
+    spectator = broadcast.Spectator()
+    broadcaster.subscribe(spectator.receive)
+    game.turn()
+    assert spectator.state == {'msg_sent': 1}
+    assert spectator.last_action == "1"
+    game.forfeit(game.player)
+    assert spectator.status == game.status()
+
+
+def test_broadcast_unparked():
+    game = new_game()
+    broadcaster = broadcast.Broadcaster(game)
+    spectator = broadcast.Spectator()
+    broadcaster.subscribe(spectator.receive)
+    game.turn()
+    game.turn()
+
+    game = game.park().unpark(sink=NullSink(), loglvl="ERROR")
+    game.play()
+    assert broadcaster.game is game
+    assert spectator.state == game.state()
+    assert spectator.status == game.status()
+    assert spectator.status['over']
+
+
+def test_broadcast_clocks():
+    game = new_game(time_control=clock.TimeControl(per_game=10, increment=1))
+    broadcaster = broadcast.Broadcaster(game)
+    spectator = broadcast.Spectator()
+    messages = []
+    broadcaster.subscribe(spectator.receive)
+    broadcaster.subscribe(messages.append)
+
+    for _ in range(3):
+        game.turn()
+        assert spectator.status['clocks'] == game.status()['clocks']
+    assert 'clocks' in broadcast.decode(messages[-1])
+
+    # Untimed games send no clocks
+    game = new_game()
+    broadcaster = broadcast.Broadcaster(game)
+    broadcaster.subscribe(messages.append)
+    game.turn()
+    assert 'clocks' not in broadcast.decode(messages[-1])
@@ -0,0 +1,142 @@
+import pytest
+import threading
+import time
+
+from olgaming import clock
+from olgaming.gameobj import GameObject
+from olgaming.games import TicTacToe
+from olgaming.player import Player
+from olgaming.players import Candid, Human
+from olgaming.sinks import NullSink
+
+
+class Sleepy(Candid):
+    """Candid player sleeping before playing."""
+
+    delay = 0.2
+
+    def action(self, gstate, actions):
+        time.sleep(self.delay)
+        return super().action(gstate, actions)
+
+
+class KeysTicTacToe(TicTacToe):
+    """TicTacToe giving available actions as a view of dict keys."""
+
+    def av_actions(self):
+        return dict.fromkeys(super().av_actions()).keys()
+
+
+def teardown_function(function):
+    GameObject.reset_counter()
+
+
+def test_time_control():
+
+    with pytest.raises(ValueError):
+        clock.TimeControl(on_timeout="cheat")
+
+    control = clock.TimeControl(per_move=2, per_game=10, increment=1)
+    assert control.start_clocks(2) == [10, 10]
+    assert control.budget(10) == 2
+    assert control.budget(1.5) == 1.5
+    assert control.budget(-1) == 0
+    assert control.charge(10, 3) == 8
+    assert control.charge(None, 3) is None
+
+    assert clock.TimeControl().budget(None) is None
+    assert clock.TimeControl(per_game=3).budget(2) == 2
+
+
+def test_call_with_timeout():
+
+    assert clock.call_with_timeout(None, max, 1, 2) == (True, 2)
+    assert clock.call_with_timeout(1, max, 1, 2) == (True, 2)
+    assert clock.call_with_timeout(0.01, time.sleep, 0.5) == (False, None)
+    with pytest.raises(ZeroDivisionError):
+        clock.call_with_timeout(1, lambda: 1 / 0)
+
+
+def test_call_worker():
+
+    worker = clock.CallWorker()
+    assert worker.call(1, threading.get_ident) == (True, worker._thread.ident)
+    thread = worker._thread
+
+    # Call out of time keeps worker busy, its result is dropped
+    assert worker.call(0.01, lambda: time.sleep(0.2) or "late") == (
+        False, None
+    )
+    assert worker.call(0.01, max, 1, 2) == (False, None)
+    assert worker.call(1, max, 3, 4) == (True, 4)
+    assert worker._thread is thread
+    with pytest.raises(ZeroDivisionError):
+        worker.call(1, lambda: 1 / 0)
+
+
+def test_timed_game():
+
+    # ---- Forfeit
+    game = TicTacToe(
+        players=[Candid(0), Sleepy(1)],
+        time_control=clock.TimeControl(per_move=0.05),
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+    game.play()
+    assert game.state() == [0] + [None] * 8
+    assert game.status() == {
+        'player': 1, 'over': True, 'winners': [0], 'clocks': [None, None],
+    }
+    assert game.players[1].consequences == [0, -10]
+
+    # ---- Random action with per game clock
+    game = TicTacToe(
+        players=[Candid(0), Sleepy(1)],
+        time_control=clock.TimeControl(
+            per_game=0.3, increment=0.01, on_timeout="random"
+        ),
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+    game.play()
+    assert game.is_over()
+    clocks = game.status()['clocks']
+    assert clocks[0] > 0.2
+    assert clocks[1] <= 0.3 - 0.2 + 0.01
+    assert sorted(cell for cell in game.state() if cell is not None)[-1] == 1
+
+    # ---- Random action among actions that are not a sequence
+    game = KeysTicTacToe(
+        players=[Sleepy(0), Candid(1)],
+        time_control=clock.TimeControl(per_move=0.01, on_timeout="random"),
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+    assert game.turn()
+    assert game.state().count(0) == 1
+
+    # ---- Base player has no deadline awareness
+    player = Player(0)
+    with pytest.raises(NotImplementedError):
+        player.timed_action("gstate", [], deadline=0)
+
+
+def test_timed_human(monkeypatch):
+
+    game = TicTacToe(
+        players=[Sleepy(0), Human(1)],
+        time_control=clock.TimeControl(per_game=10),
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+    monkeypatch.setattr(
+        "builtins.input", lambda *args: time.sleep(0.2) or "4"
+    )
+    assert game.turn() and game.turn()
+    assert game.state()[:5] == [0, None, None, None, 1]
+
+    # ---- Human is not timed (nor charged)
+    clocks = game.status()['clocks']
+    assert clocks[0] < 10 - Sleepy.delay / 2
+    assert clocks[1] == 10
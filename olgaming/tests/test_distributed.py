@@ -0,0 +1,99 @@
+import socket
+import subprocess
+import sys
+import threading
+
+from olgaming import distributed
+
+
+def test_protocol():
+
+    sock_1, sock_2 = socket.socketpair()
+    distributed.send_msg(sock_1, {'type': "pull", 'values': [1, 2]})
+    assert distributed.recv_msg(sock_2) == {'type': "pull", 'values': [1, 2]}
+    sock_1.close()
+    assert distributed.recv_msg(sock_2) is None
+    sock_2.close()
+
+
+def test_coordinator_workers():
+
+    units = distributed.make_units(
+        "TicTacToe", lineups=[["Candid", "Candid"], ["Bot", "Bot"]], games=5,
+    )
+    assert len(units) == 10
+    assert units[0] == {
+        'game': "TicTacToe", 'players': ["Candid", "Candid"], 'seed': 0,
+    }
+
+    coordinator = distributed.Coordinator(units, port=0)
+    host, port = coordinator.address
+    results = {}
+    thread = threading.Thread(
+        target=lambda: results.update(enumerate(coordinator.run(timeout=60)))
+    )
+    thread.start()
+
+    # ---- Malformed messages are answered with an error
+    sock = socket.create_connection((host, port))
+    for msg in [{}, {'type': "result", 'id': 0}, {'type': "result", 'id': -1},
+                {'type': "result", 'id': "0", 'result': {}},
+                {'type': "result", 'id': True, 'result': {}},
+                {'type': "failure", 'id': 0.0, 'error': ""}, [1]]:
+        distributed.send_msg(sock, msg)
+        assert distributed.recv_msg(sock)['type'] == "error"
+    sock.close()
+
+    # ---- Worker dying with a unit: unit is given to another worker
+    sock = socket.create_connection((host, port))
+    distributed.send_msg(sock, {'type': "pull"})
+    assert distributed.recv_msg(sock)['id'] == 0
+    sock.close()
+
+    workers = [
+        subprocess.Popen([
+            sys.executable, "-m", "olgaming.distributed",
+            "worker", "--host", host, "--port", str(port),
+        ])
+        for _ in range(2)
+    ]
+    for worker in workers:
+        assert worker.wait(timeout=60) == 0
+    thread.join()
+
+    assert coordinator.requeued == 1
+    assert len(results) == 10
+    for index in range(5):
+        assert results[index]['winners'] == [0]
+        assert results[index]['turns'] == 7
+    assert all(result['over'] for result in results.values())
+
+
+def test_coordinator_failures():
+
+    units = distributed.make_units(
+        "TicTacToe", lineups=[["Candid", "Candid"], ["Candid", "Nobody"]],
+    )
+    coordinator = distributed.Coordinator(units, port=0)
+    host, port = coordinator.address
+    played = []
+    workers = [
+        threading.Thread(target=lambda: played.append(
+            distributed.work(host=host, port=port)
+        ))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+
+    # ---- Failing unit is reported, not given to every worker
+    results = coordinator.run(timeout=60)
+    for worker in workers:
+        worker.join(timeout=60)
+        assert not worker.is_alive()
+    assert sorted(played) == [0, 2] or sorted(played) == [1, 1]
+    assert results[0]['winners'] == [0]
+    assert results[1] is None
+    assert list(coordinator.errors) == [1]
+    assert coordinator.errors[1].startswith("KeyError")
+    assert coordinator.requeued == 0
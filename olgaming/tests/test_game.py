@@ -226,3 +226,189 @@ def test_game_use():
     ninstance.load(save_dir)
     assert ninstance.state() == ["a", "human", "a", "human"]
     assert ninstance.status() == {'over': True, 'player': 0, 'winners': [0]}
+
+
+def test_game_many_players():
+    """Test free-for-all game with many players."""
+
+    from olgaming.players import Candid
+
+    class FreeForAll(game.Game):
+
+        actions = ["win", "stay"]
+        players_n = 300
+
+        def act(self, action):
+            """Current player wins when saying so, game ends with 3 winners."""
+            if action == "win":
+                self.new_winner(self._player)
+            if len(self._winners) == 3:
+                self.raise_endflag()
+            return {self._player: action}
+
+    players = [
+        Candid(index) if index % 2 else Bot(index)
+        for index in range(FreeForAll.players_n)
+    ]
+    ginstance = FreeForAll(players=players, loglvl="ERROR")
+    assert list(ginstance._takers) == list(range(1, 300, 2))
+
+    # ---- Winners
+    ginstance.new_winner(4)
+    ginstance.new_winner(players[2])
+    assert ginstance.winners == [players[2], players[4]]
+    assert ginstance.is_winner(4) and ginstance.is_winner(players[2])
+    assert not ginstance.is_winner(3)
+
+    # ---- Consequences
+    ginstance.raise_endflag()
+    consequences = ginstance.dft_consequences()
+    assert len(consequences) == 300
+    assert consequences.count(5) == 2
+    assert consequences.count(-10) == 298
+
+    ginstance.deliver(consequences)
+    ginstance.deliver({1: "a", 2: "b"})
+    assert players[1].consequences == [-10, "a"]
+    assert players[3].consequences == [-10]
+
+    # ---- Play
+    players = [Candid(index) for index in range(FreeForAll.players_n)]
+    ginstance = FreeForAll(players=players, loglvl="ERROR")
+    ginstance.play()
+    assert sorted(ginstance.status()['winners']) == [0, 1, 2]
+    assert players[1].consequences == ["win"]
+    assert players[3].consequences == []
+
+
+def test_game_state_view():
+    """Test read-only cached views of state."""
+    from array import array
+    from types import MappingProxyType
+
+    assert game.freeze([1, [2, None], {'a': [3]}]) == (
+        1, (2, None), MappingProxyType({'a': (3,)})
+    )
+    assert game.freeze({1, 2}) == frozenset([1, 2])
+    view = game.freeze(bytearray(b"ab"))
+    assert view.readonly and view.tobytes() == b"ab"
+    assert game.freeze(array('B', [1, 2])).readonly
+
+    class Counter(game.Game):
+
+        actions = ["+1"]
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.values = bytearray(2)
+
+        def act(self, action):
+            self.values[self._player] += 1
+            return [None, None]
+
+        def make_state_view(self):
+            self.views_made += 1
+            return super().make_state_view()
+
+        def state(self):
+            return list(self.values)
+
+    ginstance = Counter(loglvl="ERROR")
+    ginstance.views_made = 0
+    assert ginstance.state_view() == (0, 0)
+    assert ginstance.state_view() is ginstance.state_view()
+    assert ginstance.views_made == 1
+
+    ginstance.act("+1")
+    assert ginstance.state_view() == (1, 0)
+    assert ginstance.views_made == 2
+
+    ginstance.values[1] = 5
+    assert ginstance.state_view() == (1, 0)
+    ginstance.invalidate_state()
+    assert ginstance.state_view() == (1, 5)
+
+    # ---- Zero copy view of buffer
+    ginstance.make_state_view = lambda: game.freeze(ginstance.values)
+    ginstance.invalidate_state()
+    view = ginstance.state_view()
+    ginstance.act("+1")
+    ginstance.values[1] = 7
+    assert view.tolist() == [2, 7]
+
+
+def test_game_encode():
+    """Test observation encoding in preallocated buffers."""
+    import numpy
+    from olgaming.games import Dummy, TicTacToe
+    from olgaming.sinks import NullSink
+
+    ginstance = TicTacToe(bots=[0, 1], loglvl="ERROR")
+    with pytest.raises(NotImplementedError):
+        game.Game(loglvl="ERROR").encode()
+    with pytest.raises(ValueError):
+        ginstance.encode(out=numpy.zeros((9,)))
+
+    ginstance.act("4")
+    ginstance.next()
+    observation = ginstance.encode()
+    assert observation.shape == (3, 3, 3)
+    assert observation[0, 1, 1] == 1
+    assert observation[0].sum() == 1 and observation[1].sum() == 0
+    assert (observation[2] == 1).all()     # Player 1 to move
+
+    # Rows of batch are filled in place
+    games = [ginstance, TicTacToe(bots=[0, 1], loglvl="ERROR")]
+    batch = numpy.full((2, 3, 3, 3), 7, dtype="float32")
+    assert game.encode_batch(games, out=batch) is batch
+    assert (batch[0] == observation).all()
+    assert batch[1].sum() == 0
+    assert game.encode_batch(games).shape == (2, 3, 3, 3)
+
+    dummy = Dummy(bots=[0, 1], sink=NullSink(), loglvl="ERROR")
+    dummy.act("1")
+    assert list(dummy.encode()) == [1, 0]
+
+
+def test_game_episode_delivery():
+    """Test consequences delivered at end of game."""
+    from olgaming.games import Dummy, TicTacToe
+    from olgaming.players import Candid
+    from olgaming.sinks import NullSink
+
+    class Learner(Candid):
+
+        delivery = "episode"
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.episodes = []
+
+        def take(self, consequence):
+            raise AssertionError("Consequence delivered during game")
+
+        def take_episode(self, consequences):
+            self.episodes.append(consequences)
+
+    players = [Learner(0, loglvl="ERROR"), Candid(1, loglvl="ERROR")]
+    ginstance = TicTacToe(players=players, sink=NullSink(), loglvl="ERROR")
+    ginstance.play()
+    rewards = ginstance.rewards
+    assert players[0].episodes == [
+        [rewards['neutral']] * 6 + [rewards['win']]
+    ]
+    assert players[1].consequences[-1] == rewards['lose']
+    assert len(players[1].consequences) == 7
+
+    # Dft take_episode falls back on take, forfeit ends episode
+    players = [Candid(index, loglvl="ERROR") for index in range(2)]
+    players[1].delivery = "episode"
+    ginstance = Dummy(players=players, sink=NullSink(), loglvl="ERROR")
+    ginstance.turn()
+    assert players[1].consequences == []
+    ginstance.forfeit(players[0])
+    assert players[1].consequences == ["<r>hi</r>", rewards['win']]
+
+    players[0].delivery = "never"
+    with pytest.raises(ValueError):
+        Dummy(players=players, loglvl="ERROR")
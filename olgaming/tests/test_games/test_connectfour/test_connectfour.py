@@ -0,0 +1,122 @@
+import os
+import pytest
+import shutil
+
+from olgaming.players import Candid
+from olgaming.games.connectfour import connectfour
+from olgaming.sinks import MemorySink
+
+
+TMP_DIR = "tmp"
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def play(game, actions):
+    for action in actions:
+        game.act(action)
+        game.next()
+
+
+def test_connected_four():
+
+    assert not connectfour.connected_four(0)
+    assert connectfour.connected_four(0b1111)               # Vertical
+    assert not connectfour.connected_four(0b111 << 3)       # Over sentinel
+    assert connectfour.connected_four(
+        sum(1 << (column * 7) for column in range(4))       # Horizontal
+    )
+    assert connectfour.connected_four(
+        sum(1 << (index * 8) for index in range(4))         # Diagonal
+    )
+    assert connectfour.connected_four(
+        sum(1 << (3 + index * 6) for index in range(4))     # Anti-diagonal
+    )
+
+
+def test_connectfour_candidgame():
+
+    game = connectfour.ConnectFour(
+        players=[Candid(0), Candid(1)],
+        sink=MemorySink(),
+        loglvl="DEBUG",
+    )
+    assert game.state() == [None] * 42
+    assert game.av_actions() == [str(i) for i in range(7)]
+
+    game.play()
+    assert game.status() == {'player': 1, 'over': True, 'winners': [0]}
+    assert game.moves == 19
+    assert game.board_str() == (
+        "X X X . . . .\n"
+        "O O O . . . .\n"
+        "X X X . . . .\n"
+        "O O O . . . .\n"
+        "X X X . . . .\n"
+        "O O O O . . .\n"
+        "0 1 2 3 4 5 6"
+    )
+    assert game.av_actions() == ["3", "4", "5", "6"]
+
+
+def test_connectfour_playbyplay():
+
+    game = connectfour.ConnectFour(loglvl="ERROR")
+
+    # ---- Column full
+    play(game, ["3"] * 6)
+    assert "3" not in game.av_actions()
+    with pytest.raises(connectfour.InvalidAction):
+        game.act("3")
+    with pytest.raises(connectfour.InvalidAction):
+        game.act("7")
+    assert not game.is_over()
+
+    # ---- Horizontal win for player 0 on bottom row
+    play(game, ["0", "0", "1", "1", "2"])
+    assert game.is_over()
+    assert game.status()['winners'] == [0]
+    assert game.state()[35:] == [0, 0, 0, 0, None, None, None]
+
+    # ---- Save / Load
+    save_dir = os.path.join(TMP_DIR, "test_connectfour")
+    game.save(save_dir)
+    ngame = connectfour.ConnectFour(loglvl="ERROR")
+    ngame.load(save_dir)
+    assert ngame.state() == game.state()
+    assert ngame.bitboards == game.bitboards
+    assert ngame.heights == game.heights
+    assert ngame.moves == game.moves
+
+
+def test_connectfour_tie():
+
+    game = connectfour.ConnectFour(loglvl="ERROR")
+    # Columns filled by pairs, shifting order to avoid any alignment
+    actions = []
+    for columns in [[0, 1], [2, 3], [4, 5]]:
+        for _ in range(3):
+            actions += [str(columns[0]), str(columns[1])]
+        for _ in range(3):
+            actions += [str(columns[1]), str(columns[0])]
+    actions += ["6"] * 6
+    play(game, actions)
+    assert game.is_over()
+    assert game.winners == []
+
+
+def test_connectfour_encode():
+
+    game = connectfour.ConnectFour(bots=[0, 1], loglvl="ERROR")
+    play(game, ["3", "3", "0", "6", "3"])
+    observation = game.encode()
+    assert observation.shape == (3, 6, 7)
+    state = game.state()
+    for index in range(2):
+        assert observation[index].flatten().tolist() == [
+            float(cell == index) for cell in state
+        ]
+    assert (observation[2] == 1).all()
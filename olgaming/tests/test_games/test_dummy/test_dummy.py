@@ -52,3 +52,15 @@ def test_dummy():
         'over': True,
         'winners': [1],
     }
+
+
+def test_dummy_unpack():
+
+    game = Dummy(bots=[0, 1], loglvl="ERROR")
+    packed = game.pack_state()
+    game.act("1")
+    assert game.state_view()['msg_sent'] == 1
+
+    game.unpack_state(packed)
+    assert game.state_view()['msg_sent'] == 0
+    assert game.state() == {'msg_sent': 0}
@@ -61,9 +61,11 @@ def test_tictactoe_playbyplay():
     game = tictactoe.TicTacToe(
         loglvl="DEBUG",
     )
+    assert game.state_view() == (None,) * 9
 
     game.act("4")
     game.next()
+    assert game.state_view() == (None,) * 4 + (0,) + (None,) * 4
 
     with pytest.raises(tictactoe.InvalidAction):
         game.act("4")
@@ -0,0 +1,134 @@
+import multiprocessing
+import sys
+import threading
+
+import numpy
+import pytest
+
+from olgaming import inference
+from olgaming.games import TicTacToe
+from olgaming.players import Candid
+from olgaming.players.policy import PolicyPlayer
+from olgaming.runner import outcome
+from olgaming.sinks import NullSink
+
+
+def last_empty_policy(observations):
+    """Score empty cells with their position."""
+    return (observations == 0) * numpy.arange(9, dtype="float32")
+
+
+def encode(gstate, index):
+    """Return 1 for player cells, -1 for opponent cells, 0 for empty ones."""
+    return [
+        0 if cell is None else (1 if cell == index else -1)
+        for cell in gstate
+    ]
+
+
+def play(client, results):
+    """Play a game with policy player against candid player."""
+    game = TicTacToe(
+        players=[
+            Candid(0, loglvl="ERROR"),
+            PolicyPlayer(
+                1, client, encode, TicTacToe.actions, loglvl="ERROR"
+            ),
+        ],
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+    game.play()
+    results.put((game.state(), outcome(game)['winners']))
+
+
+def test_inference_broker():
+
+    broker = inference.InferenceBroker(
+        last_empty_policy, obs_shape=(9,), n_outputs=9,
+        slots=4, max_batch=4, max_wait=0.2,
+    )
+    with broker:
+        client = broker.client()
+        assert list(client.evaluate([0, 1, 0, 0, -1, 0, 0, 0, 0])) == [
+            0, 0, 2, 3, 0, 5, 6, 7, 8
+        ]
+
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(
+                target=play, args=(broker.client(), results)
+            )
+            for _ in range(3)
+        ]
+        for process in processes:
+            process.start()
+        games = [results.get(timeout=30) for _ in processes]
+        for process in processes:
+            process.join()
+
+        assert broker.evaluated == 1 + 3 * 2
+
+    assert games == [([0, 0, 0, None, None, None, None, 1, 1], [0])] * 3
+
+
+def test_inference_batches():
+
+    # Batches are only closed when full (max_wait is never reached)
+    broker = inference.InferenceBroker(
+        last_empty_policy, obs_shape=(9,), n_outputs=9,
+        slots=4, max_batch=4, max_wait=60,
+    )
+    outputs = []
+
+    def evaluate(client, cell):
+        for _ in range(2):
+            observation = [0] * 9
+            observation[cell] = 1
+            outputs.append((
+                list(client.evaluate(observation, timeout=60)),
+                list(last_empty_policy(numpy.array(observation))),
+            ))
+
+    with broker:
+        threads = [
+            threading.Thread(target=evaluate, args=(broker.client(), cell))
+            for cell in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert broker.evaluated == 8
+        assert broker.batches == 2
+
+    assert len(outputs) == 8
+    for output, expected in outputs:
+        assert output == expected
+
+
+def failing_policy(observations):
+    """Fail on observations starting with 1, exit on those starting with 2."""
+    if (observations[:, 0] == 2).any():
+        sys.exit(1)
+    if (observations[:, 0] == 1).any():
+        raise ValueError("bad observation")
+    return observations
+
+
+def test_inference_errors():
+
+    broker = inference.InferenceBroker(
+        failing_policy, obs_shape=(2,), n_outputs=2, slots=2, max_batch=1,
+    )
+    with broker:
+        client = broker.client()
+        with pytest.raises(inference.EvaluationError, match="Policy failed"):
+            client.evaluate([1, 0])
+        assert list(client.evaluate([0, 3])) == [0, 3]
+
+        with pytest.raises(inference.EvaluationError, match="stopped"):
+            client.evaluate([2, 0], timeout=10)
+        with pytest.raises(inference.EvaluationError, match="not running"):
+            client.evaluate([0, 3])
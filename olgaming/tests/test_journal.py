@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+
+from olgaming import journal
+from olgaming.games import TicTacToe
+
+
+# --------------------------------------------------------------------------- #
+# Parameters
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_journal():
+
+    path = os.path.join(TMP_DIR, "journal.jsonl")
+    game = TicTacToe(loglvl="ERROR")
+    with journal.Journal(path, batch_size=2, interval=60) as tjournal:
+        tjournal.checkpoint("b", game, 0)
+        assert os.path.getsize(path) == 0
+        tjournal.result("a", {'winners': [0]})
+        assert os.path.getsize(path) > 0
+        tjournal.checkpoint("c", game, 4)
+
+    # Crash during last write
+    with open(path, "a") as file:
+        file.write('{"type":"result","key":"c","res')
+
+    results, checkpoints = journal.Journal.read(path)
+    assert results == {'a': {'winners': [0]}}
+    assert sorted(checkpoints) == ["b", "c"]
+    assert checkpoints["c"]['turns'] == 4
+    assert checkpoints["c"]['state'] == [None] * 9
+
+    # Entries appended after truncated line are readable
+    with journal.Journal(path) as tjournal:
+        tjournal.result("c", {'winners': []})
+    results, checkpoints = journal.Journal.read(path)
+    assert results == {'a': {'winners': [0]}, 'c': {'winners': []}}
+    assert list(checkpoints) == ["b"]
+    with open(path) as file:
+        assert all(json.loads(line) for line in file)
+
+
+def test_run_tournament():
+
+    path = os.path.join(TMP_DIR, "journal.jsonl")
+    matchups = [
+        ("candid", {'game': "TicTacToe", 'players': ["Candid", "Candid"]}),
+        ("resumed", {'game': "TicTacToe", 'players': ["Candid", "Candid"]}),
+    ]
+
+    # ---- Journal of a crashed run: first game done, second one interrupted
+    os.makedirs(TMP_DIR)
+    with open(path, "w") as file:
+        file.write(json.dumps({
+            'type': "result", 'key': "candid", 'result': "already done",
+        }) + "\n")
+        file.write(json.dumps({
+            'type': "checkpoint", 'key': "resumed",
+            'state': [None, None, 1, 0, 1, 0, None, None, None],
+            'status': {'player': 0, 'over': False, 'winners': []},
+            'turns': 4,
+        }) + "\n")
+
+    results = journal.run_tournament(matchups, path, checkpoint_every=2)
+    assert results["candid"] == "already done"
+    assert results["resumed"] == {
+        'over': True, 'winners': [0], 'rewards': [5, -10], 'turns': 7,
+    }
+    assert journal.Journal.read(path) == (results, {})
+
+    # ---- No resume
+    results = journal.run_tournament(
+        matchups, path, checkpoint_every=2, resume=False
+    )
+    assert results["candid"]['turns'] == 7
+    with open(path) as file:
+        entries = [json.loads(line) for line in file]
+    assert [entry['type'] for entry in entries] == (
+        ["checkpoint"] * 3 + ["result"]
+    ) * 2
@@ -0,0 +1,68 @@
+import os
+import shutil
+
+import pytest
+
+from olgaming import loadgen
+from olgaming.games import TicTacToe
+
+
+# --------------------------------------------------------------------------- #
+# Parameters
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_new_game():
+
+    game = loadgen.new_game(TicTacToe, iter("0 3 1 4 2".split()))
+    game.play()
+    assert game.state() == [0, 0, 0, 1, 1, None, None, None, None]
+
+
+def test_percentile():
+
+    values = list(range(101))
+    assert loadgen.percentile(values, 50) == 50
+    assert loadgen.percentile(values, 99) == 99
+    assert loadgen.percentile([], 50) is None
+
+
+def test_run_load():
+
+    report = loadgen.run_load("TicTacToe", games=30, concurrency=7)
+    assert report['games'] == 30
+    assert 30 * 5 <= report['turns'] <= 30 * 9
+    assert sorted(report['latency_ms']) == [
+        "max", "mean", "p50", "p90", "p99", "p99.9"
+    ]
+    assert report['latency_ms']['p50'] <= report['latency_ms']['max']
+    with pytest.raises(ValueError):
+        loadgen.run_load("TicTacToe", games=0)
+
+    # ---- Script file, several processes
+    os.makedirs(TMP_DIR)
+    script_path = os.path.join(TMP_DIR, "script.txt")
+    with open(script_path, "w") as file:
+        file.write("0 3 1 4 2\n4 0 8 2 6 1\n")
+    report = loadgen.run_load(
+        "TicTacToe", games=10, concurrency=3, processes=2,
+        script_path=script_path, visual=False,
+    )
+    assert report['turns'] == 5 * 5 + 5 * 6
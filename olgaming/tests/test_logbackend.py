@@ -0,0 +1,117 @@
+import os
+import pytest
+import shutil
+
+from olgaming import logbackend
+from olgaming.gameobj import GameObject
+
+
+# --------------------------------------------------------------------------- #
+# Parameters
+
+TMP_DIR = "tmp"
+
+
+class LoggedObj(GameObject):
+    pass
+
+
+class SubLoggedObj(LoggedObj):
+    pass
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    LoggedObj.set_dft_logbackend(None, propag=True)
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_queue_backend():
+
+    logpath = os.path.join(TMP_DIR, "objects.log")
+    backend = logbackend.QueueBackend(batch_size=3)
+    LoggedObj.set_dft_logbackend(backend, propag=True)
+    assert SubLoggedObj._logbackend is backend
+
+    instances = [
+        LoggedObj(identity="a", loglvl="INFO", logpath=logpath),
+        SubLoggedObj(identity="b", loglvl="INFO", logpath=logpath),
+    ]
+    for instance in instances:
+        assert len(instance.log.handlers) == 1
+        assert isinstance(instance.log.handlers[0], logbackend.QueueHandler)
+        instance.log.info("message %s", 1)
+        instance.log.debug("hidden message")
+    assert backend.running
+
+    backend.flush()
+    backend.stop()
+    assert not backend.running
+
+    with open(logpath) as file:
+        lines = file.read().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("[INFO] LoggedObj_a - message 1")
+    assert lines[1].endswith("[INFO] SubLoggedObj_b - message 1")
+
+
+def test_queue_backend_overflow():
+
+    with pytest.raises(ValueError):
+        logbackend.QueueBackend(overflow="explode")
+
+    # ---- Writer not started: queue fills up
+    backend = logbackend.QueueBackend(maxsize=2, overflow="drop")
+    for i in range(5):
+        backend.put(None, i)
+    assert backend.dropped == 3
+    assert [backend.queue.get_nowait()[1] for _ in range(2)] == [0, 1]
+
+    backend = logbackend.QueueBackend(maxsize=2, overflow="drop_oldest")
+    for i in range(5):
+        backend.put(None, i)
+    assert backend.dropped == 3
+    assert [backend.queue.get_nowait()[1] for _ in range(2)] == [3, 4]
+
+
+def test_queue_backend_stopped():
+
+    logpath = os.path.join(TMP_DIR, "objects.log")
+    backend = logbackend.QueueBackend(maxsize=1, overflow="block")
+    LoggedObj.set_dft_logbackend(backend, propag=True)
+    instances = [
+        LoggedObj(identity="c", loglvl="INFO", logpath=logpath),
+        SubLoggedObj(identity="d", loglvl="INFO", logpath=logpath),
+    ]
+    instances[0].log.info("queued")
+    backend.stop()
+
+    # ---- Loggers write directly (a full queue would block forever)
+    for instance in instances:
+        assert len(instance.log.handlers) == 1
+        assert not isinstance(
+            instance.log.handlers[0], logbackend.QueueHandler
+        )
+    handler = instances[0].log.handlers[0]
+    assert instances[1].log.handlers[0] is handler
+    for i in range(3):
+        instances[0].log.info("direct %s", i)
+    assert backend.queue.empty()
+    handler.close()
+
+    with open(logpath) as file:
+        lines = file.read().splitlines()
+    assert len(lines) == 4
+    assert lines[0].endswith("[INFO] LoggedObj_c - queued")
+    assert lines[-1].endswith("[INFO] LoggedObj_c - direct 2")
@@ -0,0 +1,60 @@
+import pytest
+
+from olgaming import matchmaking
+
+
+def test_prob_above_half():
+    assert matchmaking.prob_above_half(1, 1) == pytest.approx(0.5)
+    assert matchmaking.prob_above_half(30, 2) > 0.99
+    assert matchmaking.prob_above_half(2, 30) < 0.01
+
+
+def test_matchmaker_posteriors():
+    with pytest.raises(ValueError):
+        matchmaking.Matchmaker("ConnectFour", ["Bot", "Bot"])
+
+    matchmaker = matchmaking.Matchmaker(
+        "ConnectFour", ["A", "B", "C"], confidence=0.9, max_games=100,
+        games_per_pair=4,
+    )
+    assert matchmaker.ranking_confidence() == pytest.approx(0.5)
+
+    for _ in range(10):
+        matchmaker.record("A", "B", 1)
+        matchmaker.record("C", "B", 0.5)
+        matchmaker.record("C", "A", 0)
+    assert matchmaker.posterior("A", "B") == (11, 1)
+    assert matchmaker.posterior("B", "A") == (1, 11)
+    assert matchmaker.posterior("B", "C") == (6, 6)
+    assert matchmaker.played("B", "C") == 10
+    assert matchmaker.games == 30
+    assert matchmaker.ranking()[0] == "A"
+
+    # Only uncertain adjacent pairs are scheduled, seats alternate
+    confidences = {
+        (a, b): confidence for a, b, confidence in matchmaker.confidences()
+    }
+    assert confidences[("A", matchmaker.ranking()[1])] > 0.9
+    pairs = matchmaker.next_pairs()
+    assert len(pairs) == 1 and set(pairs[0]) == {"B", "C"}
+    tasks = matchmaker.next_tasks()
+    assert len(tasks) == 4
+    assert [task[2] for task in tasks] == [True, False, True, False]
+    assert len({task[3] for task in tasks}) == 4
+
+
+def test_matchmaker_run():
+    matchmaker = matchmaking.Matchmaker(
+        "ConnectFour", ["Bot", "Candid"], max_games=200, processes=0,
+    )
+    assert matchmaker.run() == ["Candid", "Bot"]
+    assert matchmaker.ranking_confidence() >= 0.95
+    assert matchmaker.games < 200
+
+    # Max games bounds entrants of same strength
+    matchmaker = matchmaking.Matchmaker(
+        "TicTacToe", ["Bot", "Candid"], confidence=1., max_games=20,
+        games_per_pair=6, processes=2,
+    )
+    matchmaker.run()
+    assert matchmaker.games == 20
@@ -0,0 +1,142 @@
+import os
+import threading
+import urllib.request
+
+import pytest
+
+from olgaming import metrics
+from olgaming.gameobj import GameObject
+from olgaming.games import TicTacToe
+from olgaming.players import Candid
+from olgaming.sinks import NullSink
+
+
+TMP_PATH = "tmp_metrics.prom"
+
+
+def teardown_function(function):
+    GameObject.reset_counter()
+    if os.path.exists(TMP_PATH):
+        os.remove(TMP_PATH)
+
+
+def test_counter():
+    registry = metrics.Registry()
+    counter = metrics.Counter("hits_total", "Hits.", ("kind",), registry)
+    with pytest.raises(ValueError):
+        metrics.Counter("hits_total", "Hits.", registry=registry)
+
+    def hit():
+        for _ in range(1000):
+            counter.inc(labels=("a",))
+        counter.inc(2, ("b",))
+
+    threads = [threading.Thread(target=hit) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.value(("a",)) == 4000
+    assert counter.values() == {("a",): 4000, ("b",): 8}
+    assert registry.exposition() == (
+        "# HELP hits_total Hits.\n"
+        "# TYPE hits_total counter\n"
+        "hits_total{kind=\"a\"} 4000\n"
+        "hits_total{kind=\"b\"} 8\n"
+    )
+
+
+def test_collect_while_recording():
+    registry = metrics.Registry()
+    counter = metrics.Counter("keys_total", "Keys.", ("key",), registry)
+    histogram = metrics.Histogram(
+        "keys", "Keys.", ("key",), registry, buckets=(1,)
+    )
+
+    def record(start):
+        for key in range(start, 8000, 4):
+            counter.inc(labels=(key,))
+            histogram.observe(1, (key,))
+
+    threads = [
+        threading.Thread(target=record, args=(start,)) for start in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        counter.values()
+        histogram.values()
+    for thread in threads:
+        thread.join()
+    assert len(counter.values()) == 8000
+    assert histogram.count((7999,)) == 1
+
+
+def test_gauge_histogram():
+    registry = metrics.Registry()
+    gauge = metrics.Gauge("size", "Size.", registry=registry)
+    gauge.set(3)
+    assert gauge.value() == 3
+    histogram = metrics.Histogram(
+        "latency", "Latency.", registry=registry, buckets=(1, 2)
+    )
+    for value in [.5, 1, 1.5, 3]:
+        histogram.observe(value)
+    assert histogram.count() == 4
+    assert registry.exposition().splitlines()[-5:] == [
+        "latency_bucket{le=\"1\"} 2",
+        "latency_bucket{le=\"2\"} 3",
+        "latency_bucket{le=\"+Inf\"} 4",
+        "latency_sum 6.0",
+        "latency_count 4",
+    ]
+
+
+def test_game_metrics():
+    labels = ("TicTacToe",)
+    started = metrics.GAMES_STARTED.value(labels)
+    turns = metrics.TURNS.value(labels)
+    observed = metrics.TURN_SECONDS.count(labels)
+    game = TicTacToe(
+        players=[Candid(index, loglvl="ERROR") for index in range(2)],
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+    game.play()
+    assert metrics.GAMES_STARTED.value(labels) == started + 1
+    assert metrics.GAMES_FINISHED.value(labels) >= 1
+    assert metrics.TURNS.value(labels) == turns + 7
+    assert metrics.TURN_SECONDS.count(labels) == observed + 7
+    assert metrics.OBJECTS.value(("Candid",)) == 2
+
+    # Games played turn by turn, or forfeited, are counted too
+    finished = metrics.GAMES_FINISHED.value(labels)
+    for forfeit in [False, True]:
+        game = TicTacToe(
+            players=[Candid(index, loglvl="ERROR") for index in range(2)],
+            sink=NullSink(),
+            loglvl="ERROR",
+        )
+        game.turn()
+        if forfeit:
+            game.forfeit(game.player)
+        while not game.is_over():
+            game.turn()
+    assert metrics.GAMES_STARTED.value(labels) == started + 3
+    assert metrics.GAMES_FINISHED.value(labels) == finished + 2
+
+    metrics.REGISTRY.dump(TMP_PATH)
+    with open(TMP_PATH) as file:
+        text = file.read()
+    assert "olgaming_objects{cls=\"Candid\"} 6" in text
+
+    server = metrics.REGISTRY.serve(port=0)
+    try:
+        url = "http://127.0.0.1:%s/metrics" % server.server_address[1]
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert "olgaming_turns_total{game=\"TicTacToe\"}" in body
+    assert "# TYPE olgaming_turn_seconds histogram" in body
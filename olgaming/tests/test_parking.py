@@ -0,0 +1,146 @@
+import logging
+
+from olgaming import parking
+from olgaming.clock import TimeControl
+from olgaming.games import ConnectFour, Dummy, TicTacToe
+from olgaming.players import Human
+from olgaming.sinks import NullSink
+
+
+def play(game, actions):
+    for action in actions:
+        game.act(action)
+        game.next()
+
+
+def test_pack_status():
+    for status in [
+        {'player': 0, 'over': False, 'winners': []},
+        {'player': 1, 'over': True, 'winners': [1]},
+        {'player': 2, 'over': True, 'winners': [0, 2]},
+    ]:
+        code = parking.pack_status(status, 3)
+        assert parking.unpack_status(code, 3) == status
+    assert parking.pack_status(
+        {'player': 1, 'over': True, 'winners': [0]}, 2
+    ) < 256
+
+
+def test_player_pool():
+    pool = parking.PlayerPool(loglvl="ERROR")
+    players = pool.seats(TicTacToe, Human)
+    assert [player.index for player in players] == [0, 1]
+    assert pool.seats(TicTacToe, Human) == players
+    assert pool.get(Human, 0, identity="other") is not players[0]
+    assert len(pool) == 3
+
+
+def test_park():
+    pool = parking.PlayerPool(loglvl="ERROR")
+    for game_cls, actions in [
+        (TicTacToe, ["4", "0", "8"]),
+        (ConnectFour, ["3", "3", "4", "0", "5"]),
+        (Dummy, ["1", "3"]),
+    ]:
+        game = game_cls(
+            players=pool.seats(game_cls, Human), sink=NullSink(),
+            loglvl="ERROR",
+        )
+        play(game, actions)
+        state, status, name = game.state(), game.status(), game.name
+        av_actions = game.av_actions()
+
+        parked = game.park()
+        assert not hasattr(parked, '__dict__')
+        assert name not in logging.Logger.manager.loggerDict
+        assert parked.extra is None
+
+        game = parked.unpark(sink=NullSink(), loglvl="ERROR")
+        assert game.name == name
+        assert game.state() == state
+        assert game.status() == status
+        assert game.av_actions() == av_actions
+        assert game.players == pool.seats(game_cls, Human)
+
+    # Game can go on after unparking
+    game = TicTacToe(bots=[0, 1], sink=NullSink(), loglvl="ERROR")
+    play(game, ["0", "3", "1", "4"])
+    game = game.park().unpark(sink=NullSink(), loglvl="ERROR")
+    play(game, ["2"])
+    assert game.is_over() and game.winners == [game.players[0]]
+
+    # Non default attributes are kept
+    game = ConnectFour(
+        bots=[0, 1], rewards={'win': 1}, sink=NullSink(), loglvl="ERROR",
+        time_control=TimeControl(per_game=10),
+    )
+    game._clocks = [4., 5.]
+    record = game.start_record()
+    play(game, ["0", "1"])
+    parked = game.park()
+    assert set(parked.extra) == {'rewards', 'time_control', 'clocks',
+                                 'record'}
+    game = parked.unpark(sink=NullSink(), loglvl="ERROR")
+    assert game.rewards['win'] == 1
+    assert game.status()['clocks'] == [4., 5.]
+    assert game.record is record
+
+
+def test_benchmark():
+    report = parking.benchmark(TicTacToe, n=200)
+    assert report['games'] == 200
+    assert report['ratio'] >= 5
+
+
+def test_park_episode():
+    from olgaming.players import Candid
+
+    class Learner(Candid):
+
+        delivery = "episode"
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.episodes = []
+
+        def take_episode(self, consequences):
+            self.episodes.append(consequences)
+
+    players = [Learner(0, loglvl="ERROR"), Candid(1, loglvl="ERROR")]
+    game = TicTacToe(players=players, sink=NullSink(), loglvl="ERROR")
+    game.turn()
+    game.turn()
+    game = game.park().unpark(sink=NullSink(), loglvl="ERROR")
+    game.play()
+    rewards = game.rewards
+    assert players[0].episodes == [
+        [rewards['neutral']] * 6 + [rewards['win']]
+    ]
+
+
+def test_shared_players_sink():
+    from olgaming.player import Player
+    from olgaming.sinks import MemorySink
+
+    class Talker(Player):
+
+        def action(self, gstate, actions=None):
+            self.sink.write("%s plays" % self)
+            return actions[0]
+
+        def take(self, consequence):
+            self.sink.write("%s takes" % self)
+
+    pool = parking.PlayerPool(loglvl="ERROR")
+    sinks = [MemorySink(), MemorySink()]
+    games = [
+        TicTacToe(players=pool.seats(TicTacToe, Talker), sink=sink,
+                  loglvl="ERROR")
+        for sink in sinks
+    ]
+    games[0].turn()
+    games[1].turn()
+    games[0].turn()
+    for sink, turns in zip(sinks, [2, 1]):
+        lines = [line for line in sink.lines if line.startswith("Talker")]
+        assert len(lines) == 3 * turns
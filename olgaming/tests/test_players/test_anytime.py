@@ -0,0 +1,28 @@
+import time
+
+from olgaming.player import Player
+from olgaming.players import anytime
+
+
+class Counter(anytime.Anytime):
+    """Yield actions one after the other, slowly."""
+
+    def search(self, gstate, actions):
+        for action in actions:
+            time.sleep(0.02)
+            yield action
+
+
+def test_anytime():
+
+    player = Counter(index=0)
+    assert isinstance(player, Player)
+
+    assert player.action("gstate", actions=[1, 2, 3, 4]) == 4
+    assert player.timed_action("gstate", actions=[1, 2, 3, 4]) == 4
+
+    deadline = time.monotonic() + 0.05
+    assert player.timed_action(
+        "gstate", actions=list(range(100)), deadline=deadline
+    ) in [1, 2, 3]
+    assert time.monotonic() < deadline + 0.05
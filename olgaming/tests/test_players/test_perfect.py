@@ -0,0 +1,41 @@
+import os
+import random
+import shutil
+
+from olgaming.games import TicTacToe
+from olgaming.players import Bot
+from olgaming.players.perfect import PerfectPlayer
+from olgaming.sinks import NullSink
+from olgaming.solver import Solver
+
+
+TMP_DIR = "tmp"
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def test_perfect_player():
+    Solver(TicTacToe, TMP_DIR, processes=0).solve()
+
+    random.seed(0)
+    for game_index in range(20):
+        perfect = PerfectPlayer(game_index % 2, TMP_DIR, loglvl="ERROR")
+        players = [perfect, Bot(1 - perfect.index, loglvl="ERROR")]
+        players.sort(key=lambda player: player.index)
+        game = TicTacToe(players=players, sink=NullSink(), loglvl="ERROR")
+        game.play()
+        assert game.winners in [[], [perfect]]
+
+    game = TicTacToe(
+        players=[
+            PerfectPlayer(index, TMP_DIR, loglvl="ERROR")
+            for index in range(2)
+        ],
+        sink=NullSink(),
+        loglvl="ERROR",
+    )
+    game.play()
+    assert game.winners == []
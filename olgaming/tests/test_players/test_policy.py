@@ -0,0 +1,28 @@
+from random import seed
+
+from olgaming.player import Player
+from olgaming.players import policy
+
+
+class FakeClient(object):
+
+    def evaluate(self, observation):
+        return observation
+
+
+def test_policy_player():
+
+    player = policy.PolicyPlayer(
+        index=1,
+        client=FakeClient(),
+        encode=lambda gstate, index: gstate,
+        all_actions=["a", "b", "c"],
+    )
+    assert isinstance(player, Player)
+    assert player.action([1, 3, 2], actions=["a", "b", "c"]) == "b"
+    assert player.action([1, 3, 2], actions=["a", "c"]) == "c"
+
+    player.greedy = False
+    seed(1)
+    picks = [player.action([0, 0, 20], actions=["a", "c"]) for _ in range(20)]
+    assert picks == ["c"] * 20
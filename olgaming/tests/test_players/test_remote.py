@@ -0,0 +1,106 @@
+import time
+
+import pytest
+
+from olgaming.gameobj import GameObject
+from olgaming.games import TicTacToe
+from olgaming.player import Player
+from olgaming.players.remote import (
+    ACTION, RemoteError, RemotePlayer, WorkerPool, pack, unpack,
+)
+from olgaming.sinks import NullSink
+
+
+class Faulty(Player):
+
+    def action(self, gstate, actions=None):
+        raise ValueError("no move")
+
+
+class Slow(Player):
+
+    def action(self, gstate, actions=None):
+        if actions == ["slow"]:
+            time.sleep(.5)
+        return actions[0]
+
+
+def teardown_function(function):
+    GameObject.reset_counter()
+
+
+def test_protocol():
+    assert unpack(pack(ACTION, 7, ([None], ["1"]), 3)) == (
+        ACTION, 7, 3, ([None], ["1"])
+    )
+
+
+def test_remote_player():
+    with WorkerPool(workers=2) as pool:
+        for _ in range(3):
+            players = [
+                RemotePlayer(
+                    index, "Candid", pool,
+                    p_params={'loglvl': "ERROR"}, loglvl="ERROR",
+                )
+                for index in range(2)
+            ]
+            game = TicTacToe(players=players, sink=NullSink(), loglvl="ERROR")
+            game.play()
+            assert game.winners == [players[0]]
+            for player in players:
+                player.close()
+        assert len(pool) == 0
+
+        players = [
+            RemotePlayer(index, "Bot", pool, p_params={'loglvl': "ERROR"})
+            for index in range(4)
+        ]
+        assert len(pool) == 4
+        assert all(
+            sum(owner is worker for owner, _ in pool._players.values()) == 2
+            for worker in pool.workers
+        )
+
+
+def test_remote_errors():
+    with WorkerPool(workers=1) as pool:
+        with pytest.raises(RemoteError):
+            RemotePlayer(0, "Unknown", pool)
+
+        faulty = RemotePlayer(0, Faulty, pool, p_params={'loglvl': "ERROR"})
+        with pytest.raises(RemoteError, match="no move"):
+            faulty.action([None] * 9, ["1"])
+        assert pool.workers[0].restarts == 0
+
+
+def test_restart():
+    with WorkerPool(workers=2) as pool:
+        players = [
+            RemotePlayer(index, "Candid", pool, p_params={'loglvl': "ERROR"})
+            for index in range(2)
+        ]
+        assert pool.check() == 0
+
+        worker = pool.workers[0]
+        worker.process.kill()
+        worker.process.join()
+        assert pool.check() == 1
+        assert worker.restarts == 1
+        assert players[0].action([None] * 9, ["3", "4"]) == "3"
+
+        worker.process.kill()
+        worker.process.join()
+        assert players[0].action([None] * 9, ["4"]) == "4"
+        assert worker.restarts == 2
+
+
+def test_late_answer():
+    with WorkerPool(workers=1, timeout=.2) as pool:
+        player = RemotePlayer(0, Slow, pool, p_params={'loglvl': "ERROR"})
+        with pytest.raises(RemoteError):
+            player.action([None] * 9, ["slow"])
+        assert player.action([None] * 9, ["5"]) == "5"
+        assert player.action([None] * 9, ["6"]) == "6"
+        assert pool.check() == 0
+        assert player.action([None] * 9, ["7"]) == "7"
@@ -0,0 +1,41 @@
+import io
+import os
+import pytest
+import shutil
+
+from olgaming.player import Player
+from olgaming.players import scripted
+
+
+TMP_DIR = "tmp"
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def test_scripted():
+
+    player = scripted.Scripted(index=1, script=["1", "2"])
+    assert isinstance(player, Player)
+    assert player.requires_visual is False
+    assert player.action("gstate", actions=["1", "2"]) == "1"
+    assert player.action("gstate", actions=["2"]) == "2"
+    with pytest.raises(EOFError):
+        player.action("gstate", actions=["2"])
+
+    player = scripted.Scripted(
+        index=0, script=io.StringIO("a\nb\r\n"), requires_visual=True
+    )
+    assert player.requires_visual is True
+    assert [player.action("gstate"), player.action("gstate")] == ["a", "b"]
+
+    os.makedirs(TMP_DIR)
+    path = os.path.join(TMP_DIR, "script.txt")
+    with open(path, "w") as file:
+        file.write("4\n5\n")
+    player = scripted.Scripted(index=0, script=path)
+    assert [player.action("gstate"), player.action("gstate")] == ["4", "5"]
+    with pytest.raises(EOFError):
+        player.action("gstate")
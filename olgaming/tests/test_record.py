@@ -0,0 +1,109 @@
+import os
+import pytest
+import shutil
+
+from olgaming import game as game_module
+from olgaming import record
+from olgaming.games import ConnectFour, Dummy, TicTacToe
+from olgaming.players import Candid, Scripted
+
+
+# --------------------------------------------------------------------------- #
+# Parameters
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_record_tictactoe():
+
+    game = TicTacToe(
+        players=[Candid(0), Candid(1)],
+        rewards={'win': 7},
+        loglvl="ERROR",
+    )
+    grecord = game.start_record(keyframe=3)
+    game.play()
+
+    assert len(grecord) == 7
+    assert list(grecord.codes) == [0, 1, 2, 3, 4, 5, 6]
+    assert sorted(grecord.keyframes) == [0, 3, 6]
+
+    # ---- Seek any ply
+    assert grecord.seek(0).state() == [None] * 9
+    game_3 = grecord.seek(3)
+    assert game_3.state() == [0, 1, 0] + [None] * 6
+    assert game_3.status() == {'player': 1, 'over': False, 'winners': []}
+    assert game_3.rewards['win'] == 7
+
+    game_7 = grecord.seek(7)
+    assert game_7.state() == game.state()
+    assert game_7.status() == game.status()
+
+    with pytest.raises(IndexError):
+        grecord.seek(8)
+
+    # ---- Save / Load
+    save_dir = os.path.join(TMP_DIR, "test_record")
+    game.save(save_dir)
+    ngame = TicTacToe(loglvl="ERROR")
+    ngame.load(save_dir)
+    assert ngame.state() == game.state()
+    assert list(ngame.record.codes) == list(grecord.codes)
+    assert ngame.record.seek(5).state() == grecord.seek(5).state()
+
+
+def test_record_non_canonical():
+
+    game = ConnectFour(
+        players=[Scripted(0, ["3 ", "03"]), Scripted(1, [3, "x"])],
+        loglvl="ERROR",
+    )
+    grecord = game.start_record()
+    assert game.turn() and game.turn() and game.turn()
+    assert list(grecord.codes) == [3, 3, 3]
+    assert game.status()['player'] == 1
+
+    # ---- Action without code: game unchanged
+    state = game.state()
+    assert not game.turn()
+    assert game.state() == state
+    assert game.status()['player'] == 1
+    assert len(grecord) == 3
+    assert grecord.seek(3).state() == state
+
+    with pytest.raises(game_module.InvalidAction):
+        grecord.add(game, game.encode_action("3 "))
+
+
+def test_record_dummy():
+
+    game = Dummy(loglvl="ERROR")
+    grecord = record.GameRecord.start(game, keyframe=2)
+    for action in ["3", "1", "4", "2"]:
+        game.act(action)
+        game.next()
+        grecord.add(game, game.encode_action(action))
+
+    assert grecord.game_cls() is Dummy
+    assert list(grecord.codes) == [2, 0, 3, 1]
+    assert grecord.seek(3).state() == {'msg_sent': 3}
+    assert grecord.seek(4).status() == game.status()
+
+    with pytest.raises(ValueError):
+        record.GameRecord("Dummy", {}, 2, keyframe=0)
@@ -0,0 +1,45 @@
+import pytest
+import subprocess
+import sys
+
+from olgaming import registry
+
+
+def test_registry():
+
+    assert registry.game_names()[:3] == ["ConnectFour", "Dummy", "TicTacToe"]
+    assert "Candid" in registry.player_names()
+
+    from olgaming.games.dummy.dummy import Dummy
+    from olgaming.players.candid import Candid
+    assert registry.get_game("Dummy") is Dummy
+    assert registry.get_player("Candid") is Candid
+
+    with pytest.raises(KeyError):
+        registry.get_game("Unexistant")
+
+    registry.register_player("Random", "olgaming.players.bot:Bot")
+    try:
+        assert registry.get_player("Random") is registry.get_player("Bot")
+        assert "Random" in registry.player_names()
+    finally:
+        del registry.PLAYERS["Random"]
+
+
+def test_lazy_imports():
+
+    from olgaming import games, players
+    assert games.Dummy is registry.get_game("Dummy")
+    assert players.Bot is registry.get_player("Bot")
+    with pytest.raises(AttributeError):
+        games.Unexistant
+
+    # Importing package does not import games nor players
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        "import sys, olgaming, olgaming.games, olgaming.players;"
+        "print(sorted(name for name in sys.modules if 'olgaming.' in name))"
+    ])
+    assert output.decode().strip() == (
+        "['olgaming.games', 'olgaming.players', 'olgaming.registry']"
+    )
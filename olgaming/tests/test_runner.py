@@ -0,0 +1,28 @@
+from olgaming import runner
+from olgaming.players import Candid
+from olgaming.sinks import NullSink
+
+
+def test_build_game():
+
+    game = runner.build_game(
+        "TicTacToe", players=["Candid", "Bot"], rewards={'win': 1},
+    )
+    assert isinstance(game.players[0], Candid)
+    assert game.rewards['win'] == 1
+    assert game.get_loglvl(explicit=True) == runner.LOGLVL
+    assert isinstance(game.sink, NullSink)
+
+
+def test_play_match():
+
+    assert runner.play_match("TicTacToe", players=["Candid", "Candid"]) == {
+        'over': True,
+        'winners': [0],
+        'rewards': [5, -10],
+        'turns': 7,
+    }
+    assert (
+        runner.play_match("TicTacToe", seed=3)
+        == runner.play_match("TicTacToe", seed=3)
+    )
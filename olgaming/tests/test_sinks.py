@@ -0,0 +1,56 @@
+import io
+
+from olgaming import sinks
+from olgaming.games import Dummy, TicTacToe
+from olgaming.players import human
+
+
+def test_sinks():
+
+    sink = sinks.NullSink()
+    sink.write("nothing")
+    sink.close()
+
+    sink = sinks.MemorySink()
+    sink.write("line 1")
+    sink.write("line", end=" ")
+    sink.write("2")
+    assert sink.getvalue() == "line 1\nline 2\n"
+    assert sink.lines == ["line 1", "line 2"]
+    sink.clear()
+    assert sink.lines == []
+
+    stream = io.StringIO()
+    sink = sinks.StreamSink(stream, buffer_size=10)
+    sink.write("12345")
+    assert stream.getvalue() == ""
+    sink.write("6789")
+    assert stream.getvalue() == "12345\n6789\n"
+    sink.write("end")
+    sink.close()
+    assert stream.getvalue() == "12345\n6789\nend\n"
+
+
+def test_game_sink():
+
+    sink = sinks.MemorySink()
+    game = Dummy(bots=[1], sink=sink, loglvl="ERROR")
+    assert all(player.sink is sink for player in game.players)
+
+    human.input = lambda x: "2"
+    game.play()
+    assert sink.lines == [
+        "# This is a dummy game.",
+        "# Available option are: 1, 2, 3, 4",
+        "> Human_%s action ? Human_%s : bye" % (
+            game.players[0]._id, game.players[0]._id
+        ),
+    ]
+
+    sink = sinks.MemorySink()
+    game = TicTacToe(sink=sink, loglvl="ERROR")
+    game.display()
+    assert sink.lines[0] == "+---+---+---+"
+    assert sink.lines[-1] == (
+        "# Available option are: 0, 1, 2, 3, 4, 5, 6, 7, 8"
+    )
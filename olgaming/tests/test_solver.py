@@ -0,0 +1,66 @@
+import os
+import shutil
+
+import numpy
+import pytest
+
+from olgaming import solver
+from olgaming.games import Dummy, TicTacToe
+
+
+TMP_DIR = "tmp"
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def test_better():
+    assert solver.better(1, 5, 0, 1)
+    assert solver.better(1, 3, 1, 5)        # Faster win
+    assert solver.better(-1, 5, -1, 3)      # Slower loss
+    assert not solver.better(0, 3, 0, 3)
+
+
+def test_solver():
+    with pytest.raises(ValueError):
+        solver.Solver(Dummy.__class__("Trio", (Dummy,), {'players_n': 3}),
+                      TMP_DIR)
+
+    path = os.path.join(TMP_DIR, "tictactoe")
+    database = solver.Solver(TicTacToe, path, processes=0).solve()
+    assert len(database) == 4520    # Non terminal positions
+    assert [len(layer) for layer in database.layers] == [
+        1, 9, 72, 252, 756, 1140, 1372, 696, 222
+    ]
+    assert not [name for name in os.listdir(path) if name.endswith(".pos")]
+
+    empty = [None] * 9
+    assert database.value(empty, 0) == (0, 9)
+    assert database.value(tuple(empty), 0) == (0, 9)    # State view
+
+    # Player 0 wins by playing 2
+    state = [0, 0, None, 1, 1, None, None, None, None]
+    assert database.value(state, 0) == (1, 1)
+    assert database.best_action(state, 0) == "2"
+    with pytest.raises(KeyError):
+        database.value(state, 1)    # Not reachable
+
+    # Player 1 wins by playing 5
+    state[8] = 0
+    assert database.value(state, 1) == (1, 1)
+    assert database.best_action(state, 1) == "5"
+    assert database.best_action(state, 1, actions=["6", "7"]) in ["6", "7"]
+
+    # Database can be reopened, same values with a pool and small chunks
+    other = solver.Solver(
+        "TicTacToe", os.path.join(TMP_DIR, "pool"), processes=2,
+        chunk_size=100,
+    ).solve()
+    reopened = solver.SolutionDB(path)
+    assert reopened.game_cls.__name__ == "TicTacToe"
+    for layer, other_layer in zip(reopened.layers, other.layers):
+        assert numpy.array_equal(layer.keys, other_layer.keys)
+        assert numpy.array_equal(layer.values, other_layer.values)
+        assert numpy.array_equal(layer.plies, other_layer.plies)
@@ -0,0 +1,59 @@
+import pytest
+
+from olgaming import sprt
+
+
+def test_elo():
+    assert sprt.elo_score(0) == pytest.approx(0.5)
+    assert sprt.elo_score(400) == pytest.approx(10 / 11)
+    assert sprt.score_elo(sprt.elo_score(120)) == pytest.approx(120)
+
+
+def test_llr():
+    assert sprt.llr(0, 0, 0, 0, 10) == 0
+    assert sprt.llr(60, 10, 30, 0, 10) > 0
+    assert sprt.llr(30, 10, 60, 0, 10) < 0
+    assert sprt.llr(10, 0, 0, 0, 10) > 0      # No null variance
+
+
+def test_sprt_record():
+    with pytest.raises(ValueError):
+        sprt.SPRT("ConnectFour", "Candid", "Bot", elo0=10, elo1=0)
+
+    test = sprt.SPRT("ConnectFour", "Candid", "Bot", elo0=0, elo1=50,
+                     batch_size=4)
+    assert test.result() is None
+    tasks = test.next_tasks()
+    assert [task[2] for task in tasks] == [True, False, True, False]
+    assert [task[3] for task in tasks] == [0, 1, 2, 3]
+    assert test.next_tasks()[0][3] == 4
+
+    for score in [1, 0.5, 0]:
+        test.record(score)
+    assert (test.wins, test.ties, test.losses) == (1, 1, 1)
+    report = test.report()
+    assert report['games'] == 3
+    assert report['result'] is None and report['confidence'] is None
+    assert report['elo'] == pytest.approx(0)
+
+
+def test_sprt_run():
+    report = sprt.SPRT(
+        "ConnectFour", "Candid", "Bot", elo0=0, elo1=50, processes=0,
+    ).run()
+    assert report['result'] == "H1"
+    assert report['confidence'] == 0.95
+    assert report['llr'] >= report['bounds'][1]
+
+    report = sprt.SPRT(
+        "ConnectFour", "Bot", "Candid", elo0=0, elo1=50, processes=2,
+        batch_size=8,
+    ).run()
+    assert report['result'] == "H0"
+    assert report['games'] < 200
+
+    report = sprt.SPRT(
+        "TicTacToe", "Bot", "Bot", max_games=10, processes=0,
+    ).run()
+    assert report['result'] is None
+    assert report['games'] == 10
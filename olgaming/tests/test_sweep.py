@@ -0,0 +1,89 @@
+import os
+import shutil
+
+import pytest
+
+from olgaming import sweep
+
+
+# --------------------------------------------------------------------------- #
+# Parameters
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_configurations():
+
+    assert sweep.unflatten({'a.b': 1, 'a.c': 2, 'd': 3}) == {
+        'a': {'b': 1, 'c': 2}, 'd': 3
+    }
+    assert sweep.grid({'rewards.win': [5, 10], 'players': [["Bot"]]}) == [
+        {'rewards': {'win': 5}, 'players': ["Bot"]},
+        {'rewards': {'win': 10}, 'players': ["Bot"]},
+    ]
+
+    space = {
+        'rewards.win': [1, 2, 3],
+        'rewards.lose': lambda rand: -rand.random(),
+    }
+    configs = sweep.sample(space, n=4, seed=2)
+    assert len(configs) == 4
+    assert all(config['rewards']['win'] in [1, 2, 3] for config in configs)
+    assert all(-1 <= config['rewards']['lose'] <= 0 for config in configs)
+    assert configs == sweep.sample(space, n=4, seed=2)
+
+
+def test_sweep():
+
+    table_path = os.path.join(TMP_DIR, "sweep.csv")
+    configs = sweep.grid({
+        'rewards.win': [5, 10],
+        'players': [["Candid", "Candid"], ["Bot", "Bot"]],
+    })
+    with pytest.raises(ValueError):
+        sweep.Sweep("TicTacToe", table_path, games=0)
+    with pytest.raises(ValueError):
+        sweep.run_config(("key", "TicTacToe", configs[0], 0, 0))
+    tsweep = sweep.Sweep("TicTacToe", table_path, games=6, processes=2)
+    assert tsweep.run(configs) == 4
+    assert tsweep.run(configs) == 0
+
+    results = tsweep.results()
+    assert len(results) == 4
+    candid_results = [
+        row for row in results
+        if row['config']['players'] == ["Candid", "Candid"]
+    ]
+    for row in candid_results:
+        win = row['config']['rewards']['win']
+        assert row['games'] == 6
+        assert row['wins'] == [6, 0]
+        assert row['mean_rewards'] == [win, -10]
+
+    # ---- Same results in current process
+    other_sweep = sweep.Sweep(
+        "TicTacToe", os.path.join(TMP_DIR, "other.csv"), games=6, processes=0
+    )
+    other_sweep.run(configs + configs[:1])
+    assert sorted(
+        (row['key'], row['wins'], row['ties']) for row in results
+    ) == sorted(
+        (row['key'], row['wins'], row['ties'])
+        for row in other_sweep.results()
+    )
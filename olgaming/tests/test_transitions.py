@@ -0,0 +1,120 @@
+import multiprocessing
+import random
+
+from olgaming.games import Dummy, TicTacToe
+from olgaming.sinks import NullSink
+from olgaming.transitions import (
+    SharedTransitionTable,
+    TransitionCache,
+    state_delta,
+)
+
+
+def new_game(cache=None):
+    return TicTacToe(
+        bots=[0, 1], sink=NullSink(), transition_cache=cache, loglvl="ERROR",
+    )
+
+
+def rollout(game, seed):
+    """Play random game, return states and consequences of every turn."""
+    rand = random.Random(seed)
+    history = []
+    while not game.is_over():
+        consequences = game.act(rand.choice(game.av_actions()))
+        history.append((game.state(), game.status(), consequences))
+        game.next()
+    return history
+
+
+def test_state_delta():
+    assert state_delta([None, 1, None], [0, 1, None]) == ("delta", ((0, 0),))
+    assert state_delta([], [1]) == ("full", [1])
+    assert state_delta({'a': 1}, {'a': 2}) == ("full", {'a': 2})
+
+
+def test_transition_cache():
+    cache = TransitionCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)       # Drops b, least recently used
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+def test_game_transition_cache():
+    cache = TransitionCache()
+    for seed in range(20):
+        expected = rollout(new_game(), seed)
+        assert rollout(new_game(cache), seed) == expected
+        assert rollout(new_game(cache), seed) == expected
+    assert cache.hits > cache.misses
+
+    # Cached transitions deliver same consequences in play
+    game = new_game(cache)
+    game.play()
+    assert game.is_over()
+    assert game.state_view() == tuple(game.state())
+
+    # Dft key and delta for games without hashable view
+    cache = TransitionCache()
+    for _ in range(2):
+        game = Dummy(bots=[0, 1], sink=NullSink(), transition_cache=cache,
+                     loglvl="ERROR")
+        game.act("2")
+        assert game.is_over()
+        assert game.winners == [game.players[0]]
+    assert cache.hits == 1
+
+
+def fill(table, seed, results):
+    table.hits = table.misses = 0
+    rollout(new_game(table), seed)
+    results.put((table.hits, table.misses))
+
+
+def test_shared_transition_table():
+    table = SharedTransitionTable(slots=1024)
+    try:
+        expected = rollout(new_game(), 0)
+        assert rollout(new_game(table), 0) == expected
+        assert table.hits == 0
+
+        # Other process finds transitions stored
+        results = multiprocessing.Queue()
+        process = multiprocessing.Process(
+            target=fill, args=(table, 0, results)
+        )
+        process.start()
+        hits, misses = results.get(timeout=30)
+        process.join()
+        assert misses == 0
+        assert hits == len(expected)
+
+        # Too big transitions are not stored
+        small = SharedTransitionTable(slots=8, slot_size=16)
+        small.put("key", "value" * 10)
+        assert small.get("key") is None
+        small.close()
+    finally:
+        table.close()
+
+
+def test_transition_cache_rewards():
+    cache = TransitionCache()
+    rewards = []
+    for game_rewards in [None, {'win': 100}]:
+        game = TicTacToe(
+            bots=[0, 1], sink=NullSink(), transition_cache=cache,
+            rewards=game_rewards, loglvl="ERROR",
+        )
+        for action in ["0", "3", "1", "4"]:
+            game.act(action)
+            game.next()
+        rewards.append(game.act("2")[0])
+    assert rewards == [TicTacToe.dft_rewards['win'], 100]
@@ -0,0 +1,69 @@
+import numpy
+import pytest
+
+from olgaming.gameobj import GameObject
+from olgaming.games import TicTacToe
+from olgaming.vecenv import VecEnv
+
+
+def teardown_function(function):
+    GameObject.reset_counter()
+
+
+def test_vecenv_tictactoe():
+    with VecEnv("TicTacToe", n_envs=5, workers=2) as env:
+        assert len(env) == 5
+        assert env.n_actions == 9
+        observations, masks = env.reset()
+        assert observations.shape == (5, 3, 3, 3)
+        assert masks.all()
+
+        # Player 0 fills top row while player 1 plays middle row
+        for move, (action, done) in enumerate(
+            [(0, False), (3, False), (1, False), (4, False), (2, True)]
+        ):
+            observations, rewards, dones, masks = env.step([action] * 5)
+            assert (dones == done).all()
+            assert not env.arrays['invalid'].any()
+            if not done:
+                assert not masks[:, action].any()
+                assert (env.arrays['players'] == (move + 1) % 2).all()
+        assert rewards.tolist() == [
+            [TicTacToe.dft_rewards['win'], TicTacToe.dft_rewards['lose']]
+        ] * 5
+        assert masks.all()
+        assert not observations[:, :2].any()
+
+        # Async step with an invalid action in one game
+        env.step_async([0, 0, 0, 0, 9])
+        observations, rewards, dones, masks = env.step_wait()
+        assert env.arrays['invalid'].tolist() == [False] * 4 + [True]
+        assert masks[:4, 0].sum() == 0 and masks[4].all()
+        env.step([0, 1, 1, 1, 1])
+        assert env.arrays['invalid'].tolist() == [True] + [False] * 4
+
+        # Codes out of range, at both ends
+        env.step([-1, -9, 9, 2, 2])
+        assert env.arrays['invalid'].tolist() == [True] * 3 + [False] * 2
+
+
+def test_vecenv_random_games():
+    rand = numpy.random.RandomState(0)
+    with VecEnv("TicTacToe", n_envs=8, workers=3) as env:
+        _, masks = env.reset()
+        games = 0
+        for _ in range(100):
+            actions = [rand.choice(numpy.flatnonzero(mask)) for mask in masks]
+            _, _, dones, masks = env.step(actions)
+            assert not env.arrays['invalid'].any()
+            games += dones.sum()
+        assert games >= 8 * 100 // 9
+
+
+def test_vecenv_errors():
+    with pytest.raises(NotImplementedError):
+        VecEnv(GameWithoutObservation, n_envs=1)
+
+
+class GameWithoutObservation(TicTacToe):
+    obs_shape = None
@@ -0,0 +1,162 @@
+"""Caches of transitions for deterministic games.
+
+A transition maps (state key, current player, action) to what act does: the
+change of state (delta), the end of game flag, the winners and the
+consequences. Caches are opt-in (see Game transition_cache argument) and only
+make sense for games whose act is deterministic and has no side effect.
+
+    - TransitionCache:          bounded LRU dict, local to a process
+    - SharedTransitionTable:    fixed size table in shared memory, readable and
+                                writable by several processes
+"""
+import pickle
+import struct
+from collections import OrderedDict
+
+
+MAXSIZE = 100000
+
+
+def state_delta(before, after):
+    """Return delta from state before to state after.
+
+    Returns:
+        (tuple) ("delta", ((index, value), ...)) for lists of same length,
+            ("full", after) otherwise
+    """
+    if (
+        isinstance(before, list) and isinstance(after, list)
+        and len(before) == len(after)
+    ):
+        return "delta", tuple(
+            (index, value)
+            for index, (previous, value) in enumerate(zip(before, after))
+            if previous != value
+        )
+    return "full", after
+
+
+class TransitionCache(object):
+    """Bounded LRU cache of transitions."""
+
+    def __init__(self, maxsize=MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._transitions = OrderedDict()
+
+    def __len__(self):
+        return len(self._transitions)
+
+    def get(self, key):
+        """Return transition of key, None if unknown."""
+        try:
+            transition = self._transitions[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._transitions.move_to_end(key)
+        self.hits += 1
+        return transition
+
+    def put(self, key, transition):
+        """Store transition, dropping least recently used if cache is full."""
+        self._transitions[key] = transition
+        self._transitions.move_to_end(key)
+        if len(self._transitions) > self.maxsize:
+            self._transitions.popitem(last=False)
+
+
+class SharedTransitionTable(object):
+    """Table of transitions in shared memory.
+
+    Each key has a single possible slot (given by a hash of the key), a new
+    transition overwrites the one in its slot. A slot holds the pickled
+    (key, transition) and its checksum: reads overlapping a write of another
+    process fail the checksum and are misses.
+
+    Table is created by one process and attached by others with its name.
+    """
+
+    HEADER = struct.Struct("<I8s")     # Length and checksum of payload
+
+    def __init__(self, slots=MAXSIZE, slot_size=256, name=None):
+        """Create table, or attach existing one if name is given.
+
+        Args:
+            slots       (int):  number of slots
+            slot_size   (int):  bytes per slot, transitions that do not fit
+                are not stored
+            name        (str):  name of existing table to attach
+        """
+        from multiprocessing import shared_memory
+
+        self.slots = slots
+        self.slot_size = slot_size
+        self.hits = 0
+        self.misses = 0
+        self._owner = name is None
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(
+                create=True, size=slots * slot_size
+            )
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+    @property
+    def name(self):
+        """Return name of shared memory (to attach table in other process)."""
+        return self.shm.name
+
+    def __getstate__(self):
+        return {'slots': self.slots, 'slot_size': self.slot_size,
+                'name': self.shm.name}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @staticmethod
+    def checksum(payload):
+        """Return checksum of payload."""
+        import hashlib
+        return hashlib.blake2b(payload, digest_size=8).digest()
+
+    def _offset(self, key):
+        """Return offset of slot of key."""
+        digest = self.checksum(pickle.dumps(key, protocol=4))
+        return int.from_bytes(digest, "little") % self.slots * self.slot_size
+
+    def get(self, key):
+        """Return transition of key, None if unknown."""
+        offset = self._offset(key)
+        buf = self.shm.buf
+        length, checksum = self.HEADER.unpack_from(buf, offset)
+        start = offset + self.HEADER.size
+        if 0 < length <= self.slot_size - self.HEADER.size:
+            payload = bytes(buf[start:start + length])
+            if self.checksum(payload) == checksum:
+                stored_key, transition = pickle.loads(payload)
+                if stored_key == key:
+                    self.hits += 1
+                    return transition
+        self.misses += 1
+        return None
+
+    def put(self, key, transition):
+        """Store transition in slot of key (if it fits)."""
+        payload = pickle.dumps((key, transition), protocol=4)
+        if len(payload) > self.slot_size - self.HEADER.size:
+            return
+        offset = self._offset(key)
+        start = offset + self.HEADER.size
+        self.HEADER.pack_into(self.shm.buf, offset, 0, bytes(8))
+        self.shm.buf[start:start + len(payload)] = payload
+        self.HEADER.pack_into(
+            self.shm.buf, offset, len(payload), self.checksum(payload)
+        )
+
+    def close(self):
+        """Detach table, and release it if this process created it."""
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
@@ -0,0 +1,306 @@
+"""Vectorized environment: instances of a game stepped in worker processes.
+
+A VecEnv runs n_envs instances of any game with observations (see
+Game.encode) spread over worker processes. Actions, observations, rewards,
+end flags and masks of legal actions are exchanged through shared memory
+arrays with one row per game, pipes only carrying one byte commands.
+
+Actions are codes of actions (see Game.encode_action). A step of a game:
+    - plays action of the side to move (invalid actions leave the game
+      unchanged and set the invalid flag of the game)
+    - writes rewards of each player (see Game.dft_consequences)
+    - resets game when it is over (done flag set, observation being the one
+      of the new game)
+    - writes observation, side to move and mask of legal actions
+
+    >> with VecEnv("TicTacToe", n_envs=64, workers=4) as env:
+    >>     observations, masks = env.reset()
+    >>     observations, rewards, dones, masks = env.step(actions)
+
+Arrays returned are the shared arrays themselves: they are overwritten by the
+next step (copy them to keep them). step is step_async followed by step_wait,
+so that the caller can work while workers play.
+"""
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy
+
+from . import game as game_module
+
+
+STEP = b"s"
+RESET = b"r"
+CLOSE = b"c"
+
+
+def _array(shm, shape, dtype):
+    """Return numpy array using buffer of shared memory."""
+    return numpy.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def array_specs(game_cls, n_envs, dtype):
+    """Return (name, (shape, dtype)) dict of shared arrays."""
+    return {
+        'actions': ((n_envs,), "int64"),
+        'observations': ((n_envs,) + tuple(game_cls.obs_shape), dtype),
+        'rewards': ((n_envs, game_cls.players_n), "float32"),
+        'dones': ((n_envs,), "bool"),
+        'invalid': ((n_envs,), "bool"),
+        'players': ((n_envs,), "int8"),
+        'masks': ((n_envs, len(game_cls.action_list())), "bool"),
+    }
+
+
+def resolve(game):
+    """Return class of game given by name (see registry) or class."""
+    if isinstance(game, str):
+        from . import registry
+        return registry.get_game(game)
+    return game
+
+
+class GameSlots(object):
+    """Games of one worker and their rows of shared arrays."""
+
+    def __init__(self, game_cls, rows, arrays, g_params):
+        """Create games.
+
+        Args:
+            game_cls    (type):     class of game
+            rows        (range):    rows of games in shared arrays
+            arrays      (dict):     (name, array) dict of shared arrays
+            g_params    (dict):     key arguments of games
+        """
+        from .sinks import NullSink
+
+        params = {'sink': NullSink(), 'loglvl': "ERROR"}
+        params.update(g_params)
+        self.rows = rows
+        self.arrays = arrays
+        self.games = [game_cls(**params) for _ in rows]
+        self._start = (
+            self.games[0].pack_state(), self.games[0].status()
+        )
+
+    def reset_game(self, game):
+        """Set game back to its starting position."""
+        state, status = self._start
+        game.unpack_state(state)
+        game.invalidate_state()
+        game.load_status(status)
+
+    def write(self, row, game):
+        """Write observation, side to move and legal actions of game."""
+        game.encode(out=self.arrays['observations'][row])
+        self.arrays['players'][row] = game.player.index
+        mask = self.arrays['masks'][row]
+        mask[:] = False
+        for action in game.av_actions():
+            mask[game.encode_action(action)] = True
+
+    def reset(self):
+        """Reset all games."""
+        for row, game in zip(self.rows, self.games):
+            self.reset_game(game)
+            self.write(row, game)
+        self.arrays['rewards'][self.rows] = 0
+        self.arrays['dones'][self.rows] = False
+        self.arrays['invalid'][self.rows] = False
+
+    def step(self):
+        """Play actions of shared array in all games."""
+        arrays = self.arrays
+        for row, game in zip(self.rows, self.games):
+            arrays['dones'][row] = False
+            try:
+                game.act(game.decode_action(int(arrays['actions'][row])))
+            except game_module.InvalidAction:
+                arrays['invalid'][row] = True
+                arrays['rewards'][row] = 0
+                continue
+            arrays['invalid'][row] = False
+            arrays['rewards'][row] = game.dft_consequences()
+            if game.is_over():
+                arrays['dones'][row] = True
+                self.reset_game(game)
+            else:
+                game.next()
+            self.write(row, game)
+
+
+def step_loop(game, rows, names, specs, g_params, conn):
+    """Serve commands of connection for games of rows."""
+    shms = {
+        name: shared_memory.SharedMemory(name=shm_name)
+        for name, shm_name in names.items()
+    }
+    arrays = {name: _array(shms[name], *specs[name]) for name in names}
+    slots = GameSlots(resolve(game), rows, arrays, g_params)
+    while True:
+        try:
+            command = conn.recv_bytes()
+        except EOFError:
+            break
+        if command == CLOSE:
+            break
+        try:
+            if command == STEP:
+                slots.step()
+            elif command == RESET:
+                slots.reset()
+        except Exception as error:  # pylint: disable=W0703
+            conn.send_bytes(
+                ("%s: %s" % (type(error).__name__, error)).encode()
+            )
+            continue
+        conn.send_bytes(b"")
+
+    del slots, arrays
+    for shm in shms.values():
+        shm.close()
+
+
+class VecEnv(object):
+    """Instances of a game stepped in worker processes."""
+
+    def __init__(self, game, n_envs, workers=None, g_params=None,
+                 dtype="float32"):
+        """Allocate shared arrays and start workers.
+
+        Args:
+            game        (str or type):  name (see registry) or class of game,
+                game must define obs_shape and actions
+            n_envs      (int):          number of games
+            workers     (int):          number of worker processes, dft is
+                number of cpus (at most n_envs)
+            g_params    (dict):         key arguments of games
+            dtype       (str):          type of observations
+        """
+        game_cls = resolve(game)
+        if game_cls.obs_shape is None:
+            raise NotImplementedError(
+                "%s has no observation to encode" % game_cls.__name__
+            )
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        workers = max(1, min(workers, n_envs))
+
+        self.game_cls = game_cls
+        self.n_envs = n_envs
+        self.specs = array_specs(game_cls, n_envs, dtype)
+        self.shms = {}
+        self.arrays = {}
+        for name, (shape, array_dtype) in self.specs.items():
+            size = int(numpy.prod(shape)) * numpy.dtype(array_dtype).itemsize
+            self.shms[name] = shared_memory.SharedMemory(
+                create=True, size=max(size, 1)
+            )
+            self.arrays[name] = _array(self.shms[name], shape, array_dtype)
+
+        names = {name: shm.name for name, shm in self.shms.items()}
+        bounds = numpy.linspace(0, n_envs, workers + 1).astype(int)
+        self._conns = []
+        self._processes = []
+        self._waiting = False
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            conn, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=step_loop,
+                args=(
+                    game, range(start, stop), names, self.specs,
+                    {} if g_params is None else g_params, child,
+                ),
+            )
+            process.daemon = True
+            process.start()
+            child.close()
+            self._conns.append(conn)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.n_envs
+
+    @property
+    def n_actions(self):
+        """Return number of action codes."""
+        return self.specs['masks'][0][1]
+
+    # ----------------------------------------------------------------------- #
+    # Commands
+
+    def _send(self, command):
+        """Send command to all workers."""
+        for conn in self._conns:
+            conn.send_bytes(command)
+        self._waiting = True
+
+    def _wait(self):
+        """Wait for all workers.
+
+        Raises:
+            RuntimeError: a worker failed to run command
+        """
+        errors = [conn.recv_bytes() for conn in self._conns]
+        self._waiting = False
+        errors = [error.decode() for error in errors if error]
+        if errors:
+            raise RuntimeError("Workers failed: %s" % "; ".join(errors))
+
+    def reset(self):
+        """Reset all games, return (observations, masks)."""
+        self._send(RESET)
+        self._wait()
+        return self.arrays['observations'], self.arrays['masks']
+
+    def step_async(self, actions):
+        """Start playing action codes (one per game), see step_wait."""
+        self.arrays['actions'][:] = actions
+        self._send(STEP)
+
+    def step_wait(self):
+        """Wait for step, return (observations, rewards, dones, masks)."""
+        self._wait()
+        arrays = self.arrays
+        return (
+            arrays['observations'], arrays['rewards'], arrays['dones'],
+            arrays['masks'],
+        )
+
+    def step(self, actions):
+        """Play action codes (one per game).
+
+        Returns:
+            (tuple) shared arrays
+                observations    (numpy.ndarray): (n_envs, *obs_shape)
+                rewards         (numpy.ndarray): (n_envs, players_n)
+                dones           (numpy.ndarray): (n_envs,) game was over
+                    (and has been reset)
+                masks           (numpy.ndarray): (n_envs, n_actions) legal
+                    actions
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self):
+        """Stop workers and release shared memory."""
+        if self._waiting:
+            for conn in self._conns:
+                conn.recv_bytes()
+        for conn, process in zip(self._conns, self._processes):
+            conn.send_bytes(CLOSE)
+            process.join()
+            conn.close()
+        self._conns = []
+        self._processes = []
+        self.arrays = {}
+        for shm in self.shms.values():
+            shm.close()
+            shm.unlink()
+        self.shms = {}
@@ -5,13 +5,12 @@ This script launch main functionality of the project.
 Its name can be more explicit than main, but is has to be project root to
 access all packages.
 """
-import olgaming
-from olutils.params import add_dft_args
+from olgaming import registry
 
 
 def main(game_name, load_path, g_kwargs, g_params, p_params):
     """Launch game."""
-    game_cls = getattr(olgaming.games, game_name)
+    game_cls = registry.get_game(game_name)
     kwargs = g_kwargs
     kwargs.update(g_params)
     kwargs['p_params'] = p_params
@@ -22,13 +21,19 @@ def main(game_name, load_path, g_kwargs, g_params, p_params):
 
 
 if __name__ == "__main__":
+    import sys
     from argparse import ArgumentParser
 
-    av_games = [
-        game.__name__
-        for game in olgaming.GameObject.__inheritors__[olgaming.Game]
-    ]
-    av_games.sort()
+    # Listing games does not require to import them
+    list_parser = ArgumentParser(add_help=False)
+    list_parser.add_argument('--list', action='store_true')
+    if list_parser.parse_known_args()[0].list:
+        print("\n".join(registry.game_names()))
+        sys.exit()
+
+    from olutils.params import add_dft_args
+    from olgaming.game import Game
+    from olgaming.player import Player
 
     # Game settings
     parser = ArgumentParser(
@@ -36,7 +41,11 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         'game', type=str,
-        help="game to play (%s)" % " or ".join(av_games)
+        help="game to play (see --list)"
+    )
+    parser.add_argument(
+        '--list', action='store_true',
+        help="list available games and exit",
     )
     parser.add_argument(
         '-b', '--bots', type=int,
@@ -51,7 +60,7 @@ if __name__ == "__main__":
     )
 
     # Object parameters (for logs and all)
-    game_dft_params = olgaming.Game.dft_params()
+    game_dft_params = Game.dft_params()
     add_dft_args(
         parser=parser,
         dft_args=game_dft_params,
@@ -59,7 +68,7 @@ if __name__ == "__main__":
         help_prefix="game parameter ",
     )
 
-    player_dft_params = olgaming.Player.dft_params()
+    player_dft_params = Player.dft_params()
     del player_dft_params['identity']
     del player_dft_params['name']
     add_dft_args(